@@ -0,0 +1,139 @@
+import csv
+import logging
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Optional
+
+log = logging.getLogger(__name__)
+
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS applications (
+    job_id TEXT PRIMARY KEY,
+    timestamp TEXT NOT NULL,
+    job TEXT,
+    company TEXT,
+    attempted INTEGER,
+    result INTEGER,
+    resume TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_applications_timestamp ON applications (timestamp);
+CREATE INDEX IF NOT EXISTS idx_applications_company ON applications (company);
+CREATE TABLE IF NOT EXISTS imports (
+    source TEXT PRIMARY KEY,
+    rows INTEGER,
+    imported_at TEXT
+);
+"""
+
+
+def _as_bool(value) -> int:
+    return 1 if str(value).strip().lower() in ("true", "1", "yes") else 0
+
+
+class ApplicationLedger:
+    def __init__(self, path: str = "applications.db"):
+        """
+        SQLite ledger of every job the bot has processed, keyed by job id.
+
+        The database runs in WAL mode so pool workers in other processes can
+        write to it while lookups keep going.
+
+        Args:
+            path: Location of the SQLite database file
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self.connection = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(_SCHEMA)
+        self.connection.commit()
+
+    def record(self, timestamp: str, job_id, job: Optional[str], company: Optional[str],
+               attempted: bool, result: bool, resume: Optional[str] = None) -> None:
+        """Insert a job, replacing any earlier attempt at the same job id."""
+        with self._lock:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO applications VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (str(job_id), timestamp, job, company, int(bool(attempted)), int(bool(result)), resume))
+            self.connection.commit()
+
+    def has_applied(self, job_id, since: Optional[datetime] = None) -> bool:
+        """
+        Check whether a job id is in the ledger.
+
+        Args:
+            job_id: LinkedIn job id
+            since: Only count entries recorded after this time
+
+        Returns:
+            True if the job has been processed (after `since`, when given)
+        """
+        with self._lock:
+            row = self.connection.execute(
+                "SELECT timestamp FROM applications WHERE job_id = ?", (str(job_id),)).fetchone()
+        if row is None:
+            return False
+        return since is None or row[0] > since.strftime(TIMESTAMP_FORMAT)
+
+    def resume_path(self, job_id) -> Optional[str]:
+        """Resume recorded for a job id, None if the job is unknown."""
+        with self._lock:
+            row = self.connection.execute(
+                "SELECT resume FROM applications WHERE job_id = ?", (str(job_id),)).fetchone()
+        return row[0] if row else None
+
+    def count(self) -> int:
+        with self._lock:
+            return self.connection.execute("SELECT COUNT(*) FROM applications").fetchone()[0]
+
+    def import_csv(self, filename: str) -> int:
+        """
+        Import an output CSV written by earlier versions of the bot.
+
+        Each file is imported only once; rows with 6 columns (no resume path)
+        and 7 columns are both accepted.
+
+        Returns:
+            Number of rows imported, 0 if the file was already imported or is missing
+        """
+        source = os.path.abspath(filename)
+        if not os.path.isfile(source):
+            return 0
+        with self._lock:
+            if self.connection.execute("SELECT 1 FROM imports WHERE source = ?", (source,)).fetchone():
+                return 0
+
+        rows = []
+        with open(source, newline='', encoding='utf-8', errors='replace') as f:
+            for row in csv.reader(f):
+                if len(row) < 6 or not row[1].strip():
+                    continue
+                try:
+                    datetime.strptime(row[0], TIMESTAMP_FORMAT)
+                except ValueError:
+                    continue
+                resume = row[6] if len(row) > 6 else None
+                rows.append((row[1].strip(), row[0], row[2], row[3], _as_bool(row[4]), _as_bool(row[5]), resume))
+
+        with self._lock:
+            # keep the most recent attempt for each job id, as record() does
+            self.connection.executemany(
+                "INSERT INTO applications VALUES (?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(job_id) DO UPDATE SET timestamp = excluded.timestamp, job = excluded.job, "
+                "company = excluded.company, attempted = excluded.attempted, result = excluded.result, "
+                "resume = excluded.resume WHERE excluded.timestamp >= applications.timestamp",
+                rows)
+            self.connection.execute("INSERT INTO imports VALUES (?, ?, ?)",
+                                    (source, len(rows), datetime.now().strftime(TIMESTAMP_FORMAT)))
+            self.connection.commit()
+        log.info(f"Imported {len(rows)} rows from {filename} into {self.path}")
+        return len(rows)
+
+    def close(self) -> None:
+        with self._lock:
+            self.connection.close()
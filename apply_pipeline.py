@@ -0,0 +1,154 @@
+import logging
+import queue
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+log = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class _StageStats:
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.errors = 0
+        self._lock = threading.Lock()
+
+    def add(self, seconds: float, error: bool = False) -> None:
+        with self._lock:
+            self.count += 1
+            self.total += seconds
+            self.max = max(self.max, seconds)
+            if error:
+                self.errors += 1
+
+    def as_dict(self) -> Dict:
+        with self._lock:
+            return {"count": self.count,
+                    "total": round(self.total, 3),
+                    "avg": round(self.total / self.count, 3) if self.count else 0.0,
+                    "max": round(self.max, 3),
+                    "errors": self.errors}
+
+
+class _BoundedQueue(queue.Queue):
+    def __init__(self, maxsize: int):
+        super().__init__(maxsize)
+        self.max_depth = 0
+
+    def _put(self, item):
+        super()._put(item)
+        self.max_depth = max(self.max_depth, len(self.queue))
+
+
+class ApplyPipeline:
+    def __init__(self,
+                 generate: Callable[[Dict], Optional[str]],
+                 record: Callable[[Dict, Optional[str]], None],
+                 resume_workers: int = 2,
+                 queue_size: int = 4):
+        """
+        Run resume generation and recording behind the browser.
+
+        The browser thread collects job details and submits them; resume
+        generation runs on a pool of worker threads and a single recorder
+        thread writes the results. Queues between stages are bounded, so
+        submit() blocks when generation falls behind instead of piling up
+        scraped jobs in memory.
+
+        Args:
+            generate: Called with a job record, returns a resume path or None
+            record: Called with a job record and its resume path
+            resume_workers: Number of resume generation threads
+            queue_size: Capacity of each queue between stages
+        """
+        self.generate = generate
+        self.record = record
+        self.resume_workers = max(1, resume_workers)
+        self.resume_queue = _BoundedQueue(queue_size)
+        self.record_queue = _BoundedQueue(queue_size)
+        self.stages = {"browser": _StageStats(),
+                       "resume": _StageStats(),
+                       "record": _StageStats(),
+                       "backpressure": _StageStats()}
+        self._threads: List[threading.Thread] = []
+        self._started = False
+
+    def start(self) -> None:
+        if self._started:
+            return
+        for i in range(self.resume_workers):
+            thread = threading.Thread(target=self._resume_worker, name=f"resume-worker-{i + 1}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        self._recorder = threading.Thread(target=self._record_worker, name="recorder", daemon=True)
+        self._recorder.start()
+        self._started = True
+
+    def submit(self, job: Dict, browser_seconds: float = 0.0) -> None:
+        """
+        Hand a collected job to the resume stage, blocking while the queue is full.
+
+        Args:
+            job: Job record collected by the browser
+            browser_seconds: Time the browser spent collecting it
+        """
+        self.start()
+        self.stages["browser"].add(browser_seconds)
+        start = time.perf_counter()
+        self.resume_queue.put(job)
+        self.stages["backpressure"].add(time.perf_counter() - start)
+
+    def close(self) -> Dict:
+        """Drain both queues, stop the worker threads and return the final stats."""
+        if self._started:
+            for _ in self._threads:
+                self.resume_queue.put(_STOP)
+            for thread in self._threads:
+                thread.join()
+            self.record_queue.put(_STOP)
+            self._recorder.join()
+            self._threads = []
+            self._started = False
+        stats = self.stats()
+        log.info(f"Pipeline stats: {stats}")
+        return stats
+
+    def stats(self) -> Dict:
+        return {"stages": {name: stage.as_dict() for name, stage in self.stages.items()},
+                "queues": {name: {"depth": q.qsize(), "max_depth": q.max_depth, "capacity": q.maxsize}
+                           for name, q in (("resume", self.resume_queue), ("record", self.record_queue))}}
+
+    def _resume_worker(self) -> None:
+        while True:
+            job = self.resume_queue.get()
+            if job is _STOP:
+                break
+            start = time.perf_counter()
+            resume_path, error = None, False
+            try:
+                resume_path = self.generate(job)
+            except Exception as e:
+                error = True
+                log.error(f"Resume stage failed for {job.get('jobID')}: {e}")
+            self.stages["resume"].add(time.perf_counter() - start, error)
+            self.record_queue.put((job, resume_path))
+            log.debug(f"Queue depth resume={self.resume_queue.qsize()} record={self.record_queue.qsize()}")
+
+    def _record_worker(self) -> None:
+        while True:
+            item = self.record_queue.get()
+            if item is _STOP:
+                break
+            job, resume_path = item
+            start = time.perf_counter()
+            error = False
+            try:
+                self.record(job, resume_path)
+            except Exception as e:
+                error = True
+                log.error(f"Record stage failed for {job.get('jobID')}: {e}")
+            self.stages["record"].add(time.perf_counter() - start, error)
@@ -0,0 +1,103 @@
+import logging
+import re
+import threading
+import unicodedata
+from typing import Dict, Iterable, Optional, Pattern
+
+log = logging.getLogger(__name__)
+
+
+def fold(text: str) -> str:
+    """Lowercase `text` and strip its accents so "Compañía" and "compania" compare equal."""
+    text = str(text)
+    if not text.isascii():
+        text = "".join(c for c in unicodedata.normalize("NFKD", text) if not unicodedata.combining(c))
+    return text.casefold()
+
+
+def _compile(patterns: Iterable) -> Optional[Pattern]:
+    """
+    Combine every pattern into one regex matching any of them as whole words.
+
+    "*" in a pattern matches any run of characters, everything else is literal.
+    Patterns made only of "*" would match every job and are ignored.
+    """
+    alternatives = set()
+    for pattern in patterns or []:
+        if pattern is None or not str(pattern).strip():
+            continue
+        words = fold(pattern).strip().split("*")
+        if not any(word.strip() for word in words):
+            log.warning(f"Ignoring blacklist pattern {pattern!r}, it would match every job")
+            continue
+        alternatives.add(r"[^\n]*?".join(re.escape(word) for word in words))
+    if not alternatives:
+        return None
+    # longest first so the reported pattern is the most specific one
+    ordered = sorted(alternatives, key=len, reverse=True)
+    return re.compile(r"(?<!\w)(?:" + "|".join(ordered) + r")(?!\w)")
+
+
+class BlacklistMatcher:
+    def __init__(self, companies: Iterable = (), titles: Iterable = ()):
+        """
+        Case- and accent-insensitive matcher for blacklisted companies and job titles.
+
+        Each list is compiled into a single regex, so a card is checked with one
+        search per field however long the lists are. Patterns match whole words
+        anywhere in the field ("Meta" matches "Meta Platforms" but not
+        "Metadata"), and "*" matches any text. A pattern of only "*" is
+        ignored rather than blocking every job.
+
+        Args:
+            companies: Company name patterns
+            titles: Job title patterns
+        """
+        self.company_pattern = _compile(companies)
+        self.title_pattern = _compile(titles)
+        self.checked = 0
+        self.companies_blocked = 0
+        self.titles_blocked = 0
+        self._lock = threading.Lock()
+
+    def __bool__(self) -> bool:
+        return self.company_pattern is not None or self.title_pattern is not None
+
+    def match(self, company: Optional[str], title: Optional[str]) -> Optional[str]:
+        """
+        Check a job's company and title.
+
+        Returns:
+            A description of the first match, e.g. "company: acme", or None if the job is allowed
+        """
+        reason = None
+        if company and self.company_pattern:
+            found = self.company_pattern.search(fold(company))
+            if found:
+                reason = f"company: {found.group(0)}"
+        if reason is None and title and self.title_pattern:
+            found = self.title_pattern.search(fold(title))
+            if found:
+                reason = f"title: {found.group(0)}"
+        with self._lock:
+            self.checked += 1
+            if reason and reason.startswith("company"):
+                self.companies_blocked += 1
+            elif reason:
+                self.titles_blocked += 1
+        return reason
+
+    def stats(self, seconds_per_page: Optional[float] = None) -> Dict:
+        """
+        Counts of checked and blocked jobs.
+
+        Args:
+            seconds_per_page: Average cost of opening a job page, to estimate the time saved;
+                "unknown" is reported while no job page has been timed yet
+        """
+        blocked = self.companies_blocked + self.titles_blocked
+        return {"checked": self.checked,
+                "companies_blocked": self.companies_blocked,
+                "titles_blocked": self.titles_blocked,
+                "navigations_saved": blocked,
+                "seconds_saved": "unknown" if seconds_per_page is None else round(blocked * seconds_per_page, 1)}
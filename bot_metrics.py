@@ -0,0 +1,154 @@
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Sequence
+
+log = logging.getLogger(__name__)
+
+# Stage latencies range from a few milliseconds (CSV write) to a minute (LLM call)
+DEFAULT_BUCKETS: Sequence[float] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60, 120)
+
+
+class Histogram:
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = list(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+        else:
+            self.counts[-1] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q: float) -> float:
+        """Estimate a quantile by interpolating inside the bucket that contains it."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        lower = 0.0
+        for bound, count in zip(self.buckets + [self.buckets[-1]], self.counts):
+            if count and seen + count >= rank:
+                return lower + (bound - lower) * (rank - seen) / count
+            seen += count
+            lower = bound
+        return self.buckets[-1]
+
+
+class MetricsRegistry:
+    def __init__(self, prefix: str = "easyapply"):
+        """
+        Stage latency histograms and job counters for a run.
+
+        Exported in the Prometheus text format, either to a textfile (for the
+        node_exporter textfile collector) or from a local HTTP endpoint.
+
+        Args:
+            prefix: Prefix for every exported metric name
+        """
+        self.prefix = prefix
+        self.stages: Dict[str, Histogram] = {}
+        self.counters: Dict[str, int] = {}
+        self.started = time.time()
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    def observe(self, stage: str, seconds: float) -> None:
+        with self._lock:
+            self.stages.setdefault(stage, Histogram()).observe(seconds)
+
+    @contextmanager
+    def timer(self, stage: str):
+        """Time the enclosed block as one observation of `stage`, even if it raises."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, time.perf_counter() - start)
+
+    def inc(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def jobs_per_minute(self) -> float:
+        minutes = (time.time() - self.started) / 60
+        return self.counters.get("applied", 0) / minutes if minutes > 0 else 0.0
+
+    def summary(self) -> Dict:
+        with self._lock:
+            stages = {stage: {"count": h.count,
+                              "p50": round(h.quantile(0.5), 3),
+                              "p95": round(h.quantile(0.95), 3),
+                              "total": round(h.sum, 3)}
+                      for stage, h in self.stages.items()}
+            counters = dict(self.counters)
+        return {"stages": stages, "jobs": counters, "jobs_per_minute": round(self.jobs_per_minute(), 2)}
+
+    def render(self) -> str:
+        """Render every metric in the Prometheus text exposition format."""
+        name = f"{self.prefix}_stage_seconds"
+        lines: List[str] = [f"# HELP {name} Time spent per bot stage.", f"# TYPE {name} histogram"]
+        with self._lock:
+            for stage, h in sorted(self.stages.items()):
+                cumulative = 0
+                for bound, count in zip(h.buckets, h.counts):
+                    cumulative += count
+                    lines.append(f'{name}_bucket{{stage="{stage}",le="{bound}"}} {cumulative}')
+                lines.append(f'{name}_bucket{{stage="{stage}",le="+Inf"}} {h.count}')
+                lines.append(f'{name}_sum{{stage="{stage}"}} {h.sum:.6f}')
+                lines.append(f'{name}_count{{stage="{stage}"}} {h.count}')
+            counters = sorted(self.counters.items())
+
+        name = f"{self.prefix}_jobs_total"
+        lines += [f"# HELP {name} Jobs by outcome.", f"# TYPE {name} counter"]
+        lines += [f'{name}{{status="{status}"}} {value}' for status, value in counters]
+
+        name = f"{self.prefix}_jobs_per_minute"
+        lines += [f"# HELP {name} Applied jobs per minute since the run started.", f"# TYPE {name} gauge",
+                  f"{name} {self.jobs_per_minute():.4f}"]
+        return "\n".join(lines) + "\n"
+
+    def write_textfile(self, path: str) -> None:
+        """Atomically replace `path` with the current metrics."""
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(self.render())
+        os.replace(tmp_path, path)
+
+    def serve(self, port: int, host: str = "127.0.0.1") -> None:
+        """Serve /metrics on a background thread."""
+        registry = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = registry.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), MetricsHandler)
+        threading.Thread(target=self._server.serve_forever, name="metrics-server", daemon=True).start()
+        log.info(f"Serving metrics on http://{host}:{port}/metrics")
+
+    def stop(self) -> None:
+        if self._server:
+            self._server.shutdown()
+            self._server = None
+
+
+# Shared by the bot and the resume pipeline
+metrics = MetricsRegistry()
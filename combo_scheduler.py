@@ -0,0 +1,98 @@
+import json
+import logging
+import os
+import random
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+log = logging.getLogger(__name__)
+
+Combo = Tuple[str, str]
+
+
+def _key(combo: Combo) -> str:
+    return f"{combo[0]}|{combo[1]}"
+
+
+class ComboScheduler:
+    def __init__(self,
+                 positions: List[str],
+                 locations: List[str],
+                 history_file: str = "combo_history.json",
+                 default_budget: Optional[float] = None,
+                 budgets: Optional[List[Dict]] = None,
+                 smoothing: float = 0.5,
+                 seed: Optional[int] = None):
+        """
+        Decide the order and time budget of each position x location combo.
+
+        Combos are enumerated once, shuffled, and then ordered by the new
+        jobs per minute they produced in past runs so high-yield searches get
+        browser time first. Combos without history are ranked at the average
+        yield, which keeps them interleaved with known ones.
+
+        Args:
+            positions: Positions to search for
+            locations: Locations to search in
+            history_file: JSON file holding the yield of past runs
+            default_budget: Seconds given to combos without an explicit budget
+            budgets: Per-combo budgets as dicts with position, location and minutes
+            smoothing: Weight of the latest run in the moving average of the yield
+            seed: Seed for the shuffle, for reproducible orders
+        """
+        self.combos: List[Combo] = [(p, l) for p in dict.fromkeys(positions) for l in dict.fromkeys(locations)]
+        self.history_file = history_file
+        self.default_budget = default_budget
+        self.smoothing = smoothing
+        self.random = random.Random(seed)
+        self.budgets: Dict[str, float] = {}
+        for budget in budgets or []:
+            self.budgets[_key((budget["position"], budget["location"]))] = float(budget["minutes"]) * 60
+        self.history: Dict[str, Dict] = self._load_history()
+
+    def _load_history(self) -> Dict[str, Dict]:
+        if not os.path.isfile(self.history_file):
+            return {}
+        try:
+            with open(self.history_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            log.warning(f"Could not read combo history {self.history_file}: {e}")
+            return {}
+
+    def _save_history(self) -> None:
+        with open(self.history_file, 'w', encoding='utf-8') as f:
+            json.dump(self.history, f, indent=2)
+
+    def expected_yield(self, combo: Combo) -> Optional[float]:
+        """Historical new jobs per minute for a combo, None if it never ran."""
+        entry = self.history.get(_key(combo))
+        return entry["jobs_per_minute"] if entry else None
+
+    def order(self) -> List[Combo]:
+        combos = list(self.combos)
+        self.random.shuffle(combos)
+        known = [y for y in map(self.expected_yield, combos) if y is not None]
+        prior = sum(known) / len(known) if known else 0.0
+        # sort is stable, so the shuffle breaks ties
+        combos.sort(key=lambda combo: -(self.expected_yield(combo) if self.expected_yield(combo) is not None else prior))
+        return combos
+
+    def budget(self, combo: Combo) -> Optional[float]:
+        """Seconds of search time for a combo, None to use the bot's default."""
+        return self.budgets.get(_key(combo), self.default_budget)
+
+    def record(self, combo: Combo, new_jobs: int, seconds: float) -> None:
+        """Fold the outcome of a combo into its historical yield and persist it."""
+        rate = new_jobs / (seconds / 60) if seconds > 0 else 0.0
+        entry = self.history.get(_key(combo))
+        if entry:
+            rate = self.smoothing * rate + (1 - self.smoothing) * entry["jobs_per_minute"]
+        self.history[_key(combo)] = {"jobs_per_minute": round(rate, 4),
+                                     "runs": (entry["runs"] if entry else 0) + 1,
+                                     "last_run": datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+        try:
+            self._save_history()
+        except Exception as e:
+            log.warning(f"Could not save combo history {self.history_file}: {e}")
+        log.info(f"{combo[0]}: {combo[1]} produced {new_jobs} new jobs in {seconds / 60:.1f} minutes")
@@ -0,0 +1,164 @@
+import hashlib
+import logging
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Dict, List, Optional
+
+from blacklist_matcher import fold
+
+log = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS descriptions (
+    job_id TEXT PRIMARY KEY,
+    content_hash TEXT NOT NULL,
+    description BLOB,
+    job TEXT,
+    company TEXT,
+    location TEXT,
+    posted TEXT,
+    page_title TEXT,
+    attempted INTEGER,
+    fetched_at REAL NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_descriptions_last_used ON descriptions (last_used);
+CREATE INDEX IF NOT EXISTS idx_descriptions_content_hash ON descriptions (content_hash);
+"""
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def content_hash(description: str) -> str:
+    """Hash of a description that ignores whitespace differences."""
+    return hashlib.sha256(_WHITESPACE.sub(" ", description or "").strip().encode("utf-8")).hexdigest()
+
+
+class DescriptionCache:
+    def __init__(self, path: str = "descriptions.db", ttl_days: float = 7, max_entries: int = 20000):
+        """
+        SQLite cache of extracted job pages keyed by job id.
+
+        Descriptions are stored zlib compressed next to the title, company and
+        a whitespace-insensitive content hash, so a job reposted under a new id
+        can be recognised as unchanged. Entries expire after `ttl_days`, and
+        the least recently used ones are evicted once the cache holds more than
+        `max_entries`.
+
+        Args:
+            path: Location of the SQLite database file
+            ttl_days: Days an entry stays valid, 0 keeps entries until evicted
+            max_entries: Maximum number of cached jobs
+        """
+        self.path = path
+        self.ttl = ttl_days * 86400
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self._lock = threading.Lock()
+        self.connection = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(_SCHEMA)
+        self.connection.commit()
+
+    def get(self, job_id) -> Optional[Dict]:
+        """
+        Look up a job and mark it as recently used.
+
+        Returns:
+            The cached job (jobID, description, job, company, location, posted,
+            title, attempted, content_hash), or None if missing or expired
+        """
+        now = time.time()
+        with self._lock:
+            row = self.connection.execute(
+                "SELECT content_hash, description, job, company, location, posted, page_title, attempted, fetched_at "
+                "FROM descriptions WHERE job_id = ?", (str(job_id),)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            if self.ttl and now - row[8] > self.ttl:
+                self.expired += 1
+                self.misses += 1
+                return None
+            self.connection.execute("UPDATE descriptions SET last_used = ? WHERE job_id = ?", (now, str(job_id)))
+            self.connection.commit()
+            self.hits += 1
+        return {"jobID": str(job_id),
+                "description": zlib.decompress(row[1]).decode("utf-8"),
+                "job": row[2],
+                "company": row[3],
+                "location": row[4],
+                "posted": row[5],
+                "title": row[6],
+                "attempted": bool(row[7]),
+                "content_hash": row[0]}
+
+    def __contains__(self, job_id) -> bool:
+        """Whether a valid entry exists, without counting a hit or touching its LRU position."""
+        with self._lock:
+            row = self.connection.execute(
+                "SELECT fetched_at FROM descriptions WHERE job_id = ?", (str(job_id),)).fetchone()
+        return row is not None and not (self.ttl and time.time() - row[0] > self.ttl)
+
+    def put(self, job: Dict) -> str:
+        """
+        Store an extracted job, replacing any earlier entry for its id.
+
+        Returns:
+            The content hash of its description
+        """
+        digest = content_hash(job.get("description", ""))
+        now = time.time()
+        with self._lock:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO descriptions VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (str(job["jobID"]), digest, zlib.compress((job.get("description") or "").encode("utf-8"), 6),
+                 job.get("job"), job.get("company"), job.get("location"), job.get("posted"), job.get("title"),
+                 int(bool(job.get("attempted"))), now, now))
+            self._evict()
+            self.connection.commit()
+        return digest
+
+    def same_content(self, digest: str, exclude_job_id=None, job: Optional[str] = None) -> List[str]:
+        """
+        Job ids whose cached description has the given content hash, e.g. earlier postings of a repost.
+
+        Args:
+            digest: Content hash of the description
+            exclude_job_id: Job id to leave out, usually the one being looked up
+            job: Only return jobs with this title (ignoring case and accents), a company
+                can post one description under several titles
+        """
+        with self._lock:
+            rows = self.connection.execute(
+                "SELECT job_id, job FROM descriptions WHERE content_hash = ? AND job_id != ? ORDER BY fetched_at",
+                (digest, str(exclude_job_id))).fetchall()
+        if job is not None:
+            rows = [row for row in rows if fold(row[1] or "").strip() == fold(job).strip()]
+        return [row[0] for row in rows]
+
+    def _evict(self) -> None:
+        count = self.connection.execute("SELECT COUNT(*) FROM descriptions").fetchone()[0]
+        if count <= self.max_entries:
+            return
+        # evict a tenth more than needed so the next inserts do not have to evict again
+        excess = count - self.max_entries + max(1, self.max_entries // 10)
+        self.connection.execute(
+            "DELETE FROM descriptions WHERE job_id IN "
+            "(SELECT job_id FROM descriptions ORDER BY last_used LIMIT ?)", (excess,))
+        log.debug(f"Evicted {excess} cached descriptions")
+
+    def stats(self) -> Dict:
+        with self._lock:
+            entries = self.connection.execute("SELECT COUNT(*) FROM descriptions").fetchone()[0]
+        return {"entries": entries, "hits": self.hits, "misses": self.misses, "expired": self.expired}
+
+    def close(self) -> None:
+        with self._lock:
+            self.connection.close()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import argparse
 import json
 import csv
 import logging
@@ -7,16 +8,14 @@ import os
 import random
 import re
 import time
+from contextlib import nullcontext
 from datetime import datetime, timedelta
 import getpass
 from pathlib import Path
 
-import pandas as pd
-import pyautogui
 import yaml
-from bs4 import BeautifulSoup
 from selenium import webdriver
-from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
@@ -26,7 +25,28 @@ from selenium.webdriver.support.ui import WebDriverWait
 
 from selenium.webdriver.chrome.service import Service as ChromeService
 import webdriver_manager.chrome as ChromeDriverManager
+from application_ledger import ApplicationLedger
+from blacklist_matcher import BlacklistMatcher
+from bot_metrics import metrics
+from apply_pipeline import ApplyPipeline
+from combo_scheduler import ComboScheduler
+from description_cache import DescriptionCache
+from job_cards import harvest_job_cards
+from job_details import extract_job_details
+from job_fetcher import JobPageFetcher
+from lazy_page import LazyPage, PageStats
+from lean_mode import LeanMode
+from page_capture import PageCapture
+from page_readiness import PageReadiness
+from qa_index import QAIndex
+from relevance_scorer import RelevanceScorer
 from resume_manager import ResumeManager
+from run_profiler import RunProfiler
+from search_paginator import SearchPaginator
+from selector_engine import SelectorEngine
+from seen_jobs import SeenJobs
+from time_budget import BudgetAllocator
+from worker_pool import WorkerPool
 
 ChromeDriverManager = ChromeDriverManager.ChromeDriverManager
 
@@ -54,12 +74,44 @@ class EasyApplyBot:
     setupLogger()
     # MAX_SEARCH_TIME is 10 hours by default, feel free to modify it
     MAX_SEARCH_TIME = 60 * 60
+    # jobs processed within this window are skipped before navigating to them
+    APPLIED_LOOKBACK = timedelta(days=2)
+    # consecutive failed search pages that end a search
+    MAX_PAGE_FAILURES = 3
+    # candidates tried in order after the locator of the same name when it stops matching
+    FALLBACK_LOCATORS = {
+        "search": [(By.CSS_SELECTOR, ".scaffold-layout__list > div"), (By.CSS_SELECTOR, ".jobs-search-results__list")],
+        "links": [(By.CSS_SELECTOR, "li[data-occludable-job-id]")],
+        "easy_apply_button": [(By.CSS_SELECTOR, "button.jobs-apply-button"),
+                              (By.CSS_SELECTOR, ".jobs-apply-button--top-card button")],
+        # job description page
+        "description_show_more": [
+            (By.XPATH, "/html/body/div[5]/div[3]/div[2]/div/div/main/div[2]/div[1]/div/div[4]/footer/button/span"),
+            (By.CSS_SELECTOR, "button.jobs-description__footer-button"),
+            (By.CSS_SELECTOR, ".jobs-description footer button"),
+            (By.CSS_SELECTOR, "button.show-more-less-html__button--more")],
+        "description": [
+            (By.XPATH, "/html/body/div[5]/div[3]/div[2]/div/div/main/div[2]/div[1]/div/div[4]"),
+            (By.CSS_SELECTOR, ".jobs-description"),
+            (By.ID, "job-details"),
+            (By.CSS_SELECTOR, ".show-more-less-html__markup")],
+        "company": [
+            (By.XPATH, "/html/body/div[5]/div[3]/div[2]/div/div/main/div[2]/div[1]/div/div[1]/div/div/div/div[1]"),
+            (By.CSS_SELECTOR, ".job-details-jobs-unified-top-card__company-name"),
+            (By.CSS_SELECTOR, ".jobs-unified-top-card__company-name"),
+            (By.CSS_SELECTOR, ".topcard__org-name-link")],
+        "job_title": [
+            (By.XPATH, "/html/body/div[5]/div[3]/div[2]/div/div/main/div[2]/div[1]/div/div[1]/div/div/div/div[2]/div/h1"),
+            (By.CSS_SELECTOR, ".job-details-jobs-unified-top-card__job-title h1"),
+            (By.CSS_SELECTOR, ".jobs-unified-top-card__job-title"),
+            (By.CSS_SELECTOR, "h1.top-card-layout__title"),
+            (By.TAG_NAME, "h1")],
+    }
 
     def __init__(self,
                  username,
                  password,
                  phone_number,
-                 # profile_path,
                  salary,
                  rate,
                  uploads={},
@@ -68,8 +120,37 @@ class EasyApplyBot:
                  blackListTitles=[],
                  experience_level=[],
                  generate_custom_resume=True,
-                 scrape_only_mode=True
+                 scrape_only_mode=True,
+                 page_ready_timeout=10,
+                 resume_workers=0,
+                 profile_path='',
+                 lean_mode=False,
+                 http_fetch=False,
+                 http_fetch_concurrency=4,
+                 ledger_path=None,
+                 combo_budgets=[],
+                 run_minutes=0,
+                 metrics_textfile='',
+                 metrics_port=0,
+                 base_url="https://www.linkedin.com",
+                 headless=False,
+                 capture_dir='',
+                 dom_parser='lxml',
+                 selector_timeout=3,
+                 description_cache_path=None,
+                 description_cache_ttl_days=7,
+                 description_cache_max_entries=20000,
+                 relevance_title_threshold=0.0,
+                 relevance_description_threshold=0.0,
+                 relevance_action='skip'
                  ) -> None:
+        startup_start: float = time.time()
+        self.metrics_textfile: str = metrics_textfile
+        # overridden to run against a local stand-in of the site
+        self.base_url: str = base_url.rstrip("/")
+        self.headless: bool = headless
+        if metrics_port:
+            metrics.serve(metrics_port)
 
         log.info("Welcome to Easy Apply Bot")
         dirpath: str = os.getcwd()
@@ -92,10 +173,18 @@ class EasyApplyBot:
         self.uploads = uploads
         self.salary = salary
         self.rate = rate
-        # self.profile_path = profile_path
-        past_ids: list | None = self.get_appliedIDs(filename)
-        self.appliedJobIDs: list = past_ids if past_ids != None else []
+        # persistent Chrome profile, keeps the LinkedIn session and the disk cache between runs
+        self.profile_path: str = os.path.abspath(profile_path or "chrome_profile")
         self.filename: str = filename
+        self.ledger = self.open_ledger(ledger_path or os.path.splitext(filename)[0] + ".db")
+        # extracted job pages, so reruns and overlapping searches do not navigate to them again
+        self.description_cache = None
+        if description_cache_max_entries:
+            self.description_cache = DescriptionCache(
+                description_cache_path or os.path.splitext(filename)[0] + "_descriptions.db",
+                ttl_days=description_cache_ttl_days,
+                max_entries=description_cache_max_entries)
+        self.lean_mode: bool = lean_mode
         self.options = self.browser_options()
         try:
             self.browser = webdriver.Chrome(service=ChromeService(ChromeDriverManager().install()),
@@ -110,13 +199,54 @@ class EasyApplyBot:
                 log.error("No ChromeDriver found. Please check your ChromeDriver installation.")
                 raise e
         self.wait = WebDriverWait(self.browser, 30)
+        self.readiness = PageReadiness(self.browser, deadline=page_ready_timeout)
+        # pages returned by load_page are only transferred and parsed when something reads them
+        self.dom_parser: str = dom_parser
+        self.page_stats = PageStats()
+        self.lean = None
+        if self.lean_mode:
+            self.lean = LeanMode(self.browser)
+            self.lean.enable()
         self.blacklist = blacklist
         self.blackListTitles = blackListTitles
-        self.start_linkedin(username, password)
+        # checked against the card fields before any job page is opened, and against the page fields after
+        self.blacklist_matcher = BlacklistMatcher(companies=blacklist, titles=blackListTitles)
+        # card titles and descriptions scored against resume_data, before pages are opened or resumes generated
+        self.relevance = None
+        self.relevance_action: str = relevance_action
+        if relevance_title_threshold or relevance_description_threshold:
+            self.relevance = RelevanceScorer(title_threshold=relevance_title_threshold,
+                                             description_threshold=relevance_description_threshold)
+        # job ids whose card had no title to score, their title is scored on the job page instead
+        self.untitled = set()
+        with metrics.timer("login"):
+            warm_start: bool = self.start_linkedin(username, password)
+        log.info(f"{'Warm' if warm_start else 'Cold'} start took {time.time() - startup_start:.1f}s")
         self.phone_number = phone_number
         self.experience_level = experience_level
+        self.combo_budgets = combo_budgets
+        self.run_minutes = run_minutes
+        self.allocator = None
         self.generate_custom_resume = generate_custom_resume
         self.scrape_only_mode = scrape_only_mode
+        # job pages are downloaded over HTTP when nothing on them has to be clicked
+        self.job_fetcher = None
+        self.prefetched_jobs = {}
+        if http_fetch and self.scrape_only_mode:
+            self.job_fetcher = JobPageFetcher(base_url=self.base_url, max_workers=http_fetch_concurrency)
+            self.job_fetcher.load_browser_cookies(self.browser)
+        self.jobs_processed = 0
+        # job ids handled anywhere in this run, checked before any page or job is processed
+        self.seen_jobs = SeenJobs()
+        # pages loaded per search and why each search stopped
+        self.pagination_stats = []
+        # set by --profile, profiles each job or the whole run
+        self.profiler = None
+        # pages saved for offline replay, scrubbed of the account details
+        self.capture = PageCapture(capture_dir, redact=[username, phone_number]) if capture_dir else None
+        # set by the worker pool so several bots never process the same job id
+        self.claims = None
+        self.worker_id = 0
         
         # Initialize Resume Manager
         if self.generate_custom_resume:
@@ -137,6 +267,11 @@ class EasyApplyBot:
             self.resume_manager = None
             self.original_resume_path = None
 
+        # Generate resumes on worker threads while the browser keeps collecting jobs
+        self.pipeline = None
+        if self.resume_manager and resume_workers > 0:
+            self.pipeline = ApplyPipeline(self.generate_resume, self.record_job, resume_workers=resume_workers)
+
         self.locator = {
             "next": (By.CSS_SELECTOR, "button[aria-label='Ir al siguiente paso']"),
             "review": (By.CSS_SELECTOR, "button[aria-label='Revisar tu solicitud']"),
@@ -157,36 +292,25 @@ class EasyApplyBot:
 
         }
 
-        # initialize questions and answers file
+        candidates = {name: [locator] for name, locator in self.locator.items()}
+        for name, fallbacks in self.FALLBACK_LOCATORS.items():
+            candidates.setdefault(name, []).extend(fallbacks)
+        self.selectors = SelectorEngine(self.browser, candidates, timeout=selector_timeout)
+
+        # initialize questions and answers file, created if it does not exist
         self.qa_file = Path("qa.csv")
-        self.answers = {}
-
-        # if qa file does not exist, create it
-        if self.qa_file.is_file():
-            df = pd.read_csv(self.qa_file)
-            for index, row in df.iterrows():
-                self.answers[row['Question']] = row['Answer']
-        # if qa file does exist, load it
-        else:
-            df = pd.DataFrame(columns=["Question", "Answer"])
-            df.to_csv(self.qa_file, index=False, encoding='utf-8')
+        # looked up by normalized and fuzzy question text, new answers are appended to the file; the bot
+        # records jobs without filling in the Easy Apply form, so nothing looks answers up yet
+        self.answers = QAIndex(self.qa_file)
+        log.info(f"{len(self.answers)} answers loaded from {self.qa_file}")
 
-    def get_appliedIDs(self, filename) -> list | None:
-        try:
-            df = pd.read_csv(filename,
-                             header=None,
-                             names=['timestamp', 'jobID', 'job', 'company', 'attempted', 'result'],
-                             lineterminator='\n',
-                             encoding='utf-8')
-
-            df['timestamp'] = pd.to_datetime(df['timestamp'], format="%Y-%m-%d %H:%M:%S")
-            df = df[df['timestamp'] > (datetime.now() - timedelta(days=2))]
-            jobIDs: list = list(df.jobID)
-            log.info(f"{len(jobIDs)} jobIDs found")
-            return jobIDs
-        except Exception as e:
-            log.info(str(e) + "   jobIDs could not be loaded from CSV {}".format(filename))
-            return None
+    def open_ledger(self, path) -> ApplicationLedger:
+        start: float = time.time()
+        ledger = ApplicationLedger(path)
+        # one-time import of the CSV history written by earlier versions
+        ledger.import_csv(self.filename)
+        log.info(f"{ledger.count()} jobIDs found in {path} ({time.time() - start:.2f}s)")
+        return ledger
 
     def browser_options(self):
         options = webdriver.ChromeOptions()
@@ -202,12 +326,27 @@ class EasyApplyBot:
         options.add_argument("--disable-blink-features=AutomationControlled")
 
         # Load user profile
-        # options.add_argument(r"--user-data-dir={}".format(self.profile_path))
+        options.add_argument(r"--user-data-dir={}".format(self.profile_path))
+
+        if self.headless:
+            options.add_argument("--headless=new")
+            options.add_argument("--window-size=1920,1080")
+
+        if self.lean_mode:
+            LeanMode.apply_options(options)
         return options
 
-    def start_linkedin(self, username, password) -> None:
+    def start_linkedin(self, username, password) -> bool:
+        # reuse the session stored in the profile (or the saved cookies) before logging in again
+        if self.is_logged_in():
+            log.info("Reusing existing LinkedIn session")
+            return True
+        if self.load_cookies() and self.is_logged_in():
+            log.info("Restored LinkedIn session from saved cookies")
+            return True
+
         log.info("Logging in.....Please wait :)  ")
-        self.browser.get("https://www.linkedin.com/login?trk=guest_homepage-basic_nav-header-signin")
+        self.browser.get(self.base_url + "/login?trk=guest_homepage-basic_nav-header-signin")
         try:
             user_field = self.browser.find_element("id", "username")
             pw_field = self.browser.find_element("id", "password")
@@ -215,11 +354,16 @@ class EasyApplyBot:
                                                      '/html/body/div/main/div[2]/div[1]/form/div[4]/button')
             user_field.send_keys(username)
             user_field.send_keys(Keys.TAB)
-            time.sleep(2)
+            time.sleep(random.uniform(0.3, 0.8))
             pw_field.send_keys(password)
-            time.sleep(2)
+            time.sleep(random.uniform(0.3, 0.8))
             login_button.click()
-            time.sleep(5)
+            self.wait.until(lambda browser: "/login" not in browser.current_url)
+            # a checkpoint (2FA, captcha) has left the login page without authenticating
+            if self.is_auth_wall(self.browser.current_url) or not self.is_logged_in():
+                log.warning(f"Login not completed, stopped at {self.browser.current_url}")
+                return False
+            self.save_cookies()
             log.info("Logged in successfully :)")
             # if self.is_present(self.locator["2fa_oneClick"]):
             #     oneclick_auth = self.browser.find_element(by='id', value='reset-password-submit-button')
@@ -230,6 +374,46 @@ class EasyApplyBot:
             #     time.sleep()
         except TimeoutException:
             log.info("TimeoutException! Username/password field or login button not found")
+        return False
+
+    @staticmethod
+    def is_auth_wall(url: str) -> bool:
+        return any(marker in url for marker in ("/login", "authwall", "checkpoint", "/uas/"))
+
+    def is_logged_in(self) -> bool:
+        # the feed redirects to the login/auth wall when the session is no longer valid
+        self.browser.get(self.base_url + "/feed/")
+        if self.is_auth_wall(self.browser.current_url):
+            return False
+        return self.browser.get_cookie("li_at") is not None
+
+    def save_cookies(self) -> None:
+        # holds the live session token (li_at), so it is only readable by the current user
+        cookie_file = Path(self.profile_path) / "linkedin_cookies.json"
+        try:
+            cookie_file.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(cookie_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(self.browser.get_cookies(), f)
+            os.chmod(cookie_file, 0o600)
+        except Exception as e:
+            log.debug(f"Could not save cookies: {e}")
+
+    def load_cookies(self) -> bool:
+        cookie_file = Path(self.profile_path) / "linkedin_cookies.json"
+        if not cookie_file.is_file():
+            return False
+        try:
+            cookies = json.loads(cookie_file.read_text(encoding='utf-8'))
+            for cookie in cookies:
+                # selenium rejects cookies for other domains than the current page
+                if cookie.get("domain", "").lstrip(".").replace("www.", "") in self.base_url:
+                    cookie.pop("sameSite", None)
+                    self.browser.add_cookie(cookie)
+            return True
+        except Exception as e:
+            log.debug(f"Could not load cookies: {e}")
+            return False
 
     def fill_data(self) -> None:
         self.browser.set_window_size(1, 1)
@@ -241,149 +425,425 @@ class EasyApplyBot:
         self.fill_data()
         self.positions = positions
         self.locations = locations
-        combos: list = []
-        while len(combos) < len(positions) * len(locations):
-            position = positions[random.randint(0, len(positions) - 1)]
-            location = locations[random.randint(0, len(locations) - 1)]
-            combo: tuple = (position, location)
-            if combo not in combos:
-                combos.append(combo)
-                log.info(f"Applying to {position}: {location}")
-                location = "&location=" + location
-                self.applications_loop(position, location)
-            if len(combos) > 500:
+        scheduler = ComboScheduler(positions, locations,
+                                   history_file=os.path.splitext(self.filename)[0] + "_combos.json",
+                                   budgets=self.combo_budgets)
+        combos = scheduler.order()
+        if self.run_minutes:
+            # share one run deadline between the searches instead of a flat MAX_SEARCH_TIME each
+            self.allocator = BudgetAllocator(self.run_minutes * 60,
+                                             {combo: scheduler.expected_yield(combo) for combo in combos})
+        for combo in combos:
+            if self.allocator and self.allocator.expired():
                 break
+            combo_start: float = time.time()
+            time_budget = scheduler.budget(combo)
+            if self.allocator:
+                time_budget = self.allocator.begin(combo, cap=time_budget)
+            try:
+                new_jobs: int = self.run_combo(*combo, time_budget=time_budget)
+            except Exception:
+                # one broken search must not end the run
+                log.exception(f"Search for {combo[0]}: {combo[1]} failed")
+                new_jobs = 0
+            if self.allocator:
+                self.allocator.end()
+            scheduler.record(combo, new_jobs, time.time() - combo_start)
+        self.stop_pipeline()
+        if self.allocator:
+            self.allocator.report()
+        log.info(f"Finished {len(combos)} searches in {(time.time() - start) / 60:.1f} minutes")
+
+    def run_combo(self, position, location, time_budget=None) -> int:
+        log.info(f"Applying to {position}: {location}")
+        before: int = self.jobs_processed
+        location = "&location=" + location
+        self.applications_loop(position, location, time_budget=time_budget)
+        log.info(f"Seen jobs: {self.seen_jobs.stats()}")
+        if self.capture:
+            log.info(f"Captured pages: {self.capture.stats()}")
+        log.info(f"Page sources: {self.page_stats.summary()}")
+        log.info(f"Selectors: {self.selectors.stats()}")
+        if self.description_cache:
+            log.info(f"Description cache: {self.description_cache.stats()}")
+        if self.blacklist_matcher:
+            page_load = metrics.summary()["stages"].get("job_page_load", {})
+            seconds_per_page = page_load["total"] / page_load["count"] if page_load.get("count") else None
+            log.info(f"Blacklist: {self.blacklist_matcher.stats(seconds_per_page)}")
+        if self.relevance:
+            log.info(f"Relevance: {self.relevance.stats()}")
+        self.export_metrics()
+        return self.jobs_processed - before
 
     # self.finish_apply() --> this does seem to cause more harm than good, since it closes the browser which we usually don't want, other conditions will stop the loop and just break out
 
-    def applications_loop(self, position, location):
+    def applications_loop(self, position, location, time_budget=None):
 
-        count_application = 0
-        count_job = 0
-        jobs_per_page = 0
         start_time: float = time.time()
+        search_time: float = time_budget or self.MAX_SEARCH_TIME
+        paginator = SearchPaginator()
 
         log.info("Looking for jobs.. Please wait..")
 
         self.browser.set_window_position(1, 1)
         self.browser.maximize_window()
-        self.browser, _ = self.next_jobs_page(position, location, jobs_per_page, experience_level=self.experience_level)
+        self.browser, _ = self.next_jobs_page(position, location, paginator.offset, experience_level=self.experience_level)
         log.info("Looking for jobs.. Please wait..")
 
-        while time.time() - start_time < self.MAX_SEARCH_TIME:
+        jobIDs = {}  # {Job id: processed_status}
+        # job ids of a page that failed after they were marked seen, processed again when it is reloaded
+        retry = set()
+        retried_offset = None
+        failures = 0
+
+        # with a run-wide allocator the search ends when it says so, it may extend past search_time
+        while self.allocator or time.time() - start_time < search_time:
             try:
-                log.info(f"{(self.MAX_SEARCH_TIME - (time.time() - start_time)) // 60} minutes left in this search")
+                if self.allocator:
+                    log.info(f"{self.allocator.remaining() // 60} minutes left in this run")
+                else:
+                    log.info(f"{(search_time - (time.time() - start_time)) // 60} minutes left in this search")
 
                 # sleep to make sure everything loads, add random to make us look human.
                 randoTime: float = random.uniform(1.5, 2.9)
                 log.debug(f"Sleeping for {round(randoTime, 1)}")
                 # time.sleep(randoTime)
-                self.load_page(sleep=0.5)
 
                 # LinkedIn displays the search results in a scrollable <div> on the left side, we have to scroll to its bottom
 
                 # scroll to bottom
 
-                if self.is_present(self.locator["search"]):
-                    scrollresults = self.get_elements("search")
+                if self.selectors.is_present("search", page_type="search"):
+                    scrollresults = self.get_elements("search", page_type="search")
                     #     self.browser.find_element(By.CLASS_NAME,
                     #     "jobs-search-results-list"
                     # )
                     # Selenium only detects visible elements; if we scroll to the bottom too fast, only 8-9 results will be loaded into IDs list
-                    for i in range(300, 3000, 100):
-                        self.browser.execute_script("arguments[0].scrollTo(0, {})".format(i), scrollresults[0])
-                    scrollresults = self.get_elements("search")
+                    with metrics.timer("card_scroll"):
+                        for i in range(300, 3000, 100):
+                            self.browser.execute_script("arguments[0].scrollTo(0, {})".format(i), scrollresults[0])
+                        # the list is virtualized, let the cards scrolled past render before they are read
+                        self.readiness.wait(self.selectors.locators("links", page_type="search"))
+                    scrollresults = self.get_elements("search", page_type="search")
                     # time.sleep(1)
 
-                # get job links, (the following are actually the job card objects)
-                if self.is_present(self.locator["links"]):
-                    links = self.get_elements("links")
-                    # links = self.browser.find_elements("xpath",
-                    #     '//div[@data-job-id]'
-                    # )
-
-                    jobIDs = {}  # {Job id: processed_status}
-
-                    # children selector is the container of the job cards on the left
-                    for link in links:
-                        if 'Applied' not in link.text:  # checking if applied already
-                            if link.text not in self.blacklist:  # checking if blacklisted
-                                jobID = link.get_attribute("data-job-id")
-                                if jobID == "search":
-                                    log.debug("Job ID not found, search keyword found instead? {}".format(link.text))
-                                    continue
-                                else:
-                                    jobIDs[jobID] = "To be processed"
-                    if len(jobIDs) > 0:
-                        self.apply_loop(jobIDs)
-                    self.browser, jobs_per_page = self.next_jobs_page(position,
-                                                                      location,
-                                                                      jobs_per_page,
-                                                                      experience_level=self.experience_level)
-                else:
-                    self.browser, jobs_per_page = self.next_jobs_page(position,
-                                                                      location,
-                                                                      jobs_per_page,
-                                                                      experience_level=self.experience_level)
-
-
-            except Exception as e:
-                print(e)
+                if self.capture:
+                    self.capture.save("search", self.browser.current_url, self.browser.page_source)
+
+                # get job cards, all fields are read in a single script call
+                with metrics.timer("card_harvest"):
+                    cards = harvest_job_cards(self.browser) if self.selectors.is_present("links", page_type="search") else []
+
+                jobIDs = {}  # {Job id: processed_status}
+                titles = {}
+                unseen = 0
+
+                for card in cards:
+                    jobID = card["job_id"]
+                    if not jobID or jobID == "search":
+                        log.debug("Job ID not found, search keyword found instead? {}".format(card["text"]))
+                        continue
+                    retried = jobID in retry
+                    if not retried and self.seen_jobs.check_and_add(jobID):  # already handled earlier in this run
+                        continue
+                    unseen += 1
+                    if not retried:
+                        metrics.inc("seen")
+                    if card["applied"]:  # checking if applied already
+                        log.debug(f"{jobID} has an applied badge, skipping")
+                        metrics.inc("skipped")
+                        continue
+                    blacklisted = self.blacklist_matcher.match(card["company"], card["title"])
+                    if blacklisted:  # checking if blacklisted
+                        log.debug(f"{jobID} blacklisted ({blacklisted}), skipping")
+                        metrics.inc("skipped")
+                        continue
+                    if self.ledger.has_applied(jobID, since=datetime.now() - self.APPLIED_LOOKBACK):
+                        log.debug(f"{jobID} already processed, skipping")
+                        metrics.inc("skipped")
+                        continue
+                    jobIDs[jobID] = "To be processed"
+                    titles[jobID] = card["title"]
+                retry = set()
+                if self.relevance and self.relevance.title_threshold:
+                    jobIDs = self.rank_by_relevance(jobIDs, titles)
+                if len(jobIDs) > 0:
+                    self.apply_loop(jobIDs)
+
+                if not paginator.advance(len(cards), unseen):
+                    break
+                if self.allocator and not self.allocator.keep_going(len(jobIDs)):
+                    break
+                failures = 0
+                self.browser, _ = self.next_jobs_page(position,
+                                                      location,
+                                                      paginator.offset,
+                                                      experience_level=self.experience_level)
+
+            except Exception:
+                log.exception(f"Search page at offset {paginator.offset} failed")
+                failures += 1
+                if failures >= self.MAX_PAGE_FAILURES:
+                    log.error(f"{failures} failures in a row, ending the search for {position}")
+                    paginator.stop_reason = "page errors"
+                    break
+                if self.allocator and not self.allocator.keep_going(0):
+                    break
+                # start over from the current offset, the browser may be stuck on a job page; the cards
+                # of this page are already marked seen, so the ones not processed yet are let through again
+                # (once, a page failing again ends the search with "no unseen job ids")
+                if retried_offset != paginator.offset:
+                    retry = {jobID for jobID, status in jobIDs.items() if status == "To be processed"}
+                    retried_offset = paginator.offset
+                try:
+                    self.browser, _ = self.next_jobs_page(position,
+                                                          location,
+                                                          paginator.offset,
+                                                          experience_level=self.experience_level)
+                except Exception:
+                    # the next round works on whatever page is loaded and counts as another failure if it cannot
+                    log.exception(f"Could not reload the search page at offset {paginator.offset}")
+
+        self.pagination_stats.append(dict(paginator.stats(), position=position, location=location))
+        log.info(f"Pagination: {self.pagination_stats[-1]}")
+
+    def rank_by_relevance(self, jobIDs, titles) -> dict:
+        """
+        Score a page of card titles in one batch.
+
+        Jobs below the title threshold are dropped ("skip") or moved behind the
+        others of the page ("deprioritize"). Deprioritized jobs are still all
+        opened, since a page is processed whole before the search time is checked.
+        """
+        # cards harvested while still occluded have no title to judge them by
+        ids = [jobID for jobID in jobIDs if titles.get(jobID)]
+        with metrics.timer("relevance_scoring"):
+            scores = dict(zip(ids, self.relevance.score_titles([titles[jobID] for jobID in ids])))
+        ranked, low = {}, []
+        for jobID in jobIDs:
+            score = scores.get(jobID)
+            if score is None:
+                self.untitled.add(jobID)
+            if score is None or score >= self.relevance.title_threshold:
+                ranked[jobID] = jobIDs[jobID]
+            elif self.relevance_action == "deprioritize":
+                low.append((score, jobID))
+            else:
+                log.debug(f"{jobID} title relevance {score:.3f}, skipping")
+                metrics.inc("skipped")
+        for score, jobID in sorted(low, key=lambda item: -item[0]):
+            ranked[jobID] = jobIDs[jobID]
+        return ranked
 
     def apply_loop(self, jobIDs):
         log.info("Starting apply loop")
+        if self.job_fetcher:
+            # claimed here already, so no other worker downloads the same pages
+            pending = [jobID for jobID in jobIDs if jobIDs[jobID] == "To be processed"
+                       and not (self.description_cache and jobID in self.description_cache)
+                       and (self.claims is None or self.claims.setdefault(jobID, self.worker_id) == self.worker_id)]
+            self.prefetched_jobs = self.job_fetcher.fetch_many(pending)
+            log.debug(f"HTTP fetch stats: {self.job_fetcher.stats()}")
+            if self.relevance and self.relevance.description_threshold and self.prefetched_jobs:
+                # the whole batch of downloaded descriptions is scored at once, pages that failed are
+                # collected through the browser and scored there
+                with metrics.timer("relevance_scoring"):
+                    self.relevance.score_jobs(self.prefetched_jobs.values())
         for jobID in jobIDs:
             if jobIDs[jobID] == "To be processed":
-                applied = self.apply_to_job(jobID)
-                if applied:
-                    log.info(f"Applied to {jobID}")
-                else:
-                    log.info(f"Failed to apply to {jobID}")
-                jobIDs[jobID] == applied
+                if self.claims is not None and self.claims.setdefault(jobID, self.worker_id) != self.worker_id:
+                    log.debug(f"{jobID} already claimed by another worker")
+                    metrics.inc("skipped")
+                    continue
+                try:
+                    if self.pipeline:
+                        # the browser moves on to the next job while the resume is generated
+                        start = time.perf_counter()
+                        with self.job_profile(jobID):
+                            job = self.collect_job(jobID)
+                        reason = self.screen_job(job)
+                        if reason is None:
+                            self.pipeline.submit(job, time.perf_counter() - start)
+                            applied = "Queued"
+                        else:
+                            applied = self.skip_job(job, reason)
+                    else:
+                        with self.job_profile(jobID):
+                            applied = self.apply_to_job(jobID)
+                except Exception as e:
+                    log.error(f"Failed to process {jobID}: {e}")
+                    metrics.inc("failed")
+                    applied = False
+                self.jobs_processed += 1
+                jobIDs[jobID] = applied
+
+    def job_profile(self, jobID):
+        if self.profiler and self.profiler.mode == "job":
+            return self.profiler.profile(f"job_{jobID}")
+        return nullcontext()
 
     def apply_to_job(self, jobID):
         # #self.avoid_lock() # annoying
 
-        # get job page
-        self.get_job_page(jobID)
-
-        # let page load
-        time.sleep(1)
-
-        job_description,job_name,company_name=self.get_job_description()
-        
-        # Generate custom resume for this job
-        custom_resume_path = None
-        if self.resume_manager:
-            try:
-                log.info(f"Generating custom resume for {job_name} at {company_name}")
-                custom_resume_path = self.resume_manager.create_resume(
-                    job=job_name,
-                    company=company_name,
-                    description=job_description
-                )
-                log.info(f"Custom resume generated: {custom_resume_path}")
-                # Update uploads with the new resume path
-                if "Resume" in self.uploads:
-                    self.uploads["Resume"] = custom_resume_path
-            except Exception as e:
-                log.error(f"Failed to generate custom resume: {e}")
-                log.info("Continuing with original resume")
+        job = self.collect_job(jobID)
+        reason = self.screen_job(job)
+        if reason is not None:
+            return self.skip_job(job, reason)
+        custom_resume_path = self.generate_resume(job)
 
-        # get easy apply button
-        button = self.get_easy_apply_button()
+        # Update uploads with the new resume path
+        if custom_resume_path and "Resume" in self.uploads:
+            self.uploads["Resume"] = custom_resume_path
 
-        if custom_resume_path:
-            result =True
+        result = self.record_job(job, custom_resume_path)
 
-        self.write_to_file(button, jobID, self.browser.title, result, custom_resume_path)
-        
         # Reset to original resume path for next job
         if self.original_resume_path and "Resume" in self.uploads:
             self.uploads["Resume"] = self.original_resume_path
-            
+
+        return result
+
+    def collect_job(self, jobID) -> dict:
+        job = self.prefetched_jobs.pop(jobID, None)
+        if not job and self.description_cache:
+            job = self.description_cache.get(jobID)
+            if job:
+                log.debug(f"{jobID} read from the description cache")
+        if not job:
+            job = self.extract_job(jobID)
+        if self.description_cache and job.get("description"):
+            if "content_hash" not in job:
+                job["content_hash"] = self.description_cache.put(job)
+            # a repost of a description seen before under another id, for the same title
+            earlier = self.description_cache.same_content(job["content_hash"], exclude_job_id=jobID,
+                                                          job=job.get("job") or "")
+            job["duplicate_of"] = earlier[0] if earlier else None
+        return job
+
+    def screen_job(self, job) -> str | None:
+        """
+        Check a collected job against the filters its card was checked against, and its description.
+
+        Cards read before they finished rendering can lack the title or company
+        the filters need, so the blacklist and, for cards without a title, the
+        title threshold are applied again to the fields of the job page.
+
+        Returns:
+            Why the job is skipped, or None if it should be applied to
+        """
+        blacklisted = self.blacklist_matcher.match(job.get("company"), job.get("job")) if self.blacklist_matcher else None
+        if blacklisted:
+            return f"Blacklisted ({blacklisted})"
+        if job["jobID"] in self.untitled:
+            self.untitled.discard(job["jobID"])
+            # a job that is already open is applied to when deprioritized, there is nothing to reorder anymore
+            if job.get("job") and self.relevance_action != "deprioritize":
+                with metrics.timer("relevance_scoring"):
+                    score = float(self.relevance.score_titles([job["job"]])[0])
+                if score < self.relevance.title_threshold:
+                    return f"Low title relevance ({score:.3f})"
+        if not self.is_relevant(job):
+            return f"Low relevance ({job['relevance']:.3f})"
+        return None
+
+    def is_relevant(self, job) -> bool:
+        """Whether a collected job's description scores above the threshold, scoring it if not done yet."""
+        if not (self.relevance and self.relevance.description_threshold):
+            return True
+        if "relevance" not in job:
+            with metrics.timer("relevance_scoring"):
+                job["relevance"] = float(self.relevance.score_descriptions([job.get("description") or ""])[0])
+        # without a description there is nothing to judge the job by
+        return not job.get("description") or job["relevance"] >= self.relevance.description_threshold
+
+    def skip_job(self, job, reason: str) -> bool:
+        """Record a job that did not pass screen_job, without generating a resume for it."""
+        log.info(f"Skipping {job['jobID']}: {reason}")
+        with metrics.timer("csv_write"):
+            self.write_to_file(job["attempted"], job["jobID"], job["title"], False, reason)
+        metrics.inc("skipped")
+        return False
+
+    def extract_job(self, jobID) -> dict:
+        # get job page
+        with metrics.timer("job_page_load"):
+            self.get_job_page(jobID)
+
+        # title, company, description and the apply button come back from one script call
+        with metrics.timer("description_extraction"):
+            details = extract_job_details(self.browser)
+            if not details.get("description"):
+                log.debug("Script extraction found no description, falling back to the selectors")
+                job_description, job_name, company_name = self.get_job_description()
+                details.update(description=job_description,
+                               title=details.get("title") or job_name,
+                               company=details.get("company") or company_name)
+
+        if details.get("apply_button") is not None:
+            attempted = details["easy_apply"]
+        else:
+            # get easy apply button
+            attempted = self.get_easy_apply_button() != False
+
+        return {"jobID": jobID,
+                "description": details["description"],
+                "job": details.get("title") or "",
+                "company": details.get("company") or "",
+                "location": details.get("location"),
+                "posted": details.get("posted"),
+                "attempted": attempted,
+                "title": details.get("page_title") or self.browser.title}
+
+    def generate_resume(self, job) -> str | None:
+        # Generate custom resume for this job
+        if not self.resume_manager:
+            return None
+        if job.get("duplicate_of"):
+            # the description has not changed since it was posted under another id, reuse its resume
+            resume_path = self.ledger.resume_path(job["duplicate_of"])
+            if resume_path and os.path.isfile(resume_path):
+                log.info(f"{job['jobID']} is a repost of {job['duplicate_of']}, reusing {resume_path}")
+                return resume_path
+        try:
+            log.info(f"Generating custom resume for {job['job']} at {job['company']}")
+            custom_resume_path = self.resume_manager.create_resume(
+                job=job["job"],
+                company=job["company"],
+                description=job["description"],
+                job_id=job["jobID"]
+            )
+            log.info(f"Custom resume generated: {custom_resume_path}")
+            return custom_resume_path
+        except Exception as e:
+            log.error(f"Failed to generate custom resume: {e}")
+            log.info("Continuing with original resume")
+            return None
+
+    def record_job(self, job, resume_path) -> bool:
+        result = resume_path is not None
+        with metrics.timer("csv_write"):
+            self.write_to_file(job["attempted"], job["jobID"], job["title"], result, resume_path)
+        if result:
+            log.info(f"Applied to {job['jobID']}")
+            metrics.inc("applied")
+        else:
+            log.info(f"Failed to apply to {job['jobID']}")
+            metrics.inc("failed")
         return result
 
+    def stop_pipeline(self) -> None:
+        if self.pipeline:
+            self.pipeline.close()
+        self.export_metrics()
+
+    def export_metrics(self) -> None:
+        if self.metrics_textfile:
+            try:
+                metrics.write_textfile(self.metrics_textfile)
+            except Exception as e:
+                log.warning(f"Could not write metrics to {self.metrics_textfile}: {e}")
+        log.info(f"Metrics: {metrics.summary()}")
+
     def write_to_file(self, button, jobID, browserTitle, result, resume_path=None) -> None:
         def re_extract(text, pattern):
             target = re.search(pattern, text)
@@ -400,29 +860,32 @@ class EasyApplyBot:
         resume_info = resume_path if resume_path else "Original Resume"
 
         toWrite: list = [timestamp, jobID, job, company, attempted, result, resume_info]
-        with open(self.filename, 'a+') as f:
+        with open(self.filename, 'a+', newline='', encoding='utf-8') as f:
             writer = csv.writer(f)
             writer.writerow(toWrite)
+        self.ledger.record(timestamp, jobID, job, company, attempted, result, resume_info)
 
     def get_job_page(self, jobID):
         log.info("getting job page")
-        job: str = 'https://www.linkedin.com/jobs/view/' + str(jobID)
+        job: str = self.base_url + '/jobs/view/' + str(jobID)
         self.browser.get(job)
-        self.job_page = self.load_page(sleep=0.5)
+        self.job_page = self.load_page()
+        if self.capture:
+            self.capture.save("job", self.browser.current_url, self.job_page.source, job_id=str(jobID))
 
         return self.job_page
 
     def get_easy_apply_button(self):
         EasyApplyButton = False
         try:
-            buttons = self.get_elements("easy_apply_button")
+            buttons = self.get_elements("easy_apply_button", page_type="job")
             # buttons = self.browser.find_elements("xpath",
             #     '//button[contains(@class, "jobs-apply-button")]'
             # )
             for button in buttons:
                 if ("Easy Apply" in button.text) or ('Solicitud sencilla' in button.text):
                     EasyApplyButton = button
-                    self.wait.until(EC.element_to_be_clickable(EasyApplyButton))
+                    WebDriverWait(self.browser, self.selectors.timeout).until(EC.element_to_be_clickable(EasyApplyButton))
                 else:
                     log.debug("Easy Apply button not found")
 
@@ -432,12 +895,9 @@ class EasyApplyBot:
 
         return EasyApplyButton
 
-    def get_elements(self, type) -> list:
-        elements = []
-        element = self.locator[type]
-        if self.is_present(element):
-            elements = self.browser.find_elements(element[0], element[1])
-        return elements
+    def get_elements(self, type, page_type="any") -> list:
+        # the locator and its fallbacks are checked once, without waiting
+        return self.selectors.find_all(type, page_type=page_type, timeout=0)
 
     def is_present(self, locator):
         return len(self.browser.find_elements(locator[0],
@@ -445,21 +905,24 @@ class EasyApplyBot:
 
 
 
-    def load_page(self, sleep=1):
-        scroll_page = 0
-        while scroll_page < 4000:
-            self.browser.execute_script("window.scrollTo(0," + str(scroll_page) + " );")
-            scroll_page += 500
-            time.sleep(sleep)
+    def load_page(self, locator=None):
+        # scroll once to trigger lazy loading, then wait until the DOM, the network and the
+        # expected elements have settled instead of sleeping a fixed amount of time
+        self.browser.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+        report = self.readiness.wait(locator)
+        self.browser.execute_script("window.scrollTo(0,0);")
+        log.debug(f"Page load wait took {report['elapsed']}s (timed out: {report['timed_out']})")
+        if self.lean:
+            traffic = self.lean.page_report(self.browser.current_url)
+            log.debug(f"{traffic['requests']} requests, {traffic['bytes']} bytes loaded, {traffic['blocked']} "
+                      f"requests blocked (~{traffic['estimated_bytes_saved']} bytes saved, {traffic['estimate']} estimate)")
 
-        if sleep != 1:
-            self.browser.execute_script("window.scrollTo(0,0);")
-            time.sleep(sleep)
-
-        page = BeautifulSoup(self.browser.page_source, "lxml")
-        return page
+        return LazyPage(self.browser, parser=self.dom_parser, stats=self.page_stats)
 
     def avoid_lock(self) -> None:
+        # imported here, pyautogui needs a display which headless runs do not have
+        import pyautogui
+
         x, _ = pyautogui.position()
         pyautogui.moveTo(x + 200, pyautogui.position().y, duration=1.0)
         pyautogui.moveTo(x, pyautogui.position().y, duration=0.5)
@@ -475,34 +938,42 @@ class EasyApplyBot:
         experience_level_param = f"&f_E={experience_level_str}" if experience_level_str else ""
         self.browser.get(
             # URL for jobs page
-            "https://www.linkedin.com/jobs/search/?f_LF=f_AL&keywords=" +
+            self.base_url + "/jobs/search/?f_LF=f_AL&keywords=" +
             position + location + "&start=" + str(jobs_per_page) + experience_level_param)
         # self.avoid_lock()
         log.info("Loading next job page?")
-        self.load_page()
+        with metrics.timer("search_page_load"):
+            self.load_page(self.selectors.locators("links", page_type="search"))
         return (self.browser, jobs_per_page)
 
     # def finish_apply(self) -> None:
     #     self.browser.close()
     def get_job_description(self)->tuple[str,str,str]:
 
-        self.wait.until(
-            EC.element_to_be_clickable(
-                (By.XPATH, "/html/body/div[5]/div[3]/div[2]/div/div/main/div[2]/div[1]/div/div[4]/footer/button/span")
-            )
-        ).click()
+        show_more = self.selectors.find("description_show_more", page_type="job", clickable=True)
+        if show_more:
+            try:
+                show_more.click()
+            except Exception as e:
+                log.debug(f"Could not expand the description: {e}")
 
-        complete_text = self.browser.find_element("xpath",
-                              "/html/body/div[5]/div[3]/div[2]/div/div/main/div[2]/div[1]/div/div[4]").text
+        description = self.selectors.find("description", page_type="job")
+        if description is None:
+            raise NoSuchElementException("Job description not found by any selector")
+        complete_text = description.text
 
+        # the absolute XPath container holds the whole section, the fallbacks only the description
         string_start=complete_text.find("Acerca del empleo")
         string_end=complete_text.find("Ver más")
+        string_start = max(string_start, 0)
+        if string_end <= string_start:
+            string_end = len(complete_text)
 
-        company_name=self.browser.find_element("xpath",
-              "/html/body/div[5]/div[3]/div[2]/div/div/main/div[2]/div[1]/div/div[1]/div/div/div/div[1]").text.split("\n")[0]
+        company = self.selectors.find("company", page_type="job", timeout=0)
+        company_name = company.text.split("\n")[0] if company else ""
 
-        job_name=self.browser.find_element("xpath",
-            "/html/body/div[5]/div[3]/div[2]/div/div/main/div[2]/div[1]/div/div[1]/div/div/div/div[2]/div/h1").text
+        title = self.selectors.find("job_title", page_type="job", timeout=0)
+        job_name = title.text if title else ""
 
 
         return complete_text[string_start:string_end].strip(),job_name,company_name
@@ -511,7 +982,14 @@ class EasyApplyBot:
 
 if __name__ == '__main__':
 
-    with open("config.yaml", 'r') as stream:
+    parser = argparse.ArgumentParser(description="LinkedIn Easy Apply Bot")
+    parser.add_argument("--config", default="config.yaml", help="Path to the config file")
+    parser.add_argument("--profile", nargs="?", const="job", choices=["job", "run"],
+                        help="Profile each job (default) or the whole run")
+    parser.add_argument("--profile-dir", default="profiles", help="Directory for profile output")
+    args = parser.parse_args()
+
+    with open(args.config, 'r') as stream:
         try:
             parameters = yaml.safe_load(stream)
         except yaml.YAMLError as exc:
@@ -542,17 +1020,54 @@ if __name__ == '__main__':
     locations: list = [l for l in parameters['locations'] if l is not None]
     positions: list = [p for p in parameters['positions'] if p is not None]
 
-    bot = EasyApplyBot(parameters['username'],
-                       parameters['password'],
-                       parameters['phone_number'],
-                       parameters['salary'],
-                       parameters['rate'],
-                       uploads=uploads,
-                       filename=output_filename,
-                       blacklist=blacklist,
-                       blackListTitles=blackListTitles,
-                       experience_level=parameters.get('experience_level', []),
-                       generate_custom_resume=parameters.get('generate_custom_resume', True),
-                       scrape_only_mode=True
-                       )
-    bot.start_apply(positions, locations)
+    bot_kwargs = dict(username=parameters['username'],
+                      password=parameters['password'],
+                      phone_number=parameters['phone_number'],
+                      salary=parameters['salary'],
+                      rate=parameters['rate'],
+                      uploads=uploads,
+                      filename=output_filename,
+                      blacklist=blacklist,
+                      blackListTitles=blackListTitles,
+                      experience_level=parameters.get('experience_level', []),
+                      generate_custom_resume=parameters.get('generate_custom_resume', True),
+                      scrape_only_mode=True,
+                      page_ready_timeout=parameters.get('page_ready_timeout', 10),
+                      resume_workers=parameters.get('resume_workers', 0),
+                      profile_path=parameters.get('profile_path') or '',
+                      lean_mode=parameters.get('lean_mode', False),
+                      http_fetch=parameters.get('http_fetch', False),
+                      http_fetch_concurrency=parameters.get('http_fetch_concurrency', 4),
+                      combo_budgets=parameters.get('combo_budgets') or [],
+                      run_minutes=parameters.get('run_minutes', 0),
+                      metrics_textfile=parameters.get('metrics_textfile') or '',
+                      metrics_port=parameters.get('metrics_port', 0),
+                      base_url=parameters.get('base_url') or "https://www.linkedin.com",
+                      headless=parameters.get('headless', False),
+                      capture_dir=parameters.get('capture_dir') or '',
+                      dom_parser=parameters.get('dom_parser') or 'lxml',
+                      selector_timeout=parameters.get('selector_timeout', 3),
+                      description_cache_ttl_days=parameters.get('description_cache_ttl_days', 7),
+                      description_cache_max_entries=parameters.get('description_cache_max_entries', 20000),
+                      relevance_title_threshold=parameters.get('relevance_title_threshold', 0.0),
+                      relevance_description_threshold=parameters.get('relevance_description_threshold', 0.0),
+                      relevance_action=parameters.get('relevance_action') or 'skip'
+                      )
+
+    profiler = RunProfiler(args.profile_dir, mode=args.profile) if args.profile else None
+    if profiler:
+        profiler.start()
+    try:
+        with profiler.profile("run") if profiler and profiler.mode == "run" else nullcontext():
+            workers = parameters.get('workers', 1) or 1
+            if workers > 1:
+                # --profile run only covers the pool itself, --profile job profiles every worker's jobs
+                profile_dir = args.profile_dir if profiler and profiler.mode == "job" else None
+                WorkerPool(bot_kwargs, workers=workers, profile_dir=profile_dir).run(positions, locations)
+            else:
+                bot = EasyApplyBot(**bot_kwargs)
+                bot.profiler = profiler
+                bot.start_apply(positions, locations)
+    finally:
+        if profiler:
+            profiler.finish()
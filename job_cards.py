@@ -0,0 +1,89 @@
+import logging
+from typing import Dict, List
+
+log = logging.getLogger(__name__)
+
+# Reads every job card on the search page in a single round-trip. Each field
+# tries the class names LinkedIn has used for it and falls back to the card's
+# text lines, so a markup change degrades a field instead of breaking the page.
+# Cards are matched by the card <div> and by the list item around it, so the
+# harvest works with either markup; a list item whose card is also matched is
+# skipped, and one that is still occluded (not rendered) yields just its id.
+_HARVEST_JS = """
+var selector = arguments[0];
+var appliedMarkers = arguments[1];
+
+function firstText(root, selectors) {
+    for (var i = 0; i < selectors.length; i++) {
+        var el = root.querySelector(selectors[i]);
+        if (el && el.innerText && el.innerText.trim()) {
+            return el.innerText.trim().split('\\n')[0].trim();
+        }
+    }
+    return null;
+}
+
+var cards = [];
+var seen = {};
+var nodes = document.querySelectorAll(selector);
+for (var i = 0; i < nodes.length; i++) {
+    var node = nodes[i];
+    if (!node.hasAttribute('data-job-id') && node.querySelector('[data-job-id]')) {
+        continue;
+    }
+    var jobId = node.getAttribute('data-job-id') || node.getAttribute('data-occludable-job-id');
+    if (seen[jobId]) {
+        continue;
+    }
+    seen[jobId] = true;
+    var text = (node.innerText || '').trim();
+    var lines = text.split('\\n').map(function (l) { return l.trim(); }).filter(Boolean);
+    var title = firstText(node, ['.job-card-list__title', '.job-card-container__link strong',
+                                 '.artdeco-entity-lockup__title', 'a[href*="/jobs/view/"]']) || lines[0] || null;
+    // the badge element when there is one, otherwise a line reading exactly like a badge,
+    // so a title such as "Applied Scientist" never marks the card
+    var badge = firstText(node, ['.job-card-container__footer-job-state', '.job-card-list__footer-job-state']);
+    var badgeLines = badge ? [badge] : lines.filter(function (l) { return l !== title; });
+    var applied = badgeLines.some(function (l) { return appliedMarkers.indexOf(l) !== -1; });
+    var time = node.querySelector('time');
+    cards.push({
+        job_id: jobId,
+        title: title,
+        company: firstText(node, ['.job-card-container__primary-description', '.job-card-container__company-name',
+                                  '.artdeco-entity-lockup__subtitle']) || lines[1] || null,
+        location: firstText(node, ['.job-card-container__metadata-item', '.artdeco-entity-lockup__caption']) || lines[2] || null,
+        applied: applied,
+        posted: time ? (time.getAttribute('datetime') || time.innerText.trim()) : null,
+        text: text
+    });
+}
+return cards;
+"""
+
+APPLIED_MARKERS = ["Applied", "Solicitado"]
+
+# the card <div> and LinkedIn's virtualized list item, which exists even while the card is not rendered
+CARD_SELECTOR = "div[data-job-id], li[data-occludable-job-id]"
+
+
+def harvest_job_cards(browser, selector: str = CARD_SELECTOR,
+                      applied_markers: List[str] = APPLIED_MARKERS) -> List[Dict]:
+    """
+    Extract every job card on the current search page with one script call.
+
+    Args:
+        browser: Selenium WebDriver instance
+        selector: CSS selector matching the job card containers or their list items
+        applied_markers: Badge texts that mark a card as already applied to
+
+    Returns:
+        List of card records with job_id, title, company, location, applied,
+        posted and the raw card text (only job_id is set for occluded list items)
+    """
+    try:
+        cards = browser.execute_script(_HARVEST_JS, selector, applied_markers) or []
+    except Exception as e:
+        log.warning(f"Job card harvest failed: {e}")
+        return []
+    log.debug(f"Harvested {len(cards)} job cards")
+    return cards
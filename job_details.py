@@ -0,0 +1,144 @@
+import logging
+from typing import Dict, List
+
+log = logging.getLogger(__name__)
+
+# Reads everything the bot needs from a job view page in a single round-trip.
+# Fields try the class names LinkedIn has used for them. The description is
+# found by selector or, failing that, as the element holding the most
+# paragraph and list text, and is read from textContent so it does not have to
+# be expanded with the "see more" button first. A leading heading ("About the
+# job", "Acerca del empleo", ...) is dropped by its markup, not its wording.
+_EXTRACT_JS = """
+var easyApplyLabels = arguments[0];
+var descriptionSelectors = arguments[1];
+
+function clean(text) { return (text || '').replace(/[ \\t\\u00a0]+/g, ' ').trim(); }
+
+function first(selectors) {
+    for (var i = 0; i < selectors.length; i++) {
+        var el = document.querySelector(selectors[i]);
+        if (el && clean(el.textContent)) { return el; }
+    }
+    return null;
+}
+
+function firstLine(el) {
+    if (!el) { return null; }
+    var lines = (el.innerText || el.textContent).split('\\n').map(clean).filter(Boolean);
+    return lines.length ? lines[0] : null;
+}
+
+var BLOCK = /^(P|DIV|LI|UL|OL|H1|H2|H3|H4|H5|H6|BR|SECTION|ARTICLE|TR)$/;
+function blockText(node, out) {
+    if (node.nodeType === 3) { out.push(node.nodeValue); return; }
+    if (node.nodeType !== 1) { return; }
+    var tag = node.tagName;
+    if (tag === 'BUTTON' || tag === 'SCRIPT' || tag === 'STYLE' || tag === 'svg') { return; }
+    if (tag === 'LI') { out.push('\\n- '); }
+    else if (BLOCK.test(tag)) { out.push('\\n'); }
+    for (var c = node.firstChild; c; c = c.nextSibling) { blockText(c, out); }
+    if (BLOCK.test(tag)) { out.push('\\n'); }
+}
+
+function largestTextBlock() {
+    var scores = new Map();
+    var nodes = document.querySelectorAll('main p, main li, article p, article li');
+    for (var i = 0; i < nodes.length; i++) {
+        var length = clean(nodes[i].textContent).length;
+        var parent = nodes[i].parentElement;
+        for (var depth = 0; parent && depth < 3; depth++, parent = parent.parentElement) {
+            scores.set(parent, (scores.get(parent) || 0) + length / (depth + 1));
+        }
+    }
+    var best = null, bestScore = 0;
+    scores.forEach(function (score, el) { if (score > bestScore) { best = el; bestScore = score; } });
+    return best;
+}
+
+var container = first(descriptionSelectors) || largestTextBlock();
+var heading = null;
+var description = '';
+if (container) {
+    var head = container.querySelector('h1, h2, h3');
+    if (head && container.firstElementChild && container.firstElementChild.contains(head)) {
+        heading = clean(head.textContent);
+    }
+    var parts = [];
+    for (var c = container.firstChild; c; c = c.nextSibling) {
+        if (heading && c.nodeType === 1 && c.contains(head)) { continue; }
+        blockText(c, parts);
+    }
+    description = parts.join('').split('\\n').map(clean).filter(Boolean).join('\\n');
+}
+
+var titleEl = first(['.job-details-jobs-unified-top-card__job-title h1', '.jobs-unified-top-card__job-title',
+                     '.t-24.job-details-jobs-unified-top-card__job-title', 'h1.top-card-layout__title', 'main h1', 'h1']);
+var companyEl = first(['.job-details-jobs-unified-top-card__company-name', '.jobs-unified-top-card__company-name',
+                       '.topcard__org-name-link', '.job-details-jobs-unified-top-card__primary-description a']);
+var locationEl = first(['.job-details-jobs-unified-top-card__primary-description-container .tvm__text',
+                        '.jobs-unified-top-card__bullet', '.topcard__flavor--bullet']);
+var metadataEl = first(['.job-details-jobs-unified-top-card__primary-description-container',
+                        '.job-details-jobs-unified-top-card__tertiary-description',
+                        '.jobs-unified-top-card__subtitle-primary-grouping', '.topcard__flavor-row']);
+var time = document.querySelector('main time, .posted-time-ago__text');
+var insights = Array.prototype.map.call(
+    document.querySelectorAll('.job-details-jobs-unified-top-card__job-insight, .jobs-unified-top-card__job-insight, ' +
+                              '.description__job-criteria-item'),
+    function (el) { return clean(el.innerText || el.textContent); }).filter(Boolean);
+
+var button = null, easyApply = false;
+var buttons = document.querySelectorAll('button.jobs-apply-button, .jobs-apply-button--top-card button');
+for (var i = 0; i < buttons.length; i++) {
+    var label = clean(buttons[i].innerText || buttons[i].textContent) + ' ' + (buttons[i].getAttribute('aria-label') || '');
+    button = button || buttons[i];
+    for (var j = 0; j < easyApplyLabels.length; j++) {
+        if (label.indexOf(easyApplyLabels[j]) !== -1) { button = buttons[i]; easyApply = true; break; }
+    }
+    if (easyApply) { break; }
+}
+
+return {
+    title: firstLine(titleEl),
+    company: firstLine(companyEl),
+    location: firstLine(locationEl),
+    description: description,
+    description_heading: heading,
+    posted: time ? (time.getAttribute('datetime') || clean(time.textContent)) : null,
+    metadata: metadataEl ? clean(metadataEl.innerText || metadataEl.textContent) : null,
+    insights: insights,
+    apply_button: button ? {text: clean(button.innerText || button.textContent),
+                            enabled: !button.disabled,
+                            easy_apply: easyApply} : null,
+    easy_apply: easyApply && !button.disabled,
+    page_title: document.title
+};
+"""
+
+EASY_APPLY_LABELS = ["Easy Apply", "Solicitud sencilla"]
+DESCRIPTION_SELECTORS = ["#job-details", ".jobs-description__content", ".jobs-description-content__text",
+                         ".show-more-less-html__markup", ".jobs-description", ".jobs-box__html-content"]
+
+
+def extract_job_details(browser, easy_apply_labels: List[str] = EASY_APPLY_LABELS,
+                        description_selectors: List[str] = DESCRIPTION_SELECTORS) -> Dict:
+    """
+    Extract the details of the job page currently loaded with one script call.
+
+    Args:
+        browser: Selenium WebDriver instance
+        easy_apply_labels: Button texts that mark an Easy Apply button
+        description_selectors: CSS selectors tried for the description before the text heuristic
+
+    Returns:
+        Dict with title, company, location, description, description_heading,
+        posted, metadata, insights, apply_button, easy_apply and page_title;
+        empty if the script failed
+    """
+    try:
+        details = browser.execute_script(_EXTRACT_JS, easy_apply_labels, description_selectors) or {}
+    except Exception as e:
+        log.warning(f"Job detail extraction failed: {e}")
+        return {}
+    log.debug(f"Extracted {len(details.get('description') or '')} description characters for {details.get('title')}")
+    return details
@@ -0,0 +1,175 @@
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional
+
+import requests
+from lxml import html as lxml_html
+from requests.adapters import HTTPAdapter
+
+log = logging.getLogger(__name__)
+
+# Server rendered job view markup, newest class names first
+TITLE_XPATHS: List[str] = [
+    "//h1[contains(@class, 'top-card-layout__title')]",
+    "//h1[contains(@class, 'job-details-jobs-unified-top-card__job-title')]",
+    "//h1",
+]
+COMPANY_XPATHS: List[str] = [
+    "//a[contains(@class, 'topcard__org-name-link')]",
+    "//span[contains(@class, 'topcard__flavor')]",
+    "//div[contains(@class, 'job-details-jobs-unified-top-card__company-name')]",
+]
+DESCRIPTION_XPATHS: List[str] = [
+    "//div[contains(@class, 'show-more-less-html__markup')]",
+    "//div[contains(@class, 'description__text')]",
+    "//div[@id='job-details']",
+]
+EASY_APPLY_MARKERS: List[str] = ["Easy Apply", "Solicitud sencilla"]
+# where LinkedIn redirects requests whose session cookies are no longer valid
+AUTH_WALL_MARKERS: List[str] = ["/login", "authwall", "checkpoint", "/uas/"]
+
+
+class AuthWallError(Exception):
+    """The session cookies were rejected."""
+
+
+def _first_text(tree, xpaths: List[str], multiline: bool = False) -> Optional[str]:
+    for xpath in xpaths:
+        for element in tree.xpath(xpath):
+            if multiline:
+                lines = (" ".join(line.split()) for line in element.itertext())
+                text = "\n".join(line for line in lines if line)
+            else:
+                text = " ".join(element.text_content().split())
+            if text:
+                return text
+    return None
+
+
+class JobPageFetcher:
+    def __init__(self,
+                 base_url: str = "https://www.linkedin.com",
+                 max_workers: int = 4,
+                 timeout: float = 15.0):
+        """
+        Fetch job view pages over HTTP instead of navigating the browser.
+
+        Uses one keep-alive session whose connection pool is sized to the
+        concurrency limit. Pages that cannot be parsed return None so the
+        caller can fall back to Selenium. When LinkedIn rejects the session
+        (401 or a redirect to the auth wall, e.g. after rotating JSESSIONID),
+        the cookies are copied from the browser again and those pages are
+        fetched once more.
+
+        Args:
+            base_url: Site root the job view URLs are built from
+            max_workers: Maximum number of concurrent requests
+            timeout: Per-request timeout in seconds
+        """
+        self.base_url = base_url.rstrip("/")
+        self.max_workers = max(1, max_workers)
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_workers, max_retries=1)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.fetched = 0
+        self.failed = 0
+        self.seconds = 0.0
+        self.cookie_refreshes = 0
+        self.browser = None
+        self._auth_walled = set()
+        self._lock = threading.Lock()
+
+    def load_browser_cookies(self, browser) -> None:
+        """Share the browser's cookies and user agent so requests carry the same session."""
+        self.browser = browser
+        for cookie in browser.get_cookies():
+            self.session.cookies.set(cookie["name"], cookie["value"],
+                                     domain=cookie.get("domain"), path=cookie.get("path", "/"))
+        try:
+            self.session.headers["User-Agent"] = browser.execute_script("return navigator.userAgent;")
+        except Exception as e:
+            log.debug(f"Could not read browser user agent: {e}")
+
+    def fetch(self, job_id) -> Optional[Dict]:
+        """
+        Download and parse one job view page.
+
+        Returns:
+            Job record with jobID, description, job, company, attempted and
+            title, or None if the page could not be fetched or parsed
+        """
+        start = time.perf_counter()
+        try:
+            response = self.session.get(f"{self.base_url}/jobs/view/{job_id}", timeout=self.timeout)
+            if response.status_code == 401 or any(marker in response.url for marker in AUTH_WALL_MARKERS):
+                raise AuthWallError(f"session rejected ({response.status_code} {response.url})")
+            response.raise_for_status()
+            job = self.parse(response.content)
+        except AuthWallError as e:
+            log.debug(f"HTTP fetch of {job_id} failed: {e}")
+            with self._lock:
+                self._auth_walled.add(job_id)
+            job = None
+        except Exception as e:
+            log.debug(f"HTTP fetch of {job_id} failed: {e}")
+            job = None
+        with self._lock:
+            self.seconds += time.perf_counter() - start
+            if job is None:
+                self.failed += 1
+            else:
+                self.fetched += 1
+        if job is not None:
+            job["jobID"] = job_id
+        return job
+
+    def fetch_many(self, job_ids: Iterable) -> Dict:
+        """
+        Fetch several job pages concurrently, bounded by max_workers.
+
+        Pages turned away by the auth wall are fetched again after refreshing
+        the cookies from the browser (on the calling thread, which owns it).
+        """
+        job_ids = list(job_ids)
+        if not job_ids:
+            return {}
+        self._auth_walled.clear()
+        results = self._fetch_all(job_ids)
+        stale = [job_id for job_id in job_ids if job_id in self._auth_walled]
+        if stale and self.browser is not None:
+            log.info(f"Session rejected for {len(stale)} job pages, refreshing cookies from the browser")
+            self.load_browser_cookies(self.browser)
+            self.cookie_refreshes += 1
+            results.update(self._fetch_all(stale))
+        return results
+
+    def _fetch_all(self, job_ids: List) -> Dict:
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(job_ids))) as executor:
+            return dict(zip(job_ids, executor.map(self.fetch, job_ids)))
+
+    @staticmethod
+    def parse(content: bytes) -> Optional[Dict]:
+        tree = lxml_html.fromstring(content)
+        job_name = _first_text(tree, TITLE_XPATHS)
+        company_name = _first_text(tree, COMPANY_XPATHS)
+        description = _first_text(tree, DESCRIPTION_XPATHS, multiline=True)
+        if not (job_name and company_name and description):
+            return None
+        page_text = tree.text_content()
+        return {"description": description,
+                "job": job_name,
+                "company": company_name,
+                "attempted": any(marker in page_text for marker in EASY_APPLY_MARKERS),
+                # same shape as the browser title write_to_file parses
+                "title": f"{job_name} | {company_name} | LinkedIn"}
+
+    def stats(self) -> Dict:
+        requests_made = self.fetched + self.failed
+        return {"fetched": self.fetched,
+                "failed": self.failed,
+                "cookie_refreshes": self.cookie_refreshes,
+                "avg_seconds": round(self.seconds / requests_made, 3) if requests_made else 0.0}
@@ -0,0 +1,104 @@
+import logging
+import threading
+import time
+from typing import Dict
+
+from bs4 import BeautifulSoup
+
+from bot_metrics import metrics
+
+log = logging.getLogger(__name__)
+
+# "lxml" and "html.parser" build a BeautifulSoup tree, "lxml-html" skips
+# BeautifulSoup and returns the much cheaper lxml.html element tree.
+PARSERS = ("lxml", "html.parser", "lxml-html")
+
+
+class PageStats:
+    def __init__(self):
+        """Counts how many loaded pages were actually transferred and parsed."""
+        self.pages = 0
+        self.fetched = 0
+        self.parsed = 0
+        self.bytes = 0
+        self.fetch_seconds = 0.0
+        self.parse_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def add(self, **amounts) -> None:
+        with self._lock:
+            for name, amount in amounts.items():
+                setattr(self, name, getattr(self, name) + amount)
+
+    def summary(self) -> Dict:
+        return {"pages": self.pages,
+                "fetched": self.fetched,
+                "parsed": self.parsed,
+                "bytes": self.bytes,
+                "fetch_seconds": round(self.fetch_seconds, 3),
+                "parse_seconds": round(self.parse_seconds, 3)}
+
+
+class LazyPage:
+    def __init__(self, browser, parser: str = "lxml", stats: PageStats = None):
+        """
+        Handle to the page currently loaded in the browser.
+
+        The page source is only transferred from the driver when `source` is
+        read, and only parsed when `tree` (or any BeautifulSoup attribute) is
+        used, so pages nobody inspects cost nothing. The source is captured
+        at first access, not at construction.
+
+        Args:
+            browser: Selenium WebDriver instance
+            parser: One of PARSERS
+            stats: Optional counters shared by every page of the bot
+        """
+        if parser not in PARSERS:
+            raise ValueError(f"Unknown parser {parser}, expected one of {PARSERS}")
+        self.browser = browser
+        self.parser = parser
+        self.stats = stats
+        self._source = None
+        self._tree = None
+        if stats:
+            stats.add(pages=1)
+
+    @property
+    def source(self) -> str:
+        if self._source is None:
+            start = time.perf_counter()
+            self._source = self.browser.page_source
+            seconds = time.perf_counter() - start
+            metrics.observe("page_source_fetch", seconds)
+            if self.stats:
+                self.stats.add(fetched=1, bytes=len(self._source.encode("utf-8")), fetch_seconds=seconds)
+        return self._source
+
+    @property
+    def tree(self):
+        """The parsed page: a BeautifulSoup object, or an lxml element for "lxml-html"."""
+        if self._tree is None:
+            source = self.source
+            start = time.perf_counter()
+            if self.parser == "lxml-html":
+                from lxml import html
+                self._tree = html.fromstring(source)
+            else:
+                self._tree = BeautifulSoup(source, self.parser)
+            seconds = time.perf_counter() - start
+            metrics.observe("dom_parse", seconds)
+            if self.stats:
+                self.stats.add(parsed=1, parse_seconds=seconds)
+            log.debug(f"Parsed {len(source)} characters with {self.parser} in {seconds:.3f}s")
+        return self._tree
+
+    @property
+    def loaded(self) -> bool:
+        return self._source is not None
+
+    def __getattr__(self, name):
+        # keeps callers that used the BeautifulSoup object returned by load_page working
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.tree, name)
@@ -0,0 +1,127 @@
+import json
+import logging
+from typing import Dict, List, Optional
+
+log = logging.getLogger(__name__)
+
+# Everything the bot never reads: images, fonts, media and tracking beacons.
+# Scripts and stylesheets are left alone because LinkedIn renders job cards
+# and descriptions client side.
+BLOCKED_URL_PATTERNS: List[str] = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf",
+    "*.mp4", "*.webm", "*.m3u8", "*.mp3",
+    "*media.licdn.com/dms/image*",
+    "*px.ads.linkedin.com*",
+    "*linkedin.com/li/track*",
+    "*linkedin.com/realtime/*",
+    "*doubleclick.net*",
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*facebook.net*",
+]
+
+# Rough transfer sizes used to estimate savings for a resource type until
+# real sizes have been observed on pages loaded without blocking. The bot
+# blocks from its first page on, so its estimates always come from this table.
+DEFAULT_RESOURCE_BYTES: Dict[str, int] = {
+    "Image": 25_000,
+    "Font": 40_000,
+    "Media": 400_000,
+    "Script": 30_000,
+    "Other": 2_000,
+}
+
+
+class LeanMode:
+    def __init__(self, browser, blocked_urls: Optional[List[str]] = None):
+        """
+        Block resources the bot does not need through the DevTools protocol.
+
+        Args:
+            browser: Chrome WebDriver created with options from apply_options()
+            blocked_urls: URL patterns to block, defaults to BLOCKED_URL_PATTERNS
+        """
+        self.browser = browser
+        self.blocked_urls = blocked_urls if blocked_urls is not None else BLOCKED_URL_PATTERNS
+        self.enabled = False
+        self.pages: List[Dict] = []
+        self._observed_sizes: Dict[str, List[int]] = {}
+
+    @staticmethod
+    def apply_options(options) -> None:
+        """Enable the performance log used to count requests and bytes per page."""
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
+    def enable(self) -> None:
+        try:
+            self.browser.execute_cdp_cmd("Network.enable", {})
+            self.browser.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.blocked_urls})
+            self.enabled = True
+            log.info(f"Lean mode enabled, blocking {len(self.blocked_urls)} URL patterns")
+        except Exception as e:
+            log.warning(f"Lean mode could not be enabled: {e}")
+
+    def disable(self) -> None:
+        try:
+            self.browser.execute_cdp_cmd("Network.setBlockedURLs", {"urls": []})
+        except Exception as e:
+            log.debug(f"Could not clear blocked URLs: {e}")
+        self.enabled = False
+
+    def page_report(self, url: Optional[str] = None) -> Dict:
+        """
+        Summarise the network activity since the previous report.
+
+        Reads (and drains) Chrome's performance log, so call it once per page.
+
+        Returns:
+            Requests made, requests blocked, bytes transferred, the estimated
+            bytes saved by blocking and where that estimate comes from
+            ("observed" sizes or the "fixed table")
+        """
+        try:
+            entries = self.browser.get_log("performance")
+        except Exception as e:
+            log.debug(f"Performance log not available: {e}")
+            entries = []
+
+        types: Dict[str, str] = {}
+        report = {"url": url, "requests": 0, "blocked": 0, "bytes": 0, "estimated_bytes_saved": 0,
+                  "estimate": "observed"}
+        blocked_types: List[str] = []
+        for entry in entries:
+            try:
+                message = json.loads(entry["message"])["message"]
+            except (KeyError, ValueError):
+                continue
+            method = message.get("method")
+            params = message.get("params", {})
+            if method == "Network.requestWillBeSent":
+                report["requests"] += 1
+                types[params.get("requestId")] = params.get("type", "Other")
+            elif method == "Network.loadingFinished":
+                size = int(params.get("encodedDataLength", 0))
+                report["bytes"] += size
+                resource_type = types.get(params.get("requestId"), "Other")
+                if not self.enabled:
+                    self._observed_sizes.setdefault(resource_type, []).append(size)
+            elif method == "Network.loadingFailed" and params.get("blockedReason"):
+                report["blocked"] += 1
+                blocked_types.append(params.get("type") or types.get(params.get("requestId"), "Other"))
+
+        report["estimated_bytes_saved"] = sum(self._estimate_size(t) for t in blocked_types)
+        if any(t not in self._observed_sizes for t in blocked_types):
+            report["estimate"] = "fixed table"
+        self.pages.append(report)
+        return report
+
+    def totals(self) -> Dict:
+        return {key: sum(page[key] for page in self.pages)
+                for key in ("requests", "blocked", "bytes", "estimated_bytes_saved")}
+
+    def _estimate_size(self, resource_type: str) -> int:
+        observed = self._observed_sizes.get(resource_type)
+        if observed:
+            return sum(observed) // len(observed)
+        return DEFAULT_RESOURCE_BYTES.get(resource_type, DEFAULT_RESOURCE_BYTES["Other"])
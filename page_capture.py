@@ -0,0 +1,114 @@
+import gzip
+import hashlib
+import json
+import logging
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import parse_qsl, urlencode, urlparse
+
+log = logging.getLogger(__name__)
+
+MANIFEST = "manifest.jsonl"
+
+# Markup that can carry session data: inline scripts and the JSON LinkedIn embeds
+# in <code> blocks (csrf tokens, member urns, tracking ids), plus token-like values.
+_SCRUB_PATTERNS = [
+    (re.compile(r"<script\b[^>]*>.*?</script>", re.S | re.I), ""),
+    (re.compile(r"<code\b[^>]*>.*?</code>", re.S | re.I), ""),
+    (re.compile(r"<noscript\b[^>]*>.*?</noscript>", re.S | re.I), ""),
+    (re.compile(r'(<meta\b[^>]*\bname="[^"]*(?:csrf|token|member|pageKey|clientPageInstanceId)[^"]*"[^>]*\bcontent=")[^"]*"', re.I),
+     r'\1"'),
+    (re.compile(r'(<input\b[^>]*\btype="hidden"[^>]*\bvalue=")[^"]*"', re.I), r'\1"'),
+    (re.compile(r"ajax:\d+"), "ajax:0"),
+    (re.compile(r"urn:li:(member|fsd_profile|fs_miniProfile):[\w-]+"), r"urn:li:\1:redacted"),
+    (re.compile(r"((?:csrfToken|trackingId|trk|refId|JSESSIONID|li_at)=)[^&\"'\s]+"), r"\1redacted"),
+]
+
+
+def normalize_path(url: str) -> str:
+    """Path and query of a URL with the query sorted, used to look pages up again."""
+    parts = urlparse(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return parts.path + ("?" + query if query else "")
+
+
+def load_manifest(corpus_dir: str) -> List[Dict]:
+    """Read the manifest of a corpus, one entry per captured page."""
+    path = Path(corpus_dir) / MANIFEST
+    if not path.is_file():
+        return []
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def read_page(corpus_dir: str, entry: Dict) -> str:
+    with gzip.open(Path(corpus_dir) / entry["file"], "rt", encoding="utf-8") as f:
+        return f.read()
+
+
+class PageCapture:
+    def __init__(self, corpus_dir: str, redact: Optional[Iterable[str]] = None):
+        """
+        Save the pages the bot visits into a replay corpus.
+
+        Every page is scrubbed of scripts, embedded session data and the given
+        personal strings, gzip compressed, stored under a content hash and
+        listed in manifest.jsonl with the path it was served from.
+
+        Args:
+            corpus_dir: Directory of the corpus, created if missing
+            redact: Strings to replace with "[redacted]", e.g. the account email or phone number
+        """
+        self.corpus_dir = Path(corpus_dir)
+        self.corpus_dir.mkdir(parents=True, exist_ok=True)
+        self.redact = sorted({str(s) for s in (redact or []) if s and len(str(s)) > 2}, key=len, reverse=True)
+        self.pages = 0
+        self.bytes_raw = 0
+        self.bytes_stored = 0
+        self._lock = threading.Lock()
+
+    def scrub(self, html: str) -> str:
+        for pattern, replacement in _SCRUB_PATTERNS:
+            html = pattern.sub(replacement, html)
+        for secret in self.redact:
+            html = html.replace(secret, "[redacted]")
+        return html
+
+    def save(self, kind: str, url: str, html: str, job_id: Optional[str] = None) -> Optional[Path]:
+        """
+        Store one page of the given kind ("search" or "job").
+
+        Args:
+            kind: Page type, used as the sub-directory of the corpus
+            url: Address the page was loaded from
+            html: The rendered page source
+            job_id: Job id of a job page
+        """
+        try:
+            page = self.scrub(html)
+            data = page.encode("utf-8")
+            digest = hashlib.sha256(data).hexdigest()[:16]
+            relative = Path(kind) / f"{digest}.html.gz"
+            path = self.corpus_dir / relative
+            if not path.exists():
+                path.parent.mkdir(parents=True, exist_ok=True)
+                with gzip.open(path, "wb", compresslevel=6) as f:
+                    f.write(data)
+            entry = {"kind": kind, "path": normalize_path(url), "file": relative.as_posix(),
+                     "job_id": job_id, "bytes": len(data), "captured": round(time.time())}
+            with self._lock:
+                with open(self.corpus_dir / MANIFEST, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(entry) + "\n")
+                self.pages += 1
+                self.bytes_raw += len(html)
+                self.bytes_stored += path.stat().st_size
+            return path
+        except Exception as e:
+            log.warning(f"Could not capture {url}: {e}")
+            return None
+
+    def stats(self) -> Dict:
+        return {"pages": self.pages, "bytes_raw": self.bytes_raw, "bytes_stored": self.bytes_stored}
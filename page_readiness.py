@@ -0,0 +1,221 @@
+import logging
+import time
+from collections import deque
+from typing import Deque, Dict, Optional, Sequence, Tuple, Union
+
+log = logging.getLogger(__name__)
+
+Locator = Tuple[str, str]
+
+# Installed once per document. Tracks the last DOM mutation and the start time
+# of every fetch/XHR request still in flight so readiness can be polled cheaply.
+_INSTALL_JS = """
+if (!window.__easyApplyReadiness) {
+    var state = {lastMutation: performance.now(), mutations: 0, inflight: {}, nextId: 0};
+    function track() {
+        var id = state.nextId++;
+        state.inflight[id] = performance.now();
+        return function () { delete state.inflight[id]; };
+    }
+    new MutationObserver(function (records) {
+        state.lastMutation = performance.now();
+        state.mutations += records.length;
+    }).observe(document.documentElement, {
+        childList: true, subtree: true, attributes: true, characterData: true
+    });
+    var origFetch = window.fetch;
+    if (origFetch) {
+        window.fetch = function () {
+            return origFetch.apply(this, arguments).finally(track());
+        };
+    }
+    var origSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        this.addEventListener('loadend', track());
+        return origSend.apply(this, arguments);
+    };
+    window.__easyApplyReadiness = state;
+}
+"""
+
+# Counts the matches of the first candidate locator that matches anything. Requests
+# open longer than the quiet window (long-polls, streams) do not count as pending.
+_PROBE_JS = """
+var state = window.__easyApplyReadiness || {lastMutation: 0, mutations: 0, inflight: {}};
+var locators = arguments[0], quietMs = arguments[1];
+function countOf(how, what) {
+    if (how === 'css selector') {
+        return document.querySelectorAll(what).length;
+    } else if (how === 'xpath') {
+        return document.evaluate(what, document, null,
+                                 XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null).snapshotLength;
+    } else if (how === 'class name') {
+        return document.getElementsByClassName(what).length;
+    } else if (how === 'id') {
+        return document.getElementById(what) ? 1 : 0;
+    } else if (how === 'name') {
+        return document.getElementsByName(what).length;
+    } else if (how === 'tag name') {
+        return document.getElementsByTagName(what).length;
+    }
+    return 0;
+}
+var count = null, matched = null;
+for (var i = 0; i < locators.length; i++) {
+    count = countOf(locators[i][0], locators[i][1]);
+    if (count) {
+        matched = locators[i][1];
+        break;
+    }
+}
+var now = performance.now();
+var pending = 0;
+for (var id in state.inflight) {
+    if (now - state.inflight[id] < quietMs) {
+        pending += 1;
+    }
+}
+var lastResponse = 0;
+var resources = performance.getEntriesByType('resource');
+for (var j = 0; j < resources.length; j++) {
+    if (resources[j].responseEnd > lastResponse) {
+        lastResponse = resources[j].responseEnd;
+    }
+}
+return {
+    readyState: document.readyState,
+    now: now,
+    lastMutation: state.lastMutation,
+    mutations: state.mutations,
+    pending: pending,
+    lastResponse: lastResponse,
+    count: count,
+    matched: matched
+};
+"""
+
+
+class PageReadiness:
+    def __init__(self,
+                 browser,
+                 deadline: float = 10.0,
+                 quiet_period: float = 0.5,
+                 poll_interval: float = 0.1):
+        """
+        Wait for a page to be usable based on signals from the page itself.
+
+        A page is considered ready once the document has loaded, the DOM has
+        stopped mutating, no fetch/XHR requests are in flight (requests open
+        longer than the quiet period, such as long-polls, are ignored) and,
+        when a locator is given, its match count has stopped changing. Every
+        wait is bounded by a hard deadline. Only the most recent reports are
+        kept, next to running totals.
+
+        Args:
+            browser: Selenium WebDriver instance
+            deadline: Maximum number of seconds to wait for a page
+            quiet_period: Seconds without DOM/network activity that count as settled
+            poll_interval: Seconds between probes of the page
+        """
+        self.browser = browser
+        self.deadline = deadline
+        self.quiet_period = quiet_period
+        self.poll_interval = poll_interval
+        self.history: Deque[Dict] = deque(maxlen=100)
+        self.waits = 0
+        self.timeouts = 0
+        self.total_elapsed = 0.0
+
+    def wait(self,
+             locator: Optional[Union[Locator, Sequence[Locator]]] = None,
+             deadline: Optional[float] = None,
+             min_count: int = 1) -> Dict:
+        """
+        Block until the current page is ready or the deadline passes.
+
+        Args:
+            locator: Optional (By, value) pair whose match count must settle, or a list of
+                candidates of which the first one matching anything is counted
+            deadline: Overrides the default deadline for this wait
+            min_count: Minimum number of locator matches before it can settle
+
+        Returns:
+            Report with the total elapsed time, when each signal was first
+            satisfied (seconds since the wait started) and whether it timed out
+        """
+        deadline = self.deadline if deadline is None else deadline
+        quiet_ms = self.quiet_period * 1000
+        if locator and isinstance(locator[0], str):
+            locator = [locator]
+        candidates = [list(candidate) for candidate in locator or []]
+
+        start = time.monotonic()
+        report = {
+            "locator": candidates[0][1] if candidates else None,
+            "dom_quiet": None,
+            "network_idle": None,
+            "locator_settled": None if locator else 0.0,
+            "count": None,
+            "timed_out": False,
+        }
+        last_count = None
+        count_changed_at = start
+
+        try:
+            self.browser.execute_script(_INSTALL_JS)
+        except Exception as e:
+            log.debug(f"Could not install readiness observer: {e}")
+
+        while True:
+            now = time.monotonic()
+            elapsed = now - start
+            try:
+                probe = self.browser.execute_script(_PROBE_JS, candidates, quiet_ms)
+            except Exception as e:
+                log.debug(f"Readiness probe failed: {e}")
+                probe = None
+
+            if probe:
+                loaded = probe["readyState"] == "complete"
+                dom_quiet = loaded and probe["now"] - probe["lastMutation"] >= quiet_ms
+                network_idle = (loaded and probe["pending"] <= 0
+                                and probe["now"] - probe["lastResponse"] >= quiet_ms)
+                if dom_quiet and report["dom_quiet"] is None:
+                    report["dom_quiet"] = round(elapsed, 3)
+                if network_idle and report["network_idle"] is None:
+                    report["network_idle"] = round(elapsed, 3)
+
+                settled = True
+                if locator:
+                    count = probe["count"] or 0
+                    if count != last_count:
+                        last_count = count
+                        count_changed_at = now
+                    report["count"] = count
+                    report["locator"] = probe.get("matched") or report["locator"]
+                    settled = count >= min_count and now - count_changed_at >= self.quiet_period
+                    if settled and report["locator_settled"] is None:
+                        report["locator_settled"] = round(elapsed, 3)
+
+                if dom_quiet and network_idle and settled:
+                    break
+
+            if elapsed >= deadline:
+                report["timed_out"] = True
+                break
+            time.sleep(self.poll_interval)
+
+        report["elapsed"] = round(time.monotonic() - start, 3)
+        self.history.append(report)
+        self.waits += 1
+        self.timeouts += report["timed_out"]
+        self.total_elapsed += report["elapsed"]
+        if report["timed_out"]:
+            log.debug(f"Page not ready after {report['elapsed']}s: {report}")
+        else:
+            log.debug(f"Page ready in {report['elapsed']}s: {report}")
+        return report
+
+    def total_wait_time(self) -> float:
+        """Total seconds spent waiting on pages so far."""
+        return self.total_elapsed
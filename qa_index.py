@@ -0,0 +1,210 @@
+import csv
+import logging
+import math
+import re
+import threading
+import unicodedata
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+log = logging.getLogger(__name__)
+
+# Lines LinkedIn appends to a question label that do not change the question
+_BOILERPLATE = {"required", "requerido", "obligatorio", "yes", "no", "si", "please make a selection",
+                "selecciona una opcion", "select an option"}
+# words, keeping the symbols of technology names (c++, c#, .net, node.js) that tell questions apart
+_WORD = re.compile(r"(?:(?<![\w.])\.)?\w(?:[\w.+#]*[\w+#])?")
+# words of a question that say little about what is asked
+_FILLER = frozenset("""
+a an the of to in on at for with and or do does you your have has are is be how many much what which
+years year experience work working professional currently following level please enter whole number
+between than larger decimal if any
+cuantos cuantas anos ano de la el en con tienes tiene experiencia trabajo y o tu su
+""".split())
+
+# Answer written to qa.csv for questions still waiting for the user
+PLACEHOLDER = "user provided"
+
+
+def normalize_question(question: str) -> str:
+    """
+    Reduce a question label to a lookup key.
+
+    Accents, case and punctuation are dropped (except the symbols inside
+    names such as "C++" or "C#"), repeated lines (LinkedIn renders the label
+    twice) and boilerplate such as "Required" or the Yes/No options are
+    removed, and the remaining lines are joined.
+    """
+    text = str(question)
+    if not text.isascii():
+        text = "".join(c for c in unicodedata.normalize("NFKD", text) if not unicodedata.combining(c))
+    lines = []
+    for line in text.lower().split("\n"):
+        line = " ".join(_WORD.findall(line))
+        if line and line not in _BOILERPLATE and line not in lines:
+            lines.append(line)
+    return " ".join(lines)
+
+
+def _trigrams(text: str) -> Set[str]:
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _similarity(a: Set[str], b: Set[str]) -> float:
+    """Dice coefficient of two trigram sets."""
+    return 2 * len(a & b) / (len(a) + len(b)) if a or b else 0.0
+
+
+class QAIndex:
+    # known questions compared by trigram similarity per fuzzy lookup
+    SHORTLIST = 50
+    # trigram similarity at which two differing words count as spellings of the same word
+    WORD_SIMILARITY = 0.5
+
+    def __init__(self, path: str = "qa.csv", threshold: float = 0.8):
+        """
+        Answers to application questions, looked up by normalized and fuzzy question text.
+
+        Exact lookups go through a dict of normalized questions. For the
+        others, an inverted word index (built on the first fuzzy lookup, so
+        loading stays a single CSV pass) shortlists the known questions sharing
+        the rarest words, and the shortlisted question with the highest
+        trigram similarity above `threshold` answers, as long as the
+        distinguishing words the two questions do not share are only spelling
+        variants ("Python" never answers for "C++", however similar the rest of
+        the question is). New answers are appended to the CSV instead of
+        rewriting it.
+
+        Args:
+            path: CSV file with Question and Answer columns, created if missing
+            threshold: Minimum Dice similarity of the question trigrams for a fuzzy match
+        """
+        self.path = Path(path)
+        self.threshold = threshold
+        self.questions: List[str] = []
+        self.answers: List[str] = []
+        self.exact: Dict[str, int] = {}
+        self._word_index: Optional[Dict[str, List[int]]] = None
+        self._lock = threading.Lock()
+        self.load()
+
+    def load(self) -> None:
+        if not self.path.is_file():
+            with open(self.path, "w", newline="", encoding="utf-8") as f:
+                csv.writer(f).writerow(["Question", "Answer"])
+            return
+        with open(self.path, newline="", encoding="utf-8", errors="replace") as f:
+            reader = csv.reader(f)
+            next(reader, None)
+            for row in reader:
+                if len(row) >= 2:
+                    self._index(row[0], row[1])
+        log.debug(f"Loaded {len(self.questions)} answers from {self.path}")
+
+    def _index(self, question: str, answer: str) -> None:
+        key = normalize_question(question)
+        if not key:
+            return
+        current = self.exact.get(key)
+        # a placeholder never hides an answer the user already gave
+        if current is not None and answer.strip().lower() == PLACEHOLDER:
+            return
+        if current is None:
+            self.exact[key] = len(self.questions)
+            self.questions.append(key)
+            self.answers.append(answer)
+            if self._word_index is not None:
+                self._add_words(self.exact[key])
+        else:
+            self.answers[current] = answer
+
+    def _add_words(self, i: int) -> None:
+        for word in set(self.questions[i].split()):
+            self._word_index.setdefault(word, []).append(i)
+
+    def _build_word_index(self) -> None:
+        self._word_index = {}
+        for i in range(len(self.questions)):
+            self._add_words(i)
+
+    def _shortlist(self, key: str) -> List[int]:
+        """Known questions sharing the most (idf weighted) words with `key`."""
+        total = len(self.questions)
+        postings = sorted((self._word_index[word] for word in set(key.split()) if word in self._word_index), key=len)
+        # words in most questions ("years", "experience") only add candidates, not information
+        rare = [posting for posting in postings if len(posting) <= max(self.SHORTLIST, total // 20)] or postings[:1]
+        scores = Counter()
+        for posting in rare:
+            weight = math.log(1 + total / len(posting))
+            for i in posting:
+                scores[i] += weight
+        return [i for i, _ in scores.most_common(self.SHORTLIST)]
+
+    def _distinguishing(self, words: Set[str]) -> Set[str]:
+        """Words that are neither filler nor in a large share of the known questions."""
+        common = max(5, len(self.questions) // 5)
+        return {word for word in words if word not in _FILLER and len(self._word_index.get(word, ())) < common}
+
+    def _same_subject(self, key: str, known: str) -> bool:
+        """Whether every distinguishing word only one of the questions has is a spelling variant of a word of the other."""
+        words, known_words = set(key.split()), set(known.split())
+        for missing, others in ((words - known_words, known_words - words), (known_words - words, words - known_words)):
+            for word in self._distinguishing(missing):
+                grams = _trigrams(word)
+                if not any(_similarity(grams, _trigrams(other)) >= self.WORD_SIMILARITY for other in others):
+                    return False
+        return True
+
+    def match(self, question: str) -> Tuple[Optional[str], float, Optional[str]]:
+        """
+        Find the answer of the most similar known question.
+
+        Returns:
+            (answer, similarity, matched normalized question), or (None, best similarity, None)
+            when no question is similar enough or the match only has a placeholder answer
+        """
+        key = normalize_question(question)
+        with self._lock:
+            i = self.exact.get(key)
+            score = 1.0
+            if i is None:
+                if self._word_index is None:
+                    self._build_word_index()
+                grams = _trigrams(key)
+                best, score = None, 0.0
+                for candidate in self._shortlist(key):
+                    similarity = _similarity(grams, _trigrams(self.questions[candidate]))
+                    if similarity > score and self._same_subject(key, self.questions[candidate]):
+                        best, score = candidate, similarity
+                if best is None or score < self.threshold:
+                    return None, score, None
+                i = best
+            answer = self.answers[i]
+        if answer.strip().lower() == PLACEHOLDER:
+            return None, score, self.questions[i]
+        return answer, score, self.questions[i]
+
+    def get(self, question: str, default=None) -> Optional[str]:
+        answer, _, _ = self.match(question)
+        return default if answer is None else answer
+
+    def __contains__(self, question: str) -> bool:
+        return self.get(question) is not None
+
+    def __getitem__(self, question: str) -> str:
+        answer = self.get(question)
+        if answer is None:
+            raise KeyError(question)
+        return answer
+
+    def __len__(self) -> int:
+        return len(self.questions)
+
+    def add(self, question: str, answer: str = PLACEHOLDER) -> None:
+        """Record an answer, appending it to the CSV file."""
+        with self._lock:
+            self._index(question, answer)
+            with open(self.path, "a", newline="", encoding="utf-8") as f:
+                csv.writer(f).writerow([question, answer])
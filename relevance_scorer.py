@@ -0,0 +1,146 @@
+import logging
+import math
+import re
+import threading
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from blacklist_matcher import fold
+
+log = logging.getLogger(__name__)
+
+# keeps tokens like c++, c#, node.js and ci/cd together
+_TOKEN = re.compile(r"[a-z0-9][a-z0-9+#./-]*[a-z0-9+#]|[a-z0-9]")
+_STOPWORDS = frozenset("""
+a an and are as at be by for from has have in is it its of on or that the to was were will with we you your our
+this these those their they who what which using used use into over across about can all also more than
+de la el en y los las del un una para con por que se al lo como mas sus su o
+""".split())
+
+
+def tokenize(text: str) -> List[str]:
+    """Words and adjacent word pairs of `text`, case- and accent-insensitive, without stopwords."""
+    words = [w.strip("./-") for w in _TOKEN.findall(fold(text or ""))]
+    words = [w for w in words if w and w not in _STOPWORDS]
+    return words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+
+
+class RelevanceScorer:
+    def __init__(self,
+                 experience_file: str = "resume_data/experience.md",
+                 skills_file: str = "resume_data/skill_list.txt",
+                 title_threshold: float = 0.0,
+                 description_threshold: float = 0.0,
+                 skills_weight: float = 2.0):
+        """
+        TF-IDF similarity between job text and the candidate profile.
+
+        The profile vector is built from the sections of experience.md and the
+        lines of skill_list.txt (weighted up by `skills_weight`), over a
+        vocabulary of their words and word pairs. Job texts are scored in
+        batches: their term counts are scattered into one matrix and scored
+        against the profile with a single matrix-vector product, giving the
+        cosine similarity in [0, 1]. Scores are small in absolute terms (a
+        matching title lands around 0.05-0.2, an unrelated one at 0), so the
+        thresholds are best read off the logged score distribution.
+
+        Args:
+            experience_file: Markdown file with the candidate's experience
+            skills_file: File with one skill per line
+            title_threshold: Minimum score of a card title, 0 lets every title through
+            description_threshold: Minimum score of a job description, 0 lets every description through
+            skills_weight: Weight of the skill list relative to the experience text
+        """
+        experience = Path(experience_file).read_text(encoding="utf-8") if Path(experience_file).is_file() else ""
+        skills = Path(skills_file).read_text(encoding="utf-8") if Path(skills_file).is_file() else ""
+        sections = [s for s in re.split(r"\n(?=#{2,3} )", experience) if s.strip()]
+        skill_lines = [line.lstrip("-* ").strip() for line in skills.splitlines() if line.strip()]
+        documents = [(tokenize(s), 1.0) for s in sections] + [(tokenize(s), skills_weight) for s in skill_lines]
+        documents = [(tokens, weight) for tokens, weight in documents if tokens]
+
+        document_frequency = Counter(term for tokens, _ in documents for term in set(tokens))
+        self.vocabulary: Dict[str, int] = {term: i for i, term in enumerate(sorted(document_frequency))}
+        count = len(documents)
+        self.idf = np.array([math.log((1 + count) / (1 + document_frequency[term])) + 1 for term in self.vocabulary])
+        # a term the profile never uses is as rare as it gets
+        self.unknown_idf = math.log(1 + count) + 1
+
+        profile = np.zeros(len(self.vocabulary))
+        for tokens, weight in documents:
+            for term, tf in Counter(tokens).items():
+                profile[self.vocabulary[term]] += weight * (1 + math.log(tf))
+        profile *= self.idf
+        norm = np.linalg.norm(profile)
+        self.profile = profile / norm if norm else profile
+        self.title_threshold = title_threshold
+        self.description_threshold = description_threshold
+        self.titles_scored = 0
+        self.titles_below = 0
+        self.descriptions_scored = 0
+        self.descriptions_below = 0
+        self._lock = threading.Lock()
+        log.info(f"Relevance profile built from {len(documents)} documents, {len(self.vocabulary)} terms")
+
+    def score(self, texts: Sequence[str]) -> np.ndarray:
+        """
+        Cosine similarity of each text to the profile.
+
+        Args:
+            texts: Job titles or descriptions
+
+        Returns:
+            Array of scores in [0, 1], one per text
+        """
+        rows, cols, values = [], [], []
+        # the part of each job vector outside the vocabulary only adds to its norm
+        unknown_norm_sq = np.zeros(len(texts))
+        for row, text in enumerate(texts):
+            for term, tf in Counter(tokenize(text)).items():
+                weight = 1 + math.log(tf)
+                column = self.vocabulary.get(term)
+                if column is None:
+                    unknown_norm_sq[row] += (weight * self.unknown_idf) ** 2
+                else:
+                    rows.append(row)
+                    cols.append(column)
+                    values.append(weight)
+        matrix = np.zeros((len(texts), len(self.vocabulary)))
+        if rows:
+            np.add.at(matrix, (np.array(rows), np.array(cols)), np.array(values))
+        matrix *= self.idf
+        norms = np.sqrt((matrix ** 2).sum(axis=1) + unknown_norm_sq)
+        return np.divide(matrix @ self.profile, norms, out=np.zeros(len(texts)), where=norms > 0)
+
+    def score_titles(self, titles: Sequence[str]) -> np.ndarray:
+        """Score a page of card titles, counting those below `title_threshold`."""
+        scores = self.score(titles)
+        with self._lock:
+            self.titles_scored += len(scores)
+            self.titles_below += int((scores < self.title_threshold).sum())
+        return scores
+
+    def score_descriptions(self, descriptions: Sequence[str]) -> np.ndarray:
+        """Score job descriptions, counting those below `description_threshold`."""
+        scores = self.score(descriptions)
+        with self._lock:
+            self.descriptions_scored += len(scores)
+            self.descriptions_below += int((scores < self.description_threshold).sum())
+        return scores
+
+    def score_jobs(self, jobs: Iterable[Optional[Dict]]) -> None:
+        """Score a batch of fetched jobs into their "relevance" field, skipping pages that could not be fetched (None)."""
+        jobs = [job for job in jobs if job]
+        if not jobs:
+            return
+        scores = self.score_descriptions([job.get("description") or "" for job in jobs])
+        for job, score in zip(jobs, scores):
+            job["relevance"] = float(score)
+
+    def stats(self) -> Dict:
+        return {"titles_scored": self.titles_scored,
+                "titles_below": self.titles_below,
+                "descriptions_scored": self.descriptions_scored,
+                "descriptions_below": self.descriptions_below}
@@ -10,7 +10,8 @@ class ResumeContentGenerator:
                  experience_file: str = "resume_data/experience.md",
                  personal_info_file: str = "resume_data/personal_info.md",
                  openai_model: str = "gpt-4.1",
-                 weave_project: str = "resume-generator"):
+                 weave_project: Optional[str] = "resume-generator",
+                 openai_base_url: Optional[str] = None):
         """
         Initialize the resume content generator.
         
@@ -18,7 +19,9 @@ class ResumeContentGenerator:
             experience_file: Path to the experience markdown file
             personal_info_file: Path to the personal info markdown file  
             openai_model: OpenAI model to use for content generation
-            weave_project: Weave project name for logging
+            weave_project: Weave project name for logging, None disables Weave
+            openai_base_url: OpenAI-compatible endpoint to use instead of the
+                OPENAI_BASE_URL environment variable or the public API
         """
         self.experience_file = experience_file
         self.personal_info_file = personal_info_file
@@ -26,10 +29,11 @@ class ResumeContentGenerator:
         self.weave_project = weave_project
         
         # Initialize OpenAI client
-        self.client = OpenAI()
+        self.client = OpenAI(base_url=openai_base_url)
         
         # Initialize Weave for logging
-        weave.init(self.weave_project)
+        if self.weave_project:
+            weave.init(self.weave_project)
         
         # Load resume data
         self.experience_data = self._load_file(self.experience_file)
@@ -1,8 +1,10 @@
 from typing import Optional
 from pathlib import Path
 import os
+import uuid
 from datetime import datetime
 
+from bot_metrics import metrics
 from resume_content_generator import ResumeContentGenerator
 from resume_pdf_converter import ResumePDFConverter
 
@@ -13,8 +15,9 @@ class ResumeManager:
                  personal_info_file: str = "resume_data/personal_info.md",
                  output_dir: str = "generated_resumes",
                  openai_model: str = "gpt-4.1",
-                 weave_project: str = "resume-generator",
-                 wkhtmltopdf_path: Optional[str] = None):
+                 weave_project: Optional[str] = "resume-generator",
+                 wkhtmltopdf_path: Optional[str] = None,
+                 openai_base_url: Optional[str] = None):
         """
         Initialize the resume manager.
         
@@ -23,8 +26,9 @@ class ResumeManager:
             personal_info_file: Path to personal info markdown file
             output_dir: Directory to save generated resumes
             openai_model: OpenAI model for content generation
-            weave_project: Weave project name for logging
+            weave_project: Weave project name for logging, None disables Weave
             wkhtmltopdf_path: Path to wkhtmltopdf executable
+            openai_base_url: OpenAI-compatible endpoint, e.g. a local fake server
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -34,7 +38,8 @@ class ResumeManager:
             experience_file=experience_file,
             personal_info_file=personal_info_file,
             openai_model=openai_model,
-            weave_project=weave_project
+            weave_project=weave_project,
+            openai_base_url=openai_base_url
         )
         
         # Initialize PDF converter
@@ -43,7 +48,7 @@ class ResumeManager:
             use_weasyprint_fallback=True
         )
 
-    def create_resume(self, job: str, company: str, description: str) -> str:
+    def create_resume(self, job: str, company: str, description: str, job_id: Optional[str] = None) -> str:
         """
         Create a complete resume tailored to a specific job.
         
@@ -51,6 +56,7 @@ class ResumeManager:
             job: Job title/position
             company: Company name
             description: Job description
+            job_id: LinkedIn job id, keeps the file names of postings with the same title and company apart
             
         Returns:
             Path to the generated PDF resume
@@ -58,31 +64,35 @@ class ResumeManager:
         try:
             # Generate resume content
             print(f"Generating resume content for {job} at {company}...")
-            markdown_content = self.content_generator.generate_resume_content(
-                job_title=job,
-                company=company,
-                job_description=description
-            )
+            with metrics.timer("llm_generation"):
+                markdown_content = self.content_generator.generate_resume_content(
+                    job_title=job,
+                    company=company,
+                    job_description=description
+                )
             
             # Create output filename
             safe_job = self._sanitize_filename(job)
             safe_company = self._sanitize_filename(company)
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            # resumes generated in parallel can finish within the same second
+            unique = self._sanitize_filename(str(job_id)) if job_id else uuid.uuid4().hex[:8]
             
             # Save markdown file
-            markdown_filename = f"{safe_job}_{safe_company}_{timestamp}.md"
+            markdown_filename = f"{safe_job}_{safe_company}_{unique}_{timestamp}.md"
             markdown_path = self.output_dir / markdown_filename
             self.content_generator.save_resume_content(str(markdown_content), str(markdown_path))
             
             # Generate PDF
-            pdf_filename = f"{safe_job}_{safe_company}_{timestamp}.pdf"
+            pdf_filename = f"{safe_job}_{safe_company}_{unique}_{timestamp}.pdf"
             pdf_path = self.output_dir / pdf_filename
             
             print(f"Converting to PDF: {pdf_path}")
-            final_pdf_path = self.pdf_converter.convert_to_pdf(
-                markdown_content=markdown_content,
-                output_pdf_path=str(pdf_path)
-            )
+            with metrics.timer("pdf_render"):
+                final_pdf_path = self.pdf_converter.convert_to_pdf(
+                    markdown_content=markdown_content,
+                    output_pdf_path=str(pdf_path)
+                )
             
             print(f"Resume generated successfully: {final_pdf_path}")
             return final_pdf_path
@@ -108,11 +118,12 @@ class ResumeManager:
         try:
             # Generate resume content
             print(f"Generating resume content for {job} at {company}...")
-            markdown_content = self.content_generator.generate_resume_content(
-                job_title=job,
-                company=company,
-                job_description=description
-            )
+            with metrics.timer("llm_generation"):
+                markdown_content = self.content_generator.generate_resume_content(
+                    job_title=job,
+                    company=company,
+                    job_description=description
+                )
             
             # Create output paths
             pdf_filename = f"{output_filename}.pdf"
@@ -125,10 +136,11 @@ class ResumeManager:
             
             # Generate PDF
             print(f"Converting to PDF: {pdf_path}")
-            final_pdf_path = self.pdf_converter.convert_to_pdf(
-                markdown_content=markdown_content,
-                output_pdf_path=str(pdf_path)
-            )
+            with metrics.timer("pdf_render"):
+                final_pdf_path = self.pdf_converter.convert_to_pdf(
+                    markdown_content=markdown_content,
+                    output_pdf_path=str(pdf_path)
+                )
             
             print(f"Resume generated successfully: {final_pdf_path}")
             return final_pdf_path
@@ -174,13 +174,13 @@ class ResumePDFConverter:
         Returns:
             Path to the generated PDF file
         """
+        # Convert markdown to HTML
+        html_content = self._markdown_to_html(markdown_content)
+        
+        # Process HTML for resume formatting
+        processed_html = self._process_resume_html(html_content)
+        
         try:
-            # Convert markdown to HTML
-            html_content = self._markdown_to_html(markdown_content)
-            
-            # Process HTML for resume formatting
-            processed_html = self._process_resume_html(html_content)
-            
             # Generate PDF using pdfkit
             pdf_path = self._generate_pdf_pdfkit(processed_html, output_pdf_path)
             
@@ -190,7 +190,8 @@ class ResumePDFConverter:
             if self.use_weasyprint_fallback:
                 print(f"pdfkit failed: {e}")
                 print("Trying weasyprint as fallback...")
-                return self._generate_pdf_weasyprint(markdown_content, output_pdf_path)
+                # the fallback renders the same processed HTML instead of converting the markdown again
+                return self._generate_pdf_weasyprint(processed_html, output_pdf_path)
             else:
                 raise e
 
@@ -305,15 +306,11 @@ class ResumePDFConverter:
         print(f"PDF successfully created: {output_pdf_path}")
         return output_pdf_path
 
-    def _generate_pdf_weasyprint(self, markdown_content: str, output_pdf_path: str) -> str:
-        """Generate PDF using weasyprint as fallback."""
+    def _generate_pdf_weasyprint(self, processed_html: str, output_pdf_path: str) -> str:
+        """Generate PDF from processed resume HTML using weasyprint as fallback."""
         try:
             from weasyprint import HTML, CSS
             
-            # Convert markdown to HTML
-            html_content = self._markdown_to_html(markdown_content)
-            processed_html = self._process_resume_html(html_content)
-            
             # CSS for weasyprint
             css_content = """
             @page {
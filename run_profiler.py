@@ -0,0 +1,112 @@
+import cProfile
+import logging
+import pstats
+import sys
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional
+
+log = logging.getLogger(__name__)
+
+
+class StackSampler:
+    def __init__(self, interval: float = 0.005):
+        """
+        Sample the Python stacks of every thread at a fixed interval.
+
+        The samples are kept as folded stacks ("frame;frame;frame count"),
+        the input format of flamegraph.pl, speedscope and inferno.
+
+        Args:
+            interval: Seconds between samples
+        """
+        self.interval = interval
+        self.samples: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})")
+                    frame = frame.f_back
+                stack.append(names.get(thread_id, str(thread_id)))
+                self.samples[";".join(reversed(stack))] += 1
+
+    def write_folded(self, path: Path) -> None:
+        with open(path, 'w', encoding='utf-8') as f:
+            for stack, count in self.samples.most_common():
+                f.write(f"{stack} {count}\n")
+
+
+class RunProfiler:
+    def __init__(self, output_dir: str = "profiles", mode: str = "job"):
+        """
+        Profile a whole run or each job separately.
+
+        Every profiled block is written as a cProfile file, all of them are
+        merged into aggregate.prof, and a stack sampler running for the whole
+        session writes aggregate.folded for flame graphs.
+
+        Args:
+            output_dir: Directory the profile files are written to
+            mode: "run" to profile the whole run as one block, "job" for one profile per job
+        """
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.mode = mode
+        self.sampler = StackSampler()
+        self.aggregate: Optional[pstats.Stats] = None
+        self.profiles = 0
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def profile(self, name: str):
+        """Profile the enclosed block into <output_dir>/<name>.prof."""
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            path = self.output_dir / f"{name}.prof"
+            profiler.dump_stats(str(path))
+            with self._lock:
+                if self.aggregate is None:
+                    self.aggregate = pstats.Stats(str(path))
+                else:
+                    self.aggregate.add(str(path))
+                self.profiles += 1
+
+    def start(self) -> None:
+        self.sampler.start()
+
+    def finish(self) -> None:
+        """Stop sampling and write the aggregated outputs."""
+        self.sampler.stop()
+        folded = self.output_dir / "aggregate.folded"
+        self.sampler.write_folded(folded)
+        if self.aggregate is not None:
+            self.aggregate.dump_stats(str(self.output_dir / "aggregate.prof"))
+            self.aggregate.sort_stats("cumulative").print_stats(25)
+        log.info(f"Wrote {self.profiles} profiles, aggregate.prof and {folded}")
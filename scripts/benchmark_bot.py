@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+End-to-end Bot Benchmark
+Runs EasyApplyBot in headless Chrome against the offline LinkedIn simulator
+and reports throughput, per-stage latencies and peak memory, so changes to
+the bot can be compared run against run without a LinkedIn account.
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bot_metrics import metrics
+from easyapplybot import EasyApplyBot
+from linkedin_simulator import LinkedInSimulator
+
+
+def max_rss_mb(who) -> float:
+    if resource is None:
+        return 0.0
+    rss = resource.getrusage(who).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the bot against the offline LinkedIn simulator")
+    parser.add_argument("--positions", nargs="+", default=["Machine Learning Engineer", "Data Scientist"],
+                        help="Positions to search for")
+    parser.add_argument("--locations", nargs="+", default=["Remote"], help="Locations to search in")
+    parser.add_argument("--latency", type=float, default=0.1, help="Mean simulated response latency in seconds")
+    parser.add_argument("--page-size", type=int, default=25, help="Job cards per search page")
+    parser.add_argument("--pages", type=int, default=2, help="Result pages per search")
+    parser.add_argument("--search-seconds", type=float, default=300, help="Time limit for each search")
+    parser.add_argument("--lean-mode", action="store_true", help="Run the bot with lean mode enabled")
+    parser.add_argument("--http-fetch", action="store_true", help="Fetch job pages over HTTP")
+    parser.add_argument("--output", help="Optional JSON file to write the results to")
+    args = parser.parse_args()
+
+    simulator = LinkedInSimulator(latency=args.latency, page_size=args.page_size, pages=args.pages).start()
+    print(f"Simulator running on {simulator.url}")
+
+    workdir = Path(tempfile.mkdtemp(prefix="easyapply-bench-"))
+    tracemalloc.start()
+    start = time.perf_counter()
+    bot = EasyApplyBot(username="bench@example.com",
+                       password="bench",
+                       phone_number="0000000000",
+                       salary=0,
+                       rate=0,
+                       filename=str(workdir / "output.csv"),
+                       generate_custom_resume=False,
+                       scrape_only_mode=True,
+                       profile_path=str(workdir / "chrome_profile"),
+                       lean_mode=args.lean_mode,
+                       http_fetch=args.http_fetch,
+                       base_url=simulator.url,
+                       headless=True)
+    startup = time.perf_counter() - start
+    bot.MAX_SEARCH_TIME = args.search_seconds
+    try:
+        bot.start_apply(args.positions, args.locations)
+    finally:
+        elapsed = time.perf_counter() - start
+        _, peak_python = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        bot.browser.quit()
+        simulator.stop()
+
+    results = {
+        "searches": len(args.positions) * len(args.locations),
+        "startup_seconds": round(startup, 2),
+        "total_seconds": round(elapsed, 2),
+        "jobs_processed": bot.jobs_processed,
+        "jobs_per_minute": round(bot.jobs_processed / (elapsed / 60), 2) if elapsed > 0 else 0.0,
+        "simulator_requests": simulator.requests,
+        "peak_python_heap_mb": round(peak_python / (1024 * 1024), 1),
+        "max_rss_bot_mb": round(max_rss_mb(resource.RUSAGE_SELF), 1) if resource else None,
+        # the browser and driver have exited by now, so their peak is included
+        "max_rss_browser_mb": round(max_rss_mb(resource.RUSAGE_CHILDREN), 1) if resource else None,
+        "stages": metrics.summary()["stages"],
+        "pagination": bot.pagination_stats,
+    }
+
+    print("\nBenchmark results")
+    print("=" * 60)
+    for key in ("searches", "startup_seconds", "total_seconds", "jobs_processed", "jobs_per_minute",
+                "simulator_requests", "peak_python_heap_mb", "max_rss_bot_mb", "max_rss_browser_mb"):
+        print(f"{key:<22} {results[key]}")
+    print(f"\n{'stage':<24} {'count':>6} {'p50':>8} {'p95':>8} {'total':>9}")
+    for stage, stats in sorted(results["stages"].items()):
+        print(f"{stage:<24} {stats['count']:>6} {stats['p50']:>8} {stats['p95']:>8} {stats['total']:>9}")
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2), encoding="utf-8")
+        print(f"\nResults written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
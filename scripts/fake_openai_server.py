@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Fake OpenAI Server
+OpenAI-compatible chat completions endpoint that answers with canned
+{"profile", "skills"} responses after a configurable latency, and fails a
+configurable share of requests, so the resume pipeline can be load tested
+offline. Point the pipeline at it with OPENAI_BASE_URL=http://host:port/v1.
+"""
+
+import argparse
+import json
+import math
+import random
+import sys
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+CANNED_SKILLS = ["Python", "PyTorch", "TensorFlow", "Computer Vision", "MLOps", "Docker", "Kubernetes",
+                 "AWS", "SQL", "Transformers", "Model Deployment", "Data Pipelines", "Git", "CI/CD"]
+
+
+class LatencyModel:
+    def __init__(self, distribution: str = "lognormal", mean: float = 2.0, spread: float = 0.5, seed: Optional[int] = None):
+        """
+        Response time distribution of the fake server.
+
+        Args:
+            distribution: "constant", "uniform" (mean +/- spread) or "lognormal"
+                (median mean, spread is the sigma of the underlying normal)
+            mean: Typical response time in seconds
+            spread: Width of the distribution
+            seed: Seed for reproducible latencies
+        """
+        self.distribution = distribution
+        self.mean = mean
+        self.spread = spread
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def sample(self) -> float:
+        with self._lock:
+            if self.distribution == "constant":
+                return self.mean
+            if self.distribution == "uniform":
+                return max(0.0, self._rng.uniform(self.mean - self.spread, self.mean + self.spread))
+            if self.distribution == "lognormal":
+                return self._rng.lognormvariate(math.log(self.mean), self.spread) if self.mean > 0 else 0.0
+        raise ValueError(f"Unknown latency distribution: {self.distribution}")
+
+    def error(self, rate: float) -> bool:
+        with self._lock:
+            return self._rng.random() < rate
+
+
+class FakeOpenAIServer:
+    def __init__(self,
+                 host: str = "127.0.0.1",
+                 port: int = 0,
+                 latency: Optional[LatencyModel] = None,
+                 error_rate: float = 0.0,
+                 error_status: int = 500):
+        """
+        Local stand-in for the OpenAI chat completions API.
+
+        Args:
+            host: Interface to bind to
+            port: Port to listen on, 0 picks a free one
+            latency: Response time distribution, 2s lognormal by default
+            error_rate: Share of requests answered with an error
+            error_status: HTTP status of the errors, e.g. 500 or 429
+        """
+        self.latency = latency or LatencyModel()
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.requests = 0
+        self.errors = 0
+        self._lock = threading.Lock()
+        self.server = ThreadingHTTPServer((host, port), self._make_handler())
+        self.server.daemon_threads = True
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def start(self) -> "FakeOpenAIServer":
+        threading.Thread(target=self.server.serve_forever, name="fake-openai", daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    def completion(self, request: dict) -> dict:
+        """Build a chat completion whose content is a canned profile for the job in the prompt."""
+        prompt = request.get("messages", [{}])[-1].get("content", "")
+        title = next((line.split(":", 1)[1].strip() for line in prompt.splitlines()
+                      if line.startswith("Job Title:")), "Engineer")
+        rng = random.Random(prompt)
+        content = json.dumps({
+            "profile": f"{title} with hands-on experience shipping machine learning systems to production, "
+                       f"from data pipelines and model training to deployment and monitoring.",
+            "skills": rng.sample(CANNED_SKILLS, 12),
+        })
+        return {
+            "id": f"chatcmpl-{uuid.uuid4().hex[:24]}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": request.get("model", "gpt-4.1"),
+            "choices": [{"index": 0,
+                         "message": {"role": "assistant", "content": f"```json\n{content}\n```"},
+                         "finish_reason": "stop"}],
+            "usage": {"prompt_tokens": len(prompt) // 4, "completion_tokens": len(content) // 4,
+                      "total_tokens": (len(prompt) + len(content)) // 4},
+        }
+
+    def _make_handler(self):
+        fake = self
+
+        class FakeOpenAIHandler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _send_json(self, status: int, payload: dict) -> None:
+                body = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                if self.path.rstrip("/").endswith("/models"):
+                    self._send_json(200, {"object": "list", "data": [{"id": "gpt-4.1", "object": "model"}]})
+                else:
+                    self._send_json(404, {"error": {"message": "Not found", "type": "invalid_request_error"}})
+
+            def do_POST(self):
+                request = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0) or 0)) or b"{}")
+                if not self.path.rstrip("/").endswith("/chat/completions"):
+                    self._send_json(404, {"error": {"message": "Not found", "type": "invalid_request_error"}})
+                    return
+                time.sleep(fake.latency.sample())
+                failed = fake.latency.error(fake.error_rate)
+                with fake._lock:
+                    fake.requests += 1
+                    fake.errors += failed
+                if failed:
+                    self._send_json(fake.error_status, {"error": {"message": "Simulated failure",
+                                                                  "type": "server_error", "code": None}})
+                else:
+                    self._send_json(200, fake.completion(request))
+
+            def log_message(self, format, *args):
+                pass
+
+        return FakeOpenAIHandler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a fake OpenAI chat completions API")
+    parser.add_argument("--port", type=int, default=8010, help="Port to listen on")
+    parser.add_argument("--distribution", default="lognormal", choices=["constant", "uniform", "lognormal"],
+                        help="Response time distribution")
+    parser.add_argument("--latency", type=float, default=2.0, help="Typical response time in seconds")
+    parser.add_argument("--spread", type=float, default=0.5, help="Width of the latency distribution")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of requests that fail")
+    parser.add_argument("--error-status", type=int, default=500, help="HTTP status of failed requests")
+    args = parser.parse_args()
+
+    server = FakeOpenAIServer(port=args.port,
+                              latency=LatencyModel(args.distribution, args.latency, args.spread),
+                              error_rate=args.error_rate,
+                              error_status=args.error_status)
+    print(f"Fake OpenAI API listening on {server.base_url} (set OPENAI_BASE_URL to use it)")
+    try:
+        server.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -10,6 +10,7 @@ import argparse
 from pathlib import Path
 from typing import Optional
 from resume_manager import ResumeManager
+from run_profiler import RunProfiler
 
 
 def main():
@@ -26,8 +27,25 @@ def main():
     parser.add_argument("--weave-project", help="Weave project name", default="resume-generator")
     parser.add_argument("--debug", action="store_true", help="Generate debug HTML file")
     parser.add_argument("--markdown-only", action="store_true", help="Generate only markdown, skip PDF")
+    parser.add_argument("--profile", action="store_true", help="Profile the generation and write flame graph data")
+    parser.add_argument("--profile-dir", help="Directory for profile output", default="profiles")
     
     args = parser.parse_args()
+
+    if not args.profile:
+        return generate(args)
+
+    profiler = RunProfiler(args.profile_dir, mode="run")
+    profiler.start()
+    try:
+        with profiler.profile("generate_resume"):
+            return generate(args)
+    finally:
+        profiler.finish()
+
+
+def generate(args) -> int:
+    """Generate the resume described by the parsed command line arguments."""
     
     # Handle job description input (text or file path)
     job_description = get_job_description(args.description)
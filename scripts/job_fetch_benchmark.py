@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Job Fetch Benchmark
+Serves saved job view pages from a local HTTP server and measures how fast
+JobPageFetcher downloads and parses them at different concurrency limits.
+"""
+
+import argparse
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from job_fetcher import JobPageFetcher
+
+SYNTHETIC_PAGE = """<!DOCTYPE html>
+<html><head><title>Machine Learning Engineer {job_id} | Example Corp | LinkedIn</title></head>
+<body>
+<h1 class="top-card-layout__title">Machine Learning Engineer {job_id}</h1>
+<a class="topcard__org-name-link" href="#">Example Corp</a>
+<span class="topcard__flavor topcard__flavor--bullet">Remote</span>
+<button class="jobs-apply-button">Easy Apply</button>
+<div class="show-more-less-html__markup">{description}</div>
+</body></html>
+"""
+
+
+def load_pages(pages_dir, count: int) -> dict:
+    """Load saved pages named <job id>.html, or build synthetic ones."""
+    if pages_dir:
+        return {path.stem: path.read_bytes() for path in sorted(Path(pages_dir).glob("*.html"))}
+    description = "<p>We are looking for an engineer with Python and PyTorch experience.</p>" * 60
+    return {str(3_800_000_000 + i): SYNTHETIC_PAGE.format(job_id=i, description=description).encode("utf-8")
+            for i in range(count)}
+
+
+def make_handler(pages: dict, latency: float):
+    class JobPageHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            job_id = self.path.rstrip("/").rsplit("/", 1)[-1]
+            body = pages.get(job_id)
+            time.sleep(latency)
+            if body is None:
+                self.send_response(404)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return JobPageHandler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark HTTP job page fetching against a local server")
+    parser.add_argument("--pages", help="Directory of saved job pages named <job id>.html")
+    parser.add_argument("--count", type=int, default=100, help="Synthetic pages to serve when --pages is not set")
+    parser.add_argument("--latency", type=float, default=0.2, help="Server latency per request in seconds")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 8], help="Concurrency limits to test")
+    args = parser.parse_args()
+
+    pages = load_pages(args.pages, args.count)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(pages, args.latency))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_port}"
+
+    print("=" * 50)
+    print(f"JOB FETCH BENCHMARK ({len(pages)} pages, {args.latency}s latency)")
+    print("=" * 50)
+    try:
+        for concurrency in args.concurrency:
+            fetcher = JobPageFetcher(base_url=base_url, max_workers=concurrency)
+            start = time.perf_counter()
+            results = fetcher.fetch_many(pages.keys())
+            elapsed = time.perf_counter() - start
+            parsed = sum(1 for job in results.values() if job)
+            print(f"concurrency {concurrency:>3}: {elapsed:6.2f}s, {len(pages) / elapsed:7.1f} pages/s, "
+                  f"{parsed}/{len(pages)} parsed")
+    finally:
+        server.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
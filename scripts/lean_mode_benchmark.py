@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Lean Mode Benchmark
+Serves a heavy fixture page (images, fonts, media) from a local HTTP server and
+loads it in headless Chrome with and without lean mode to compare requests
+and bytes transferred.
+"""
+
+import argparse
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from selenium import webdriver
+
+from lean_mode import LeanMode
+
+ASSET_TYPES = {
+    "png": ("image/png", 30_000),
+    "woff2": ("font/woff2", 45_000),
+    "mp4": ("video/mp4", 500_000),
+}
+
+
+def build_page(images: int, fonts: int) -> bytes:
+    font_faces = "".join(
+        f"@font-face {{ font-family: f{i}; src: url('/asset/font{i}.woff2'); }} .f{i} {{ font-family: f{i}; }}"
+        for i in range(fonts))
+    cards = "".join(
+        f'<div data-job-id="{1000 + i}" class="f{i % max(fonts, 1)}">'
+        f'<img src="/asset/logo{i}.png"><strong>Job {i}</strong></div>'
+        for i in range(images))
+    return f"""<!DOCTYPE html>
+<html><head><style>{font_faces}</style></head>
+<body><div class="jobs-search-results-list">{cards}</div>
+<video autoplay muted src="/asset/clip.mp4"></video></body></html>""".encode("utf-8")
+
+
+def make_handler(page: bytes):
+    class FixtureHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.startswith("/asset/"):
+                extension = self.path.rsplit(".", 1)[-1]
+                content_type, size = ASSET_TYPES.get(extension, ("application/octet-stream", 1_000))
+                body = b"\0" * size
+            else:
+                content_type, body = "text/html; charset=utf-8", page
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("Cache-Control", "no-store")
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return FixtureHandler
+
+
+def load(url: str, lean: bool, loads: int) -> dict:
+    options = webdriver.ChromeOptions()
+    options.add_argument("--headless=new")
+    options.add_argument("--no-sandbox")
+    LeanMode.apply_options(options)
+    browser = webdriver.Chrome(options=options)
+    try:
+        mode = LeanMode(browser)
+        if lean:
+            mode.enable()
+        else:
+            browser.execute_cdp_cmd("Network.enable", {})
+        browser.execute_cdp_cmd("Network.setCacheDisabled", {"cacheDisabled": True})
+        start = time.perf_counter()
+        for _ in range(loads):
+            browser.get(url)
+            time.sleep(0.5)
+            mode.page_report(url)
+        totals = mode.totals()
+        totals["seconds"] = round(time.perf_counter() - start, 2)
+        return totals
+    finally:
+        browser.quit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare page weight with and without lean mode")
+    parser.add_argument("--images", type=int, default=40, help="Images on the fixture page")
+    parser.add_argument("--fonts", type=int, default=4, help="Web fonts on the fixture page")
+    parser.add_argument("--loads", type=int, default=5, help="Page loads per mode")
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(build_page(args.images, args.fonts)))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/jobs/search/"
+
+    try:
+        full = load(url, lean=False, loads=args.loads)
+        lean = load(url, lean=True, loads=args.loads)
+    finally:
+        server.shutdown()
+
+    print("=" * 50)
+    print("LEAN MODE BENCHMARK")
+    print("=" * 50)
+    for name, totals in (("full", full), ("lean", lean)):
+        print(f"{name:>5}: {totals['requests'] / args.loads:.1f} requests/page, "
+              f"{totals['bytes'] / args.loads / 1024:.1f} KiB/page, "
+              f"{totals['blocked'] / args.loads:.1f} blocked/page, {totals['seconds']}s")
+    print(f"saved: {lean['blocked'] / args.loads:.1f} requests/page, "
+          f"{(full['bytes'] - lean['bytes']) / args.loads / 1024:.1f} KiB/page")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Offline LinkedIn Simulator
+Serves synthetic login, feed, job search and job view pages that match the
+locators and XPaths used by EasyApplyBot, so the bot can be run and
+benchmarked without touching the real site.
+"""
+
+import argparse
+import hashlib
+import html
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Optional
+from urllib.parse import parse_qs, urlparse
+
+COMPANIES = ["Acme Robotics", "Globex", "Initech", "Umbrella Labs", "Hooli", "Stark Industries",
+             "Wayne Enterprises", "Soylent", "Cyberdyne", "Tyrell Corp"]
+TITLES = ["Software Engineer", "Machine Learning Engineer", "Data Scientist", "Backend Developer",
+          "Computer Vision Engineer", "MLOps Engineer", "AI Research Engineer", "Full Stack Engineer"]
+SKILLS = ["Python", "PyTorch", "TensorFlow", "Kubernetes", "AWS", "Snowflake", "SQL", "Docker",
+          "computer vision", "NLP", "transformers", "Spark", "FastAPI", "MLflow"]
+
+LOGIN_PAGE = """<!DOCTYPE html>
+<html><head><title>LinkedIn Login</title></head>
+<body><div><main>
+<div></div>
+<div><div><form method="post" action="/login">
+<div><input id="username" name="session_key" type="text"></div>
+<div><input id="password" name="session_password" type="password"></div>
+<div></div>
+<div><button type="submit">Sign in</button></div>
+</form></div></div>
+</main></div></body></html>"""
+
+FEED_PAGE = """<!DOCTYPE html>
+<html><head><title>Feed | LinkedIn</title></head><body><main><h1>Feed</h1></main></body></html>"""
+
+
+class LinkedInSimulator:
+    def __init__(self,
+                 host: str = "127.0.0.1",
+                 port: int = 0,
+                 latency: float = 0.1,
+                 jitter: float = 0.05,
+                 page_size: int = 25,
+                 pages: int = 4,
+                 overlap: float = 0.3,
+                 applied_ratio: float = 0.1,
+                 description_paragraphs: int = 12,
+                 seed: int = 7):
+        """
+        Local HTTP stand-in for the parts of LinkedIn the bot visits.
+
+        Args:
+            host: Interface to bind to
+            port: Port to listen on, 0 picks a free one
+            latency: Mean seconds added to every response
+            jitter: Maximum random seconds added on top of the latency
+            page_size: Job cards per search page
+            pages: Number of non-empty pages every search returns
+            overlap: Share of job ids drawn from a pool shared by all searches
+            applied_ratio: Share of cards that carry an "Applied" badge
+            description_paragraphs: Paragraphs in each job description
+            seed: Seed for the generated content
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.page_size = page_size
+        self.pages = pages
+        self.overlap = overlap
+        self.applied_ratio = applied_ratio
+        self.description_paragraphs = description_paragraphs
+        self.seed = seed
+        self.requests = 0
+        self._lock = threading.Lock()
+        self.server = ThreadingHTTPServer((host, port), self._make_handler())
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "LinkedInSimulator":
+        self._thread = threading.Thread(target=self.server.serve_forever, name="linkedin-simulator", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _rng(self, *parts) -> random.Random:
+        digest = hashlib.sha256("|".join(map(str, (self.seed,) + parts)).encode("utf-8")).digest()
+        return random.Random(int.from_bytes(digest[:8], "big"))
+
+    def job_ids(self, keywords: str, location: str, start: int) -> List[int]:
+        """Job ids on one search page; some come from a pool shared by every search."""
+        if start >= self.pages * self.page_size:
+            return []
+        ids = []
+        for index in range(start, start + self.page_size):
+            rng = self._rng("card", keywords, location, index)
+            if rng.random() < self.overlap:
+                ids.append(3_000_000_000 + rng.randrange(self.pages * self.page_size))
+            else:
+                ids.append(3_100_000_000 + int(hashlib.sha256(f"{keywords}|{location}|{index}".encode()).hexdigest()[:8], 16))
+        return ids
+
+    def job(self, job_id: int) -> dict:
+        rng = self._rng("job", job_id)
+        skills = rng.sample(SKILLS, 5)
+        paragraphs = [f"<p>You will work with {', '.join(rng.sample(SKILLS, 3))} to ship production systems. "
+                      f"Experience with {skills[i % len(skills)]} is required.</p>"
+                      for i in range(self.description_paragraphs)]
+        return {"id": job_id,
+                "title": rng.choice(TITLES),
+                "company": rng.choice(COMPANIES),
+                "location": rng.choice(["Remote", "United States", "Madrid, Spain", "Berlin, Germany"]),
+                "applied": rng.random() < self.applied_ratio,
+                "posted": f"{rng.randint(1, 28)} days ago",
+                "description": "".join(paragraphs)}
+
+    def search_page(self, keywords: str, location: str, start: int) -> str:
+        cards = []
+        for job_id in self.job_ids(keywords, location, start):
+            job = self.job(job_id)
+            badge = '<div class="job-card-container__footer-job-state">Applied</div>' if job["applied"] else ""
+            cards.append(
+                f'<li><div data-job-id="{job_id}" class="job-card-container">'
+                f'<a class="job-card-list__title" href="/jobs/view/{job_id}"><strong>{html.escape(job["title"])}</strong></a>'
+                f'<div class="artdeco-entity-lockup__subtitle">{html.escape(job["company"])}</div>'
+                f'<ul><li class="job-card-container__metadata-item">{html.escape(job["location"])}</li></ul>'
+                f'<time datetime="2026-10-01">{job["posted"]}</time>{badge}</div></li>')
+        return f"""<!DOCTYPE html>
+<html><head><title>{html.escape(keywords)} Jobs | LinkedIn</title></head>
+<body><main>
+<div class="jobs-search-results-list" style="height: 600px; overflow-y: auto;">
+<ul>{''.join(cards)}</ul>
+</div>
+</main></body></html>"""
+
+    def job_page(self, job_id: int) -> str:
+        """Job view page laid out to match the absolute XPaths in get_job_description."""
+        job = self.job(job_id)
+        title, company = html.escape(job["title"]), html.escape(job["company"])
+        return f"""<!DOCTYPE html>
+<html><head><title>{title} | {company} | LinkedIn</title></head>
+<body>
+<div></div><div></div><div></div><div></div>
+<div>
+ <div></div><div></div>
+ <div>
+  <div></div>
+  <div><div><div><main>
+   <div></div>
+   <div><div><div>
+    <div><div><div><div>
+     <div><a class="topcard__org-name-link" href="#">{company}</a>
+{html.escape(job["location"])}</div>
+     <div><div><h1 class="top-card-layout__title">{title}</h1></div></div>
+    </div></div></div></div>
+    <div><button class="jobs-apply-button">Easy Apply</button></div>
+    <div></div>
+    <div>
+     <h2>Acerca del empleo</h2>
+     <div class="show-more-less-html__markup">{job["description"]}</div>
+     <footer><button><span>Ver más</span></button></footer>
+    </div>
+   </div></div></div>
+  </main></div></div></div>
+ </div>
+</div>
+</body></html>"""
+
+    def _make_handler(self):
+        simulator = self
+
+        class SimulatorHandler(BaseHTTPRequestHandler):
+            def _delay(self) -> None:
+                with simulator._lock:
+                    simulator.requests += 1
+                time.sleep(simulator.latency + random.uniform(0, simulator.jitter))
+
+            def _send(self, body: str, status: int = 200, headers: Optional[dict] = None) -> None:
+                data = body.encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(data)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def _logged_in(self) -> bool:
+                return "li_at=" in self.headers.get("Cookie", "")
+
+            def do_GET(self):
+                self._delay()
+                url = urlparse(self.path)
+                query = parse_qs(url.query)
+                if url.path.startswith("/login"):
+                    self._send(LOGIN_PAGE)
+                elif url.path.startswith("/feed"):
+                    if self._logged_in():
+                        self._send(FEED_PAGE)
+                    else:
+                        self._send("", 302, {"Location": "/login"})
+                elif url.path.startswith("/jobs/search"):
+                    self._send(simulator.search_page(query.get("keywords", [""])[0],
+                                                     query.get("location", [""])[0],
+                                                     int(query.get("start", ["0"])[0] or 0)))
+                elif url.path.startswith("/jobs/view/"):
+                    job_id = url.path.rstrip("/").rsplit("/", 1)[-1]
+                    if job_id.isdigit():
+                        self._send(simulator.job_page(int(job_id)))
+                    else:
+                        self._send("Not found", 404)
+                else:
+                    self._send("Not found", 404)
+
+            def do_POST(self):
+                self._delay()
+                self.rfile.read(int(self.headers.get("Content-Length", 0) or 0))
+                self._send("", 302, {"Location": "/feed/",
+                                     "Set-Cookie": "li_at=simulated-session; Path=/; Max-Age=86400"})
+
+            def log_message(self, format, *args):
+                pass
+
+        return SimulatorHandler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve an offline LinkedIn stand-in for the bot")
+    parser.add_argument("--port", type=int, default=8000, help="Port to listen on")
+    parser.add_argument("--latency", type=float, default=0.1, help="Mean response latency in seconds")
+    parser.add_argument("--jitter", type=float, default=0.05, help="Extra random latency in seconds")
+    parser.add_argument("--page-size", type=int, default=25, help="Job cards per search page")
+    parser.add_argument("--pages", type=int, default=4, help="Result pages per search")
+    parser.add_argument("--overlap", type=float, default=0.3, help="Share of job ids shared between searches")
+    args = parser.parse_args()
+
+    simulator = LinkedInSimulator(port=args.port, latency=args.latency, jitter=args.jitter,
+                                  page_size=args.page_size, pages=args.pages, overlap=args.overlap)
+    print(f"LinkedIn simulator listening on {simulator.url}")
+    try:
+        simulator.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
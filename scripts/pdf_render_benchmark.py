@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+PDF Render Benchmark
+Renders a corpus of markdown resumes through every stage of
+ResumePDFConverter and each PDF backend, and reports per-stage time, total
+time, output size and memory so the backend can be chosen on real data.
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from resume_pdf_converter import ResumePDFConverter
+
+BACKENDS = {"pdfkit": "_generate_pdf_pdfkit", "weasyprint": "_generate_pdf_weasyprint"}
+SAMPLE_SKILLS = ["Python", "PyTorch", "TensorFlow", "Computer Vision", "NLP", "Docker",
+                 "Kubernetes", "AWS", "SQL", "MLOps", "Transformers", "Git"]
+
+
+def load_corpus(corpus_dir, resume_data: Path) -> dict:
+    """Markdown resumes from `corpus_dir`, or one assembled from resume_data like the generator does."""
+    if corpus_dir:
+        return {path.name: path.read_text(encoding="utf-8") for path in sorted(Path(corpus_dir).glob("*.md"))}
+    personal = (resume_data / "personal_info.md").read_text(encoding="utf-8")
+    experience = (resume_data / "experience.md").read_text(encoding="utf-8")
+    projects_start = experience.find("## Projects")
+    skills = "\n".join(f"- {skill}" for skill in SAMPLE_SKILLS)
+    profile = ("Machine learning engineer with production experience in computer vision and NLP, "
+               "from data collection and model training to deployment and monitoring.")
+    markdown = (f"{personal}\n\n## Profile\n\n{profile}\n\n---\n\n{experience[:projects_start]}\n"
+                f"## Skills\n{skills}\n\n{experience[projects_start:]}")
+    return {"resume_data.md": markdown}
+
+
+def measure(func, *args):
+    """Run func and return its result, wall time and Python heap peak in MB."""
+    tracemalloc.reset_peak()
+    start = time.perf_counter()
+    result = func(*args)
+    seconds = time.perf_counter() - start
+    return result, seconds, tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+
+
+def child_max_rss_mb() -> float:
+    """Largest resident set of any finished child process, i.e. wkhtmltopdf."""
+    if resource is None:
+        return 0.0
+    rss = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark resume PDF rendering per stage and backend")
+    parser.add_argument("--corpus", help="Directory of markdown resumes (default: generated_resumes if it has any)")
+    parser.add_argument("--backends", nargs="+", default=list(BACKENDS), choices=list(BACKENDS),
+                        help="PDF backends to benchmark")
+    parser.add_argument("--repeat", type=int, default=3, help="Renders per resume and backend")
+    parser.add_argument("--wkhtmltopdf", help="Path to the wkhtmltopdf executable")
+    parser.add_argument("--output-dir", help="Directory for the rendered PDFs (default: a temp dir)")
+    args = parser.parse_args()
+
+    root = Path(__file__).resolve().parent.parent
+    corpus_dir = args.corpus
+    if corpus_dir is None and any((root / "generated_resumes").glob("*.md")):
+        corpus_dir = root / "generated_resumes"
+    corpus = load_corpus(corpus_dir, root / "resume_data")
+    if not corpus:
+        print(f"No markdown resumes in {corpus_dir}")
+        return 1
+    output_dir = Path(args.output_dir or tempfile.mkdtemp(prefix="pdf-bench-"))
+    output_dir.mkdir(parents=True, exist_ok=True)
+    converter = ResumePDFConverter(wkhtmltopdf_path=args.wkhtmltopdf, use_weasyprint_fallback=False)
+
+    # stage -> list of (seconds, heap peak MB); backends also keep output sizes
+    stages = {"markdown_to_html": [], "process_resume_html": []}
+    sizes = {backend: [] for backend in args.backends}
+    failures = {}
+    tracemalloc.start()
+    for name, markdown in corpus.items():
+        for i in range(args.repeat):
+            html, seconds, peak = measure(converter._markdown_to_html, markdown)
+            stages["markdown_to_html"].append((seconds, peak))
+            processed, seconds, peak = measure(converter._process_resume_html, html)
+            stages["process_resume_html"].append((seconds, peak))
+            for backend in args.backends:
+                if backend in failures:
+                    continue
+                output = output_dir / f"{Path(name).stem}_{backend}_{i}.pdf"
+                try:
+                    _, seconds, peak = measure(getattr(converter, BACKENDS[backend]), processed, str(output))
+                except Exception as e:
+                    failures[backend] = e
+                    continue
+                stages.setdefault(f"pdf_{backend}", []).append((seconds, peak))
+                sizes[backend].append(output.stat().st_size)
+    tracemalloc.stop()
+
+    print(f"\n{len(corpus)} resumes x {args.repeat} renders, PDFs in {output_dir}\n")
+    print(f"{'stage':<22} {'runs':>5} {'p50 ms':>9} {'max ms':>9} {'heap MB':>8}")
+    for stage, runs in stages.items():
+        seconds = [s for s, _ in runs]
+        print(f"{stage:<22} {len(runs):>5} {statistics.median(seconds) * 1000:>9.1f} "
+              f"{max(seconds) * 1000:>9.1f} {max(p for _, p in runs):>8.1f}")
+
+    print(f"\n{'backend':<12} {'total p50 ms':>13} {'size KB':>8}")
+    html_stages = statistics.median(s for s, _ in stages["markdown_to_html"]) + \
+        statistics.median(s for s, _ in stages["process_resume_html"])
+    for backend in args.backends:
+        if backend in failures:
+            print(f"{backend:<12} unavailable: {failures[backend]}")
+            continue
+        total = html_stages + statistics.median(s for s, _ in stages[f"pdf_{backend}"])
+        print(f"{backend:<12} {total * 1000:>13.1f} {statistics.mean(sizes[backend]) / 1024:>8.1f}")
+    if "pdfkit" in args.backends and "pdfkit" not in failures and resource:
+        print(f"\nwkhtmltopdf peak resident memory: {child_max_rss_mb():.1f} MB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Replay Check
+Runs the page parsing, card harvesting and job description extraction of the
+bot over a captured corpus, times each step and compares the extracted
+fields against a saved baseline so optimisations can be checked for
+behaviour changes.
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+from bs4 import BeautifulSoup
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from page_capture import load_manifest, read_page
+from replay_server import ReplayServer
+
+CARD_FIELDS = ("job_id", "title", "company", "location", "applied")
+DETAIL_FIELDS = ("title", "company", "location", "description", "posted", "easy_apply")
+
+
+def summarize(name: str, seconds: list) -> None:
+    if seconds:
+        print(f"{name:<24} {len(seconds):>6} {statistics.median(seconds) * 1000:>9.1f} "
+              f"{max(seconds) * 1000:>9.1f} {sum(seconds):>9.2f}")
+
+
+def parse_times(corpus: str, entries: list) -> list:
+    """Time the BeautifulSoup parse every page load pays for."""
+    seconds = []
+    for entry in entries:
+        html = read_page(corpus, entry)
+        start = time.perf_counter()
+        BeautifulSoup(html, "lxml")
+        seconds.append(time.perf_counter() - start)
+    return seconds
+
+
+def browser_results(replay: ReplayServer, entries: list, timings: dict) -> dict:
+    """Load every captured page in headless Chrome and run the bot's extractors on it."""
+    from selenium import webdriver
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    from easyapplybot import EasyApplyBot
+    from job_cards import harvest_job_cards
+    from job_details import extract_job_details
+    from selector_engine import SelectorEngine
+
+    options = webdriver.ChromeOptions()
+    options.add_argument("--headless=new")
+    options.add_argument("--window-size=1920,1080")
+    browser = webdriver.Chrome(options=options)
+    # get_job_description only uses the browser, the wait and the selector engine of the bot
+    bot = SimpleNamespace(browser=browser, wait=WebDriverWait(browser, 5),
+                          selectors=SelectorEngine(browser, EasyApplyBot.FALLBACK_LOCATORS))
+    results = {}
+    try:
+        for entry in entries:
+            browser.get(replay.url + entry["path"])
+            start = time.perf_counter()
+            try:
+                if entry["kind"] == "search":
+                    cards = harvest_job_cards(browser)
+                    results[entry["path"]] = [{field: card.get(field) for field in CARD_FIELDS} for card in cards]
+                    timings["card_harvest"].append(time.perf_counter() - start)
+                else:
+                    details = extract_job_details(browser)
+                    timings["job_details_script"].append(time.perf_counter() - start)
+                    start = time.perf_counter()
+                    description, job, company = EasyApplyBot.get_job_description(bot)
+                    timings["description_extraction"].append(time.perf_counter() - start)
+                    results[entry["path"]] = {"job": job, "company": company, "description": description,
+                                              "details": {field: details.get(field) for field in DETAIL_FIELDS}}
+            except Exception as e:
+                results[entry["path"]] = {"error": type(e).__name__}
+    finally:
+        browser.quit()
+    print(f"Selectors: {bot.selectors.stats()}")
+    return results
+
+
+def compare(results: dict, baseline: dict) -> int:
+    changed = [path for path in baseline if path in results and results[path] != baseline[path]]
+    missing = [path for path in baseline if path not in results]
+    for path in changed:
+        print(f"CHANGED  {path}")
+    for path in missing:
+        print(f"MISSING  {path}")
+    print(f"\n{len(baseline) - len(changed) - len(missing)}/{len(baseline)} pages match the baseline")
+    return 1 if changed or missing else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time and check the bot's extractors against a captured corpus")
+    parser.add_argument("corpus", help="Directory written by the bot's capture_dir option")
+    parser.add_argument("--save-baseline", help="Write the extracted fields to this JSON file")
+    parser.add_argument("--baseline", help="Compare the extracted fields with this JSON file")
+    parser.add_argument("--no-browser", action="store_true", help="Only time HTML parsing, without Chrome")
+    args = parser.parse_args()
+
+    # the latest capture of every path, in a stable order
+    entries = sorted({entry["path"]: entry for entry in load_manifest(args.corpus)}.values(), key=lambda e: e["path"])
+    if not entries:
+        print(f"No captured pages in {args.corpus}")
+        return 1
+
+    timings = {"parse": parse_times(args.corpus, entries), "card_harvest": [], "job_details_script": [],
+               "description_extraction": []}
+    results = {}
+    if not args.no_browser:
+        replay = ReplayServer(args.corpus).start()
+        try:
+            results = browser_results(replay, entries, timings)
+        finally:
+            replay.stop()
+
+    print(f"{len(entries)} pages from {args.corpus}\n")
+    print(f"{'step':<24} {'pages':>6} {'p50 ms':>9} {'max ms':>9} {'total s':>9}")
+    for name, seconds in timings.items():
+        summarize(name, seconds)
+    print()
+
+    if args.save_baseline and results:
+        Path(args.save_baseline).write_text(json.dumps(results, indent=2, sort_keys=True), encoding="utf-8")
+        print(f"Baseline written to {args.save_baseline}")
+    if args.baseline and results:
+        return compare(results, json.loads(Path(args.baseline).read_text(encoding="utf-8")))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Replay Server
+Serves a corpus recorded with the bot's capture_dir option on the paths the
+pages were captured from, so the bot and the extraction code can be run
+against real LinkedIn markup offline and deterministically.
+"""
+
+import argparse
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from linkedin_simulator import FEED_PAGE, LOGIN_PAGE
+from page_capture import load_manifest, normalize_path, read_page
+
+
+class ReplayServer:
+    def __init__(self, corpus_dir: str, host: str = "127.0.0.1", port: int = 0, latency: float = 0.0):
+        """
+        Serve a capture corpus over HTTP.
+
+        Pages are looked up by their normalized path and query; job pages are
+        also found by job id alone. When a path was captured more than once,
+        the latest capture is served.
+
+        Args:
+            corpus_dir: Directory written by PageCapture
+            host: Interface to bind to
+            port: Port to listen on, 0 picks a free one
+            latency: Seconds added to every response
+        """
+        self.corpus_dir = corpus_dir
+        self.latency = latency
+        self.entries = load_manifest(corpus_dir)
+        self.by_path: Dict[str, Dict] = {}
+        self.by_job_id: Dict[str, Dict] = {}
+        for entry in sorted(self.entries, key=lambda e: e["captured"]):
+            self.by_path[entry["path"]] = entry
+            if entry.get("job_id"):
+                self.by_job_id[entry["job_id"]] = entry
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self.server = ThreadingHTTPServer((host, port), self._make_handler())
+        self.server.daemon_threads = True
+
+    @property
+    def url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "ReplayServer":
+        threading.Thread(target=self.server.serve_forever, name="replay-server", daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    def lookup(self, path: str) -> Optional[str]:
+        entry = self.by_path.get(normalize_path(path))
+        if entry is None and path.startswith("/jobs/view/"):
+            entry = self.by_job_id.get(path.split("?")[0].rstrip("/").rsplit("/", 1)[-1])
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return read_page(self.corpus_dir, entry) if entry else None
+
+    def _make_handler(self):
+        replay = self
+
+        class ReplayHandler(BaseHTTPRequestHandler):
+            def _send(self, body: str, status: int = 200, headers: Optional[dict] = None) -> None:
+                data = body.encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(data)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                time.sleep(replay.latency)
+                if self.path.startswith("/login"):
+                    self._send(LOGIN_PAGE)
+                elif self.path.startswith("/feed"):
+                    if "li_at=" in self.headers.get("Cookie", ""):
+                        self._send(FEED_PAGE)
+                    else:
+                        self._send("", 302, {"Location": "/login"})
+                else:
+                    page = replay.lookup(self.path)
+                    self._send(page if page is not None else "Not captured", 200 if page is not None else 404)
+
+            def do_POST(self):
+                self.rfile.read(int(self.headers.get("Content-Length", 0) or 0))
+                self._send("", 302, {"Location": "/feed/",
+                                     "Set-Cookie": "li_at=replayed-session; Path=/; Max-Age=86400"})
+
+            def log_message(self, format, *args):
+                pass
+
+        return ReplayHandler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a captured page corpus")
+    parser.add_argument("corpus", help="Directory written by the bot's capture_dir option")
+    parser.add_argument("--port", type=int, default=8000, help="Port to listen on")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every response")
+    args = parser.parse_args()
+
+    replay = ReplayServer(args.corpus, port=args.port, latency=args.latency)
+    print(f"Replaying {len(replay.by_path)} pages from {args.corpus} on {replay.url}")
+    try:
+        replay.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    print(f"Served {replay.hits} captured pages, {replay.misses} requests were not in the corpus")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Resume Load Benchmark
+Drives ResumeManager.create_resume against the fake OpenAI server at several
+concurrency levels and reports resumes per minute and tail latency.
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fake_openai_server import FakeOpenAIServer, LatencyModel
+from resume_manager import ResumeManager
+
+DESCRIPTION = ("We are looking for an engineer to build and deploy computer vision and NLP models. "
+               "Experience with Python, PyTorch, Docker and AWS is required. ") * 20
+
+
+def percentile(values, q: float) -> float:
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+
+def run_level(manager: ResumeManager, concurrency: int, count: int, content_only: bool) -> dict:
+    """
+    Generate `count` resumes with `concurrency` threads and time each of them.
+
+    Every resume is for the same title and company, like one role posted in
+    several locations, so files overwriting each other show up as collisions.
+    """
+    def one(i: int):
+        start = time.perf_counter()
+        try:
+            if content_only:
+                manager.content_generator.generate_resume_content("Software Engineer", "Example Corp", DESCRIPTION)
+                path = None
+            else:
+                path = manager.create_resume("Software Engineer", "Example Corp", DESCRIPTION)
+            return time.perf_counter() - start, None, path
+        except Exception as e:
+            return time.perf_counter() - start, e, None
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(one, range(count)))
+    elapsed = time.perf_counter() - start
+
+    latencies = [seconds for seconds, error, _ in results if error is None]
+    failures = [error for _, error, _ in results if error is not None]
+    paths = [path for _, _, path in results if path]
+    return {"concurrency": concurrency,
+            "resumes": len(latencies),
+            "failed": len(failures),
+            "seconds": elapsed,
+            "per_minute": len(latencies) / (elapsed / 60) if elapsed > 0 else 0.0,
+            "p50": statistics.median(latencies) if latencies else 0.0,
+            "p95": percentile(latencies, 0.95),
+            "p99": percentile(latencies, 0.99),
+            "collisions": len(paths) - len(set(paths)),
+            "first_error": repr(failures[0]) if failures else ""}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the resume pipeline against a fake OpenAI server")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 2, 4, 8], help="Concurrency levels to test")
+    parser.add_argument("--resumes", type=int, default=16, help="Resumes generated per concurrency level")
+    parser.add_argument("--distribution", default="lognormal", choices=["constant", "uniform", "lognormal"],
+                        help="Response time distribution of the fake server")
+    parser.add_argument("--latency", type=float, default=1.0, help="Typical LLM response time in seconds")
+    parser.add_argument("--spread", type=float, default=0.5, help="Width of the latency distribution")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of LLM requests that fail")
+    parser.add_argument("--error-status", type=int, default=500, help="HTTP status of failed requests")
+    parser.add_argument("--content-only", action="store_true", help="Skip the PDF rendering stage")
+    parser.add_argument("--output-dir", help="Directory for the generated resumes (default: a temp dir)")
+    args = parser.parse_args()
+
+    server = FakeOpenAIServer(latency=LatencyModel(args.distribution, args.latency, args.spread, seed=0),
+                              error_rate=args.error_rate, error_status=args.error_status).start()
+    # the client insists on a key even though the fake server ignores it
+    os.environ.setdefault("OPENAI_API_KEY", "sk-fake")
+    output_dir = args.output_dir or tempfile.mkdtemp(prefix="resume-bench-")
+    manager = ResumeManager(output_dir=output_dir, weave_project=None, openai_base_url=server.base_url)
+    print(f"Fake OpenAI API on {server.base_url}, writing resumes to {output_dir}")
+
+    rows = []
+    try:
+        for concurrency in args.concurrency:
+            rows.append(run_level(manager, concurrency, args.resumes, args.content_only))
+    finally:
+        server.stop()
+
+    print(f"\n{'concurrency':>11} {'resumes':>8} {'failed':>7} {'per min':>8} {'p50 s':>7} {'p95 s':>7} {'p99 s':>7} {'collide':>7}")
+    for row in rows:
+        print(f"{row['concurrency']:>11} {row['resumes']:>8} {row['failed']:>7} {row['per_minute']:>8.1f} "
+              f"{row['p50']:>7.2f} {row['p95']:>7.2f} {row['p99']:>7.2f} {row['collisions']:>7}")
+    for row in rows:
+        if row["first_error"]:
+            print(f"concurrency {row['concurrency']}: first error {row['first_error']}")
+    print(f"\nLLM requests served: {server.requests}, simulated errors: {server.errors}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
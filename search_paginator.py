@@ -0,0 +1,65 @@
+import logging
+from typing import Dict, Optional
+
+log = logging.getLogger(__name__)
+
+
+class SearchPaginator:
+    # LinkedIn shows 25 cards per search page and stops serving results after 1000
+    PAGE_SIZE = 25
+    MAX_RESULTS = 1000
+
+    def __init__(self, page_size: int = PAGE_SIZE, max_results: int = MAX_RESULTS):
+        """
+        Track the result offset of one search and decide when it is exhausted.
+
+        A search stops as soon as a page has no job ids that are new to this
+        run, holds fewer cards than a full page, or the result cap is reached.
+
+        Args:
+            page_size: Cards LinkedIn returns per search page
+            max_results: Offset past which LinkedIn returns no more results
+        """
+        self.page_size = page_size
+        self.max_results = max_results
+        self.offset = 0
+        self.pages = 0
+        self.cards = 0
+        self.new_ids = 0
+        self.stop_reason: Optional[str] = None
+
+    def advance(self, cards_on_page: int, new_ids_on_page: int) -> bool:
+        """
+        Record the page just processed and move the offset to the next one.
+
+        Args:
+            cards_on_page: Number of job cards found on the page, counting list items not rendered yet
+            new_ids_on_page: Number of those cards not seen before in this run
+
+        Returns:
+            True if the next page should be loaded
+        """
+        self.pages += 1
+        self.cards += cards_on_page
+        self.new_ids += new_ids_on_page
+
+        if cards_on_page == 0:
+            self.stop_reason = "empty page"
+        elif new_ids_on_page == 0:
+            self.stop_reason = "no unseen job ids"
+        elif cards_on_page < self.page_size:
+            self.stop_reason = "last page"
+        elif self.offset + self.page_size >= self.max_results:
+            self.stop_reason = "result limit"
+        else:
+            self.offset += self.page_size
+            return True
+        log.info(f"Search finished after {self.pages} pages: {self.stop_reason}")
+        return False
+
+    def stats(self) -> Dict:
+        return {"pages": self.pages,
+                "cards": self.cards,
+                "new_ids": self.new_ids,
+                "last_offset": self.offset,
+                "stop_reason": self.stop_reason or "time budget"}
@@ -0,0 +1,106 @@
+import hashlib
+import math
+from collections import OrderedDict
+from typing import Dict
+
+
+class BloomFilter:
+    def __init__(self, expected_items: int = 1_000_000, false_positive_rate: float = 0.001):
+        """
+        Fixed-size Bloom filter over strings.
+
+        Args:
+            expected_items: Number of items the filter is sized for
+            false_positive_rate: Target false positive rate at expected_items
+        """
+        self.size = max(8, int(-expected_items * math.log(false_positive_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / expected_items * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.items = 0
+
+    def _positions(self, item: str):
+        # double hashing: two 64-bit halves of one digest generate all k positions
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.hashes):
+            yield (h1 + i * h2) % self.size
+
+    def add(self, item: str) -> None:
+        for position in self._positions(item):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.items += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+
+class SeenJobs:
+    def __init__(self,
+                 max_exact: int = 100_000,
+                 expected_items: int = 1_000_000,
+                 false_positive_rate: float = 0.001):
+        """
+        Run-wide record of job ids that have already been handled.
+
+        A Bloom filter answers most lookups for new ids without touching the
+        exact set. The exact set keeps the most recently seen ids and is
+        bounded, so memory stays flat on very long runs; once it has evicted
+        ids, a Bloom hit that is not in the exact set is trusted (and counted).
+
+        Args:
+            max_exact: Maximum number of ids kept in the exact LRU set
+            expected_items: Capacity the Bloom filter is sized for
+            false_positive_rate: Bloom filter false positive rate at capacity
+        """
+        self.bloom = BloomFilter(expected_items, false_positive_rate)
+        self.exact: OrderedDict = OrderedDict()
+        self.max_exact = max_exact
+        self.evicted = 0
+        self.hits = 0
+        self.misses = 0
+        self.bloom_only_hits = 0
+        self.false_positives = 0
+
+    def check_and_add(self, job_id) -> bool:
+        """
+        Mark a job id as seen.
+
+        Returns:
+            True if the id had already been seen in this run
+        """
+        job_id = str(job_id)
+        if job_id in self.bloom:
+            if job_id in self.exact:
+                self.exact.move_to_end(job_id)
+                self.hits += 1
+                return True
+            if self.evicted:
+                self.bloom_only_hits += 1
+                self.hits += 1
+                return True
+            self.false_positives += 1
+        self.misses += 1
+        self.bloom.add(job_id)
+        self.exact[job_id] = None
+        if len(self.exact) > self.max_exact:
+            self.exact.popitem(last=False)
+            self.evicted += 1
+        return False
+
+    def __contains__(self, job_id) -> bool:
+        job_id = str(job_id)
+        return job_id in self.bloom and (job_id in self.exact or self.evicted > 0)
+
+    def __len__(self) -> int:
+        return self.bloom.items
+
+    def stats(self) -> Dict:
+        lookups = self.hits + self.misses
+        return {"seen": len(self),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+                "bloom_only_hits": self.bloom_only_hits,
+                "bloom_false_positives": self.false_positives,
+                "exact_size": len(self.exact)}
@@ -0,0 +1,110 @@
+import logging
+import threading
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+log = logging.getLogger(__name__)
+
+Locator = Tuple[str, str]
+
+
+class SelectorEngine:
+    def __init__(self,
+                 browser,
+                 candidates: Dict[str, Sequence[Locator]],
+                 timeout: float = 3.0,
+                 poll_interval: float = 0.1):
+        """
+        Resolve logical page elements through ordered lists of candidate selectors.
+
+        Each lookup polls all candidates of an element until one matches or
+        the (short) timeout runs out, starting with the candidate that won the
+        last lookup of that element on the same page type, so a markup change
+        costs one timeout instead of one per job. Lookups, misses and the
+        winning candidates are counted per element.
+
+        Args:
+            browser: Selenium WebDriver instance
+            candidates: Element name -> (By, value) locators, most specific first
+            timeout: Default seconds to wait for any candidate to match
+            poll_interval: Seconds between polling rounds
+        """
+        self.browser = browser
+        self.candidates = {name: list(locators) for name, locators in candidates.items()}
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self.winners: Dict[Tuple[str, str], int] = {}
+        self.counts: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+
+    def _ordered(self, name: str, page_type: str) -> List[Tuple[int, Locator]]:
+        locators = list(enumerate(self.candidates[name]))
+        winner = self.winners.get((page_type, name))
+        if winner:
+            locators.insert(0, locators.pop(winner))
+        return locators
+
+    def locators(self, name: str, page_type: str = "any") -> List[Locator]:
+        """Candidates of an element in the order the next lookup tries them, last winner first."""
+        return [locator for _, locator in self._ordered(name, page_type)]
+
+    def find_all(self, name: str, page_type: str = "any", timeout: Optional[float] = None,
+                 clickable: bool = False) -> list:
+        """
+        Return the elements matched by the first candidate that matches anything.
+
+        Args:
+            name: Element name in the candidate table
+            page_type: Page the lookup runs on, e.g. "search" or "job"
+            timeout: Seconds to keep polling, 0 checks once; defaults to the engine timeout
+            clickable: Only accept candidates whose first match is displayed and enabled
+        """
+        timeout = self.timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        ordered = self._ordered(name, page_type)
+        while True:
+            for index, (by, value) in ordered:
+                try:
+                    elements = self.browser.find_elements(by, value)
+                    if elements and clickable and not (elements[0].is_displayed() and elements[0].is_enabled()):
+                        continue
+                except Exception:
+                    continue
+                if elements:
+                    self._record(name, page_type, index, ordered[0][0])
+                    return elements
+            if time.monotonic() >= deadline:
+                self._record(name, page_type, None, ordered[0][0])
+                return []
+            time.sleep(self.poll_interval)
+
+    def find(self, name: str, page_type: str = "any", timeout: Optional[float] = None, clickable: bool = False):
+        """First element of find_all, or None."""
+        elements = self.find_all(name, page_type, timeout, clickable)
+        return elements[0] if elements else None
+
+    def is_present(self, name: str, page_type: str = "any") -> bool:
+        return bool(self.find_all(name, page_type, timeout=0))
+
+    def _record(self, name: str, page_type: str, index: Optional[int], first_tried: int) -> None:
+        with self._lock:
+            counts = self.counts.setdefault(name, {"lookups": 0, "misses": 0, "fallbacks": 0, "winners": {}})
+            counts["lookups"] += 1
+            if index is None:
+                counts["misses"] += 1
+                return
+            if index != 0:
+                counts["fallbacks"] += 1
+            if index != first_tried:
+                log.debug(f"{name} on {page_type} pages now resolves through candidate {index}: "
+                          f"{self.candidates[name][index]}")
+            self.winners[(page_type, name)] = index
+            counts["winners"][index] = counts["winners"].get(index, 0) + 1
+
+    def stats(self) -> Dict:
+        """Lookups, misses, miss rate and winning candidate counts per element."""
+        with self._lock:
+            return {name: dict(counts,
+                               winners=dict(counts["winners"]),
+                               miss_rate=round(counts["misses"] / counts["lookups"], 3) if counts["lookups"] else 0.0)
+                    for name, counts in self.counts.items()}
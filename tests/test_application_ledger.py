@@ -0,0 +1,66 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from application_ledger import TIMESTAMP_FORMAT, ApplicationLedger
+
+
+@pytest.fixture
+def ledger(tmp_path):
+    ledger = ApplicationLedger(str(tmp_path / "applications.db"))
+    yield ledger
+    ledger.close()
+
+
+def write_csv(path, text):
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+def test_import_accepts_six_and_seven_column_rows(ledger, tmp_path):
+    source = write_csv(tmp_path / "out.csv",
+                       "2024-01-01 10:00:00,111,Engineer,Acme,True,False\n"
+                       "2024-01-02 10:00:00,222,Scientist,Globex,True,True,resumes/222.pdf\n")
+    assert ledger.import_csv(source) == 2
+    assert ledger.count() == 2
+    assert ledger.resume_path("111") is None
+    assert ledger.resume_path("222") == "resumes/222.pdf"
+
+
+def test_import_skips_malformed_rows(ledger, tmp_path):
+    source = write_csv(tmp_path / "out.csv",
+                       "timestamp,jobID,job,company,attempted,result\n"
+                       "2024-01-01 10:00:00,111,Engineer,Acme\n"
+                       "not a date,222,Engineer,Acme,True,True\n"
+                       "2024-01-01 10:00:00,,Engineer,Acme,True,True\n"
+                       "2024-01-01 10:00:00,333,Engineer,Acme,True,True\n")
+    assert ledger.import_csv(source) == 1
+    assert ledger.has_applied("333")
+
+
+def test_import_keeps_the_latest_attempt(ledger, tmp_path):
+    source = write_csv(tmp_path / "out.csv",
+                       "2024-01-02 10:00:00,111,Engineer,Acme,True,True,new.pdf\n"
+                       "2024-01-01 10:00:00,111,Engineer,Acme,True,False,old.pdf\n")
+    ledger.import_csv(source)
+    assert ledger.count() == 1
+    assert ledger.resume_path("111") == "new.pdf"
+
+
+def test_import_runs_once_per_file(ledger, tmp_path):
+    source = write_csv(tmp_path / "out.csv", "2024-01-01 10:00:00,111,Engineer,Acme,True,False\n")
+    assert ledger.import_csv(source) == 1
+    assert ledger.import_csv(source) == 0
+    assert ledger.import_csv(str(tmp_path / "missing.csv")) == 0
+
+
+def test_has_applied_since(ledger):
+    recent = datetime.now().strftime(TIMESTAMP_FORMAT)
+    old = (datetime.now() - timedelta(days=10)).strftime(TIMESTAMP_FORMAT)
+    ledger.record(recent, "1", "Engineer", "Acme", True, True)
+    ledger.record(old, "2", "Engineer", "Acme", True, True)
+    since = datetime.now() - timedelta(days=2)
+    assert ledger.has_applied("1", since=since)
+    assert not ledger.has_applied("2", since=since)
+    assert ledger.has_applied("2")
+    assert not ledger.has_applied("3")
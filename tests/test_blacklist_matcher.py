@@ -0,0 +1,53 @@
+from blacklist_matcher import BlacklistMatcher, fold
+
+
+def test_fold():
+    assert fold("Compañía ÉLAN") == "compania elan"
+
+
+def test_ignores_case_and_accents():
+    matcher = BlacklistMatcher(companies=["Compañía"], titles=["ingénieur"])
+    assert matcher.match("COMPANIA Global", "Dev") == "company: compania"
+    assert matcher.match("Other", "Ingenieur logiciel") == "title: ingenieur"
+    assert matcher.match("Other", "Dev") is None
+
+
+def test_matches_whole_words():
+    matcher = BlacklistMatcher(companies=["Meta"], titles=["C++"])
+    assert matcher.match("Meta Platforms", None)
+    assert matcher.match("Metadata Inc", None) is None
+    assert matcher.match(None, "Senior C++ Engineer") == "title: c++"
+    assert matcher.match(None, "C++Builder") is None
+
+
+def test_wildcard():
+    matcher = BlacklistMatcher(titles=["Sales * Manager"])
+    assert matcher.match(None, "Sales Account Manager")
+    assert matcher.match(None, "Sales Manager") is None
+    assert matcher.match(None, "Account Manager") is None
+
+
+def test_lone_wildcard_is_ignored():
+    matcher = BlacklistMatcher(companies=["*", " ** "], titles=["*", "Senior"])
+    assert matcher.company_pattern is None
+    assert matcher.match("Acme", "Developer") is None
+    assert matcher.match("Acme", "Senior Developer") == "title: senior"
+
+
+def test_empty_lists():
+    matcher = BlacklistMatcher(companies=[None, ""], titles=None)
+    assert not matcher
+    assert matcher.match("Acme", "Developer") is None
+
+
+def test_stats():
+    matcher = BlacklistMatcher(companies=["Acme"], titles=["Senior"])
+    matcher.match("Acme", "Developer")
+    matcher.match("Other", "Senior Developer")
+    matcher.match("Other", "Developer")
+    stats = matcher.stats()
+    assert stats["checked"] == 3
+    assert stats["companies_blocked"] == 1
+    assert stats["titles_blocked"] == 1
+    assert stats["seconds_saved"] == "unknown"
+    assert matcher.stats(seconds_per_page=2.5)["seconds_saved"] == 5.0
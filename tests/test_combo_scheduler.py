@@ -0,0 +1,47 @@
+import pytest
+
+from combo_scheduler import ComboScheduler
+
+
+@pytest.fixture
+def history_file(tmp_path):
+    return str(tmp_path / "combo_history.json")
+
+
+def test_combos_are_deduplicated_and_seeded(history_file):
+    scheduler = ComboScheduler(["Dev", "Dev", "ML"], ["US", "EU"], history_file=history_file, seed=1)
+    assert len(scheduler.combos) == 4
+    again = ComboScheduler(["Dev", "ML"], ["US", "EU"], history_file=history_file, seed=1)
+    assert scheduler.order() == again.order()
+
+
+def test_order_follows_recorded_yield(history_file):
+    scheduler = ComboScheduler(["Dev", "ML"], ["US"], history_file=history_file, seed=0)
+    scheduler.record(("Dev", "US"), new_jobs=2, seconds=60)
+    scheduler.record(("ML", "US"), new_jobs=20, seconds=60)
+    # the history is persisted and read back by the next run
+    reloaded = ComboScheduler(["Dev", "ML"], ["US"], history_file=history_file, seed=0)
+    assert reloaded.order() == [("ML", "US"), ("Dev", "US")]
+    assert reloaded.expected_yield(("ML", "US")) == 20
+
+
+def test_unknown_combos_rank_at_the_average(history_file):
+    scheduler = ComboScheduler(["Dev", "ML", "QA"], ["US"], history_file=history_file, seed=0)
+    scheduler.record(("Dev", "US"), new_jobs=1, seconds=60)
+    scheduler.record(("ML", "US"), new_jobs=9, seconds=60)
+    assert scheduler.order() == [("ML", "US"), ("QA", "US"), ("Dev", "US")]
+
+
+def test_record_smooths_the_yield(history_file):
+    scheduler = ComboScheduler(["Dev"], ["US"], history_file=history_file, smoothing=0.5)
+    scheduler.record(("Dev", "US"), new_jobs=10, seconds=60)
+    scheduler.record(("Dev", "US"), new_jobs=0, seconds=60)
+    assert scheduler.expected_yield(("Dev", "US")) == 5
+    assert scheduler.history["Dev|US"]["runs"] == 2
+
+
+def test_budgets(history_file):
+    scheduler = ComboScheduler(["Dev"], ["US", "EU"], history_file=history_file, default_budget=600,
+                               budgets=[{"position": "Dev", "location": "US", "minutes": 30}])
+    assert scheduler.budget(("Dev", "US")) == 1800
+    assert scheduler.budget(("Dev", "EU")) == 600
@@ -0,0 +1,76 @@
+import pytest
+
+import description_cache
+from description_cache import DescriptionCache, content_hash
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = DescriptionCache(str(tmp_path / "descriptions.db"), ttl_days=1, max_entries=10)
+    yield cache
+    cache.close()
+
+
+def job(job_id, description="Build things", title="Developer"):
+    return {"jobID": job_id, "description": description, "job": title, "company": "Acme",
+            "location": "Remote", "posted": "1 day ago", "title": f"{title} | Acme", "attempted": True}
+
+
+def test_round_trip(cache):
+    digest = cache.put(job("1"))
+    cached = cache.get("1")
+    assert cached["description"] == "Build things"
+    assert cached["job"] == "Developer"
+    assert cached["attempted"] is True
+    assert cached["content_hash"] == digest
+    assert cache.get("2") is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_content_hash_ignores_whitespace():
+    assert content_hash("Build  things\n") == content_hash("Build things")
+    assert content_hash("Build things") != content_hash("Build other things")
+
+
+def test_entries_expire(cache, monkeypatch):
+    cache.put(job("1"))
+    now = description_cache.time.time()
+    monkeypatch.setattr(description_cache.time, "time", lambda: now + 2 * 86400)
+    assert "1" not in cache
+    assert cache.get("1") is None
+    assert cache.stats()["expired"] == 1
+
+
+def test_least_recently_used_are_evicted(cache, monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(description_cache.time, "time", lambda: clock[0])
+    for i in range(10):
+        clock[0] += 1
+        cache.put(job(str(i)))
+    clock[0] += 1
+    # touched, so the oldest entry after it is evicted instead
+    assert cache.get("0")
+    clock[0] += 1
+    cache.put(job("10"))
+    assert cache.stats()["entries"] < 10
+    assert "0" in cache
+    assert "1" not in cache
+    assert "10" in cache
+
+
+def test_same_content(cache):
+    cache.put(job("1"))
+    cache.put(job("2", description="Build  things"))
+    cache.put(job("3", description="Something else"))
+    digest = content_hash("Build things")
+    assert cache.same_content(digest, exclude_job_id="2") == ["1"]
+    assert sorted(cache.same_content(digest)) == ["1", "2"]
+
+
+def test_same_content_requires_matching_title(cache):
+    cache.put(job("1", title="Développeur"))
+    cache.put(job("2", title="Data Engineer"))
+    digest = content_hash("Build things")
+    assert cache.same_content(digest, exclude_job_id="3", job="DEVELOPPEUR") == ["1"]
+    assert cache.same_content(digest, exclude_job_id="3", job="Manager") == []
@@ -0,0 +1,42 @@
+import csv
+
+import pytest
+
+from qa_index import QAIndex, normalize_question
+
+
+@pytest.fixture
+def answers(tmp_path):
+    path = tmp_path / "qa.csv"
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Question", "Answer"])
+        writer.writerow(["How many years of work experience do you have with C++?", "1"])
+        writer.writerow(["How many years of work experience do you have with C#?", "2"])
+        writer.writerow(["How many years of work experience do you have with C?", "3"])
+        writer.writerow(["How many years of work experience do you have with databases?\nRequired", "4"])
+    return QAIndex(path)
+
+
+def test_technology_symbols_are_kept():
+    keys = {normalize_question(f"Years of experience with {name}?") for name in ("C++", "C#", "C", ".NET", "Node.js")}
+    assert keys == {"years of experience with c++", "years of experience with c#", "years of experience with c",
+                    "years of experience with .net", "years of experience with node.js"}
+
+
+def test_languages_do_not_share_answers(answers):
+    assert answers.get("How many years of work experience do you have with C++?") == "1"
+    assert answers.get("How many years of work experience do you have with C#?") == "2"
+    assert answers.get("How many years of work experience do you have with C?") == "3"
+
+
+def test_fuzzy_match_needs_the_same_subject(answers):
+    answer, _, _ = answers.match("How many years of experience do you have with Python?")
+    assert answer is None
+
+
+def test_fuzzy_match_tolerates_spelling_and_filler(answers):
+    answer, similarity, known = answers.match("How many years of experiance do you have with databases")
+    assert answer == "4"
+    assert 0.8 <= similarity < 1.0
+    assert known == "how many years of work experience do you have with databases"
@@ -0,0 +1,36 @@
+import pytest
+
+from relevance_scorer import RelevanceScorer
+
+
+@pytest.fixture
+def scorer(tmp_path):
+    experience = tmp_path / "experience.md"
+    experience.write_text("## Employment History\n\n### Machine Learning Engineer | Acme\n\n"
+                          "- Trained computer vision models with PyTorch and deployed them on AWS\n", encoding="utf-8")
+    skills = tmp_path / "skill_list.txt"
+    skills.write_text("- Python\n- Natural Language Processing (NLP)\n- Docker\n", encoding="utf-8")
+    return RelevanceScorer(str(experience), str(skills), description_threshold=0.05)
+
+
+def test_matching_text_scores_higher(scorer):
+    scores = scorer.score(["Machine Learning Engineer", "Registered Nurse", ""])
+    assert scores[0] > 0.1
+    assert scores[1] == 0.0
+    assert scores[2] == 0.0
+
+
+def test_score_jobs_skips_failed_prefetches(scorer):
+    prefetched = {"1": {"jobID": "1", "description": "Build NLP and computer vision models in Python with PyTorch"},
+                  "2": None,
+                  "3": {"jobID": "3", "description": "Sell insurance to retail customers"}}
+    scorer.score_jobs(prefetched.values())
+    assert prefetched["1"]["relevance"] > scorer.description_threshold
+    assert prefetched["3"]["relevance"] < scorer.description_threshold
+    assert prefetched["2"] is None
+    assert scorer.stats()["descriptions_scored"] == 2
+
+
+def test_score_jobs_with_only_failed_prefetches(scorer):
+    scorer.score_jobs([None, None])
+    assert scorer.stats()["descriptions_scored"] == 0
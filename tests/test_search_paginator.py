@@ -0,0 +1,30 @@
+from search_paginator import SearchPaginator
+
+
+def test_full_pages_advance_the_offset():
+    paginator = SearchPaginator()
+    assert paginator.advance(25, 25)
+    assert paginator.advance(25, 10)
+    assert paginator.offset == 50
+    assert paginator.stats()["stop_reason"] == "time budget"
+
+
+def test_stop_reasons():
+    cases = [((0, 0), "empty page"),
+             ((25, 0), "no unseen job ids"),
+             ((12, 12), "last page")]
+    for (cards, new_ids), reason in cases:
+        paginator = SearchPaginator()
+        assert not paginator.advance(cards, new_ids)
+        assert paginator.stop_reason == reason
+        assert paginator.offset == 0
+
+
+def test_result_limit():
+    paginator = SearchPaginator(page_size=25, max_results=75)
+    assert paginator.advance(25, 25)
+    assert paginator.advance(25, 25)
+    assert not paginator.advance(25, 25)
+    assert paginator.stop_reason == "result limit"
+    stats = paginator.stats()
+    assert stats == {"pages": 3, "cards": 75, "new_ids": 75, "last_offset": 50, "stop_reason": "result limit"}
@@ -0,0 +1,34 @@
+from seen_jobs import BloomFilter, SeenJobs
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(expected_items=1000, false_positive_rate=0.01)
+    for i in range(1000):
+        bloom.add(str(i))
+    assert all(str(i) in bloom for i in range(1000))
+    false_positives = sum(f"x{i}" in bloom for i in range(10000))
+    assert false_positives < 300
+
+
+def test_check_and_add():
+    seen = SeenJobs()
+    assert not seen.check_and_add("1")
+    assert seen.check_and_add("1")
+    assert seen.check_and_add(1)
+    assert "1" in seen
+    assert "2" not in seen
+    assert len(seen) == 1
+    stats = seen.stats()
+    assert stats["hits"] == 2
+    assert stats["misses"] == 1
+
+
+def test_exact_set_is_bounded():
+    seen = SeenJobs(max_exact=10, expected_items=1000)
+    for i in range(25):
+        seen.check_and_add(str(i))
+    assert len(seen.exact) == 10
+    assert seen.evicted == 15
+    # evicted ids are still answered by the Bloom filter
+    assert seen.check_and_add("0")
+    assert seen.stats()["bloom_only_hits"] == 1
@@ -0,0 +1,73 @@
+import pytest
+
+import time_budget
+from time_budget import BudgetAllocator
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(time_budget.time, "monotonic", clock)
+    return clock
+
+
+A, B, C = ("Dev", "US"), ("ML", "US"), ("QA", "US")
+
+
+def test_shares_follow_expected_yield(clock):
+    allocator = BudgetAllocator(3600, {A: 3.0, B: 1.0})
+    assert allocator.begin(A) == pytest.approx(2700)
+    clock.now += 600
+    allocator.keep_going(5)
+    allocator.end()
+    # the time A left unused goes to B
+    assert allocator.begin(B) == pytest.approx(3000)
+
+
+def test_zero_yield_pages_end_a_search(clock):
+    allocator = BudgetAllocator(3600, {A: 1.0}, zero_yield_pages=2)
+    allocator.begin(A)
+    assert allocator.keep_going(0)
+    assert not allocator.keep_going(0)
+    assert allocator.end()["stop_reason"] == "zero yield"
+
+
+def test_high_yield_search_is_extended(clock):
+    allocator = BudgetAllocator(3600, {A: 1.0, B: 1.0, C: 1.0}, max_extension=2.0, marginal_pages=1)
+    assert allocator.begin(A) == pytest.approx(1200)
+    clock.now += 1100
+    allocator.keep_going(1)
+    # past its share, but the last page yielded far above the run average
+    clock.now += 160
+    assert allocator.keep_going(50)
+    clock.now += 1200
+    assert not allocator.keep_going(50)
+    assert allocator.end()["stop_reason"] == "budget"
+
+
+def test_cap_is_never_exceeded(clock):
+    allocator = BudgetAllocator(3600, {A: 1.0, B: 1.0}, max_extension=2.0, marginal_pages=1)
+    assert allocator.begin(A, cap=600) == 600
+    clock.now += 500
+    allocator.keep_going(1)
+    clock.now += 160
+    # yields far above the run average, but the configured budget is a hard limit
+    assert not allocator.keep_going(50)
+    assert allocator.end()["stop_reason"] == "budget"
+
+
+def test_run_deadline(clock):
+    allocator = BudgetAllocator(600, {A: 1.0})
+    allocator.begin(A)
+    clock.now += 601
+    assert not allocator.keep_going(10)
+    assert allocator.expired()
+    assert allocator.end()["stop_reason"] == "run deadline"
@@ -0,0 +1,148 @@
+import logging
+import time
+from typing import Dict, List, Optional, Tuple
+
+log = logging.getLogger(__name__)
+
+Combo = Tuple[str, str]
+
+
+class BudgetAllocator:
+    def __init__(self,
+                 run_seconds: float,
+                 expected_rates: Dict[Combo, Optional[float]],
+                 zero_yield_pages: int = 2,
+                 max_extension: float = 2.0,
+                 marginal_pages: int = 2):
+        """
+        Share one run deadline between searches according to how well they yield.
+
+        Each search is given a share of the time left in the run, weighted by
+        its expected new jobs per minute. While a search runs, it is cut off
+        once several pages in a row produce no new jobs, and it may run past
+        its share (up to max_extension times) while its recent rate of new
+        jobs beats the run's average. Time a search does not use stays in the
+        pool for the searches after it.
+
+        Args:
+            run_seconds: Length of the whole run
+            expected_rates: Historical new jobs per minute per combo, None if unknown
+            zero_yield_pages: Consecutive pages without new jobs that end a search
+            max_extension: Maximum multiple of its share a high-yield search may use
+            marginal_pages: Number of recent pages the marginal rate is computed over
+        """
+        self.run_seconds = run_seconds
+        self.deadline = time.monotonic() + run_seconds
+        known = [rate for rate in expected_rates.values() if rate is not None]
+        prior = (sum(known) / len(known) if known else 0.0) or 1.0
+        # every combo keeps a small weight so an unlucky history never starves it completely
+        self.weights = {combo: max(rate if rate is not None else prior, prior * 0.1) for combo, rate in expected_rates.items()}
+        self.pending = set(expected_rates)
+        self.zero_yield_pages = zero_yield_pages
+        self.max_extension = max_extension
+        self.marginal_pages = marginal_pages
+        self.allocations: List[Dict] = []
+        self.run_jobs = 0
+        self.run_started = time.monotonic()
+        self._current: Optional[Dict] = None
+
+    def remaining(self) -> float:
+        return max(0.0, self.deadline - time.monotonic())
+
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def begin(self, combo: Combo, cap: Optional[float] = None) -> float:
+        """
+        Start a search and return the seconds allotted to it.
+
+        Args:
+            combo: The (position, location) about to be searched
+            cap: Optional hard limit for this search, e.g. a configured budget; the
+                search is never extended past it
+        """
+        total_weight = sum(self.weights.get(c, 0.0) for c in self.pending) or 1.0
+        share = self.remaining() * self.weights.get(combo, 0.0) / total_weight
+        if cap:
+            share = min(share, cap)
+        self.pending.discard(combo)
+        self._current = {"combo": combo, "allotted": share, "cap": cap, "used": 0.0, "new_jobs": 0, "pages": 0,
+                         "stop_reason": None, "started": time.monotonic(), "page_log": []}
+        log.info(f"{combo[0]}: {combo[1]} gets {share / 60:.1f} of the {self.remaining() / 60:.1f} minutes left")
+        return share
+
+    def keep_going(self, new_jobs_on_page: int) -> bool:
+        """
+        Record a processed page of the current search and decide whether to load another.
+
+        Args:
+            new_jobs_on_page: New jobs the page produced
+        """
+        current = self._current
+        now = time.monotonic()
+        current["pages"] += 1
+        current["new_jobs"] += new_jobs_on_page
+        current["page_log"].append((now, new_jobs_on_page))
+        self.run_jobs += new_jobs_on_page
+        elapsed = now - current["started"]
+
+        recent = current["page_log"][-self.zero_yield_pages:]
+        if self.expired():
+            return self._stop("run deadline")
+        if len(recent) == self.zero_yield_pages and not any(jobs for _, jobs in recent):
+            return self._stop("zero yield")
+        if elapsed < current["allotted"]:
+            return True
+        limit = current["allotted"] * self.max_extension
+        if current["cap"]:
+            limit = min(limit, current["cap"])
+        if elapsed < limit and self.marginal_rate() > self.run_rate():
+            current["stop_reason"] = "extended"
+            return True
+        return self._stop("budget")
+
+    def marginal_rate(self) -> float:
+        """New jobs per minute of the current search over its last few pages."""
+        page_log = self._current["page_log"]
+        window = page_log[-self.marginal_pages:]
+        start = page_log[-self.marginal_pages - 1][0] if len(page_log) > self.marginal_pages else self._current["started"]
+        seconds = window[-1][0] - start
+        return sum(jobs for _, jobs in window) / (seconds / 60) if seconds > 0 else 0.0
+
+    def run_rate(self) -> float:
+        """New jobs per minute over the whole run so far."""
+        seconds = time.monotonic() - self.run_started
+        return self.run_jobs / (seconds / 60) if seconds > 0 else 0.0
+
+    def end(self) -> Dict:
+        """Close the current search and return its allocation record."""
+        current = self._current
+        current["used"] = time.monotonic() - current["started"]
+        if current["stop_reason"] is None:
+            current["stop_reason"] = "search exhausted"
+        elif current["stop_reason"] == "extended":
+            current["stop_reason"] = "search exhausted after extension"
+        record = {"combo": current["combo"],
+                  "allotted_minutes": round(current["allotted"] / 60, 2),
+                  "used_minutes": round(current["used"] / 60, 2),
+                  "pages": current["pages"],
+                  "new_jobs": current["new_jobs"],
+                  "stop_reason": current["stop_reason"]}
+        self.allocations.append(record)
+        self._current = None
+        return record
+
+    def report(self) -> List[Dict]:
+        """Log and return the final allocation of the run."""
+        log.info(f"Time allocation for the {self.run_seconds / 60:.0f} minute run:")
+        for record in self.allocations:
+            log.info(f"  {record['combo'][0]}: {record['combo'][1]} - {record['used_minutes']} of "
+                     f"{record['allotted_minutes']} minutes, {record['pages']} pages, "
+                     f"{record['new_jobs']} new jobs ({record['stop_reason']})")
+        for combo in sorted(self.pending):
+            log.info(f"  {combo[0]}: {combo[1]} - not reached")
+        return self.allocations
+
+    def _stop(self, reason: str) -> bool:
+        self._current["stop_reason"] = reason
+        return False
@@ -0,0 +1,210 @@
+import csv
+import logging
+import multiprocessing as mp
+import os
+import queue
+import time
+from typing import Dict, List, Optional
+
+from combo_scheduler import ComboScheduler
+
+log = logging.getLogger(__name__)
+
+
+def _shard_filename(filename: str, worker_id: int) -> str:
+    root, ext = os.path.splitext(filename)
+    return f"{root}.worker{worker_id}{ext or '.csv'}"
+
+
+def _share(deadline: float, workers: int, combos) -> float:
+    """Seconds of the run left for the combo just taken, split evenly with the combos still queued."""
+    try:
+        left = combos.qsize() + 1
+    except NotImplementedError:  # macOS queues cannot report their size
+        left = 1
+    return max(0.0, deadline - time.time()) * min(1.0, workers / left)
+
+
+def _worker(worker_id: int, bot_kwargs: Dict, combos, results, claims, deadline=None, workers: int = 1,
+            profile_dir: Optional[str] = None) -> None:
+    # imported here so spawned processes build their own browser session
+    from easyapplybot import EasyApplyBot
+    from run_profiler import RunProfiler
+
+    kwargs = dict(bot_kwargs)
+    filename = bot_kwargs.get("filename", "output.csv")
+    kwargs["filename"] = _shard_filename(filename, worker_id)
+    # every worker records into the same SQLite ledger, WAL mode lets them write concurrently
+    kwargs["ledger_path"] = bot_kwargs.get("ledger_path") or os.path.splitext(filename)[0] + ".db"
+    kwargs["description_cache_path"] = (bot_kwargs.get("description_cache_path")
+                                        or os.path.splitext(filename)[0] + "_descriptions.db")
+    # metrics are per process, so every worker exports its own series
+    if bot_kwargs.get("metrics_port"):
+        kwargs["metrics_port"] = bot_kwargs["metrics_port"] + worker_id
+    if bot_kwargs.get("metrics_textfile"):
+        kwargs["metrics_textfile"] = _shard_filename(bot_kwargs["metrics_textfile"], worker_id)
+    # Chrome locks its profile directory, so each worker keeps its own persistent profile
+    kwargs["profile_path"] = f"{bot_kwargs.get('profile_path') or 'chrome_profile'}-worker{worker_id}"
+    try:
+        bot = EasyApplyBot(**kwargs)
+    except Exception as e:
+        log.error(f"Worker {worker_id} failed to start: {e}")
+        results.put({"worker": worker_id, "error": str(e)})
+        return
+    bot.claims = claims
+    bot.worker_id = worker_id
+    if profile_dir:
+        # profilers are per process, every worker writes its job profiles to its own directory
+        bot.profiler = RunProfiler(os.path.join(profile_dir, f"worker{worker_id}"), mode="job")
+        bot.profiler.start()
+    bot.fill_data()
+
+    while True:
+        if deadline and time.time() >= deadline:
+            log.info(f"Worker {worker_id} stopping, the run time is used up")
+            break
+        try:
+            combo = combos.get_nowait()
+        except queue.Empty:
+            break
+        position, location, budget = combo
+        if deadline:
+            share = _share(deadline, workers, combos)
+            if share < 1:  # a zero budget would fall back to MAX_SEARCH_TIME
+                break
+            budget = min(budget, share) if budget else share
+        start = time.time()
+        before = bot.jobs_processed
+        try:
+            bot.run_combo(position, location, time_budget=budget)
+        except Exception as e:
+            log.error(f"Worker {worker_id} failed on {combo}: {e}")
+        results.put({"worker": worker_id,
+                     "combo": (position, location),
+                     "jobs": bot.jobs_processed - before,
+                     "seconds": time.time() - start})
+    bot.stop_pipeline()
+    if bot.profiler:
+        bot.profiler.finish()
+    try:
+        bot.browser.quit()
+    except Exception:
+        pass
+
+
+class WorkerPool:
+    def __init__(self, bot_kwargs: Dict, workers: int = 2, profile_dir: Optional[str] = None):
+        """
+        Run position x location combos across several Chrome processes.
+
+        Every worker owns an EasyApplyBot with its own browser and pulls combos
+        from a shared queue. Job ids are claimed in a shared map so no two
+        workers process the same posting, and each worker writes to its own
+        shard of the output file which is merged into the main ledger at the end.
+
+        With run_minutes in bot_kwargs, the run ends at that deadline: each
+        combo gets an even share of the time left with the combos still queued,
+        and no combo is started after it. The yield-based sharing of a single
+        bot's BudgetAllocator is not used across workers.
+
+        Args:
+            bot_kwargs: Keyword arguments used to build each worker's EasyApplyBot
+            workers: Number of browser processes to run
+            profile_dir: Profile every job of every worker (--profile job) into <profile_dir>/worker<n>
+        """
+        self.bot_kwargs = bot_kwargs
+        self.workers = max(1, int(workers))
+        self.profile_dir = profile_dir
+        self.filename = bot_kwargs.get("filename", "output.csv")
+
+    def run(self, positions: List[str], locations: List[str]) -> Dict:
+        """
+        Process every combo and merge the worker ledgers.
+
+        Returns:
+            Summary with per-combo results, total jobs, elapsed seconds and jobs/minute
+        """
+        scheduler = ComboScheduler(positions, locations,
+                                   history_file=os.path.splitext(self.filename)[0] + "_combos.json",
+                                   budgets=self.bot_kwargs.get("combo_budgets"))
+
+        ctx = mp.get_context("spawn")
+        manager = ctx.Manager()
+        combo_queue = ctx.Queue()
+        for combo in scheduler.order():
+            combo_queue.put((*combo, scheduler.budget(combo)))
+        results = ctx.Queue()
+        claims = manager.dict()
+
+        start = time.time()
+        run_minutes = self.bot_kwargs.get("run_minutes")
+        deadline = start + run_minutes * 60 if run_minutes else None
+        processes = []
+        for worker_id in range(1, self.workers + 1):
+            process = ctx.Process(target=_worker,
+                                  args=(worker_id, self.bot_kwargs, combo_queue, results, claims,
+                                        deadline, self.workers, self.profile_dir),
+                                  name=f"easyapply-worker-{worker_id}")
+            process.start()
+            processes.append(process)
+
+        combo_results = []
+        while any(p.is_alive() for p in processes) or not results.empty():
+            try:
+                result = results.get(timeout=1)
+            except queue.Empty:
+                continue
+            combo_results.append(result)
+            if "combo" in result:
+                scheduler.record(tuple(result["combo"]), result["jobs"], result["seconds"])
+        for process in processes:
+            process.join()
+        manager.shutdown()
+
+        elapsed = time.time() - start
+        merged = self.merge_ledgers()
+        total_jobs = sum(r.get("jobs", 0) for r in combo_results)
+        summary = {
+            "workers": self.workers,
+            "combos": combo_results,
+            "jobs": total_jobs,
+            "merged_rows": merged,
+            "seconds": round(elapsed, 1),
+            "jobs_per_minute": round(total_jobs / (elapsed / 60), 2) if elapsed > 0 else 0.0,
+        }
+        log.info(f"Worker pool finished: {total_jobs} jobs in {summary['seconds']}s "
+                 f"with {self.workers} workers ({summary['jobs_per_minute']} jobs/minute)")
+        return summary
+
+    def merge_ledgers(self) -> int:
+        """
+        Append the worker shards to the main output file and delete the shards.
+
+        A job id appearing in several shards of this run is appended once. Rows
+        from earlier runs are left alone, so a job processed again after
+        APPLIED_LOOKBACK gets a new row, as it does with a single bot.
+
+        Returns:
+            Number of rows appended
+        """
+        seen = set()
+        rows = []
+        for worker_id in range(1, self.workers + 1):
+            shard = _shard_filename(self.filename, worker_id)
+            if not os.path.isfile(shard):
+                continue
+            # errors='replace' so one badly encoded row cannot leave the shards unmerged
+            with open(shard, newline='', encoding='utf-8', errors='replace') as f:
+                rows.extend(row for row in csv.reader(f) if len(row) > 1)
+            os.remove(shard)
+
+        appended = 0
+        with open(self.filename, 'a+', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            for row in sorted(rows, key=lambda r: r[0]):
+                if row[1] in seen:
+                    continue
+                seen.add(row[1])
+                writer.writerow(row)
+                appended += 1
+        return appended